@@ -0,0 +1,70 @@
+""" Argument Treatments for the benchmark. """
+
+import argparse
+
+from modules.benchmark.benchmark_ontcatowl import BENCHMARK_FAMILIES, BENCHMARK_SIZES
+from modules.benchmark.equivalence_checks import EQUIVALENCE_CHECKS
+from modules.tester.logger_config import initialize_logger
+
+
+def treat_benchmark_arguments(software_acronym, software_name, software_version, software_url):
+    """ Treats user's command line input arguments for the benchmark. """
+
+    logger = initialize_logger()
+    logger.debug("Parsing user's command line input arguments...")
+
+    about_message = software_acronym + " - version " + software_version
+
+    # PARSING ARGUMENTS
+    arguments_parser = argparse.ArgumentParser(prog="OntCatOWL Benchmark",
+                                               description=software_acronym + " - " + software_name,
+                                               allow_abbrev=False,
+                                               epilog=software_url)
+
+    arguments_parser.version = about_message
+
+    # OPTIONAL ARGUMENTS
+
+    # General arguments
+    arguments_parser.add_argument("-f", "--families", type=str, nargs="+", action="store",
+                                  choices=list(BENCHMARK_FAMILIES.keys()), default=list(BENCHMARK_FAMILIES.keys()),
+                                  help="Families of synthetic taxonomies to be benchmarked (default: all).")
+
+    arguments_parser.add_argument("-s", "--sizes", type=int, nargs="+", action="store", default=BENCHMARK_SIZES,
+                                  help=f"Numbers of classes of the synthetic taxonomies (default: {BENCHMARK_SIZES}).")
+
+    arguments_parser.add_argument("-o", "--output", type=str, action="store", default=None,
+                                  help="Path of the YAML file in which the results are saved as a baseline.")
+
+    arguments_parser.add_argument("-c", "--compare", type=str, action="store", default=None,
+                                  help="Path of a baseline YAML file to which the results are compared.")
+
+    arguments_parser.add_argument("-n", "--no-memory", action='store_true',
+                                  help="Do not measure the peak memory (which requires a second execution of each "
+                                       "scenario).")
+
+    arguments_parser.add_argument("-k", "--check", type=str, nargs="+", action="store", default=None,
+                                  choices=list(EQUIVALENCE_CHECKS.keys()),
+                                  help="Executes the received equivalence checks of optimized implementations against "
+                                       "their reference implementations instead of the benchmark.")
+
+    # Automatic arguments
+    arguments_parser.add_argument("-v", "--version", action="version", help="Prints the software version and exit.")
+
+    # Execute arguments parser
+    arguments = arguments_parser.parse_args()
+
+    if min(arguments.sizes) < 1:
+        logger.error(f"The number of classes must be at least 1 (received {min(arguments.sizes)}). Program aborted.")
+        exit(1)
+
+    global_configurations = {"families": arguments.families,
+                             "sizes": arguments.sizes,
+                             "output": arguments.output,
+                             "compare": arguments.compare,
+                             "measure_memory": not arguments.no_memory,
+                             "check": arguments.check}
+
+    logger.debug(f"Arguments Parsed. Obtained values are: {global_configurations}")
+
+    return global_configurations
@@ -0,0 +1,255 @@
+""" Benchmark of the OntCatOWL engine over synthetic taxonomies (see synthetic_taxonomy.py).
+
+    Each scenario is a taxonomy with a number of classes generated with the parameters of a family. As the same family
+    is executed for increasing numbers of classes, the growth of the execution times shows how the engine scales.
+"""
+import math
+import time
+import tracemalloc
+
+import yaml
+from prettytable import PrettyTable
+
+from modules.benchmark.synthetic_taxonomy import generate_synthetic_taxonomy
+from modules.ontcatowl.modules.initialization_data_gufo_dictionary import get_gufo_dictionary
+from modules.ontcatowl.modules.rules_types_registry import get_rules_codes
+from modules.ontcatowl.ontcatowl import run_ontcatowl, get_gufo_graph
+from modules.tester.logger_config import initialize_logger
+
+# Parameters of the synthetic taxonomies of each family of scenarios.
+BENCHMARK_FAMILIES = {
+    "balanced": {"depth": 6, "branching_factor": 3, "multiple_inheritance": 0.0, "typed_fraction": 0.2},
+    "deep": {"depth": 100, "branching_factor": 1, "multiple_inheritance": 0.0, "typed_fraction": 0.2},
+    "wide": {"depth": 2, "branching_factor": 100, "multiple_inheritance": 0.0, "typed_fraction": 0.2},
+    "multiple_inheritance": {"depth": 6, "branching_factor": 3, "multiple_inheritance": 0.3, "typed_fraction": 0.2},
+    "typed": {"depth": 6, "branching_factor": 3, "multiple_inheritance": 0.0, "typed_fraction": 0.6}
+}
+
+# Numbers of classes of the scenarios of each family.
+BENCHMARK_SIZES = [100, 200, 400, 800]
+
+BENCHMARK_CONFIGURATIONS = {"is_automatic": True, "is_complete": True}
+
+# Ratio between the current and the baseline's values above which a regression is reported.
+REGRESSION_THRESHOLD = 1.2
+
+
+def get_benchmark_scenarios(families, sizes):
+    """ Returns the list of scenarios (dictionaries) for all received families and sizes, ordered by family and size.
+    """
+
+    scenarios = []
+
+    for family in families:
+        for number_classes in sorted(sizes):
+            scenario = {"name": f"{family}_{number_classes}", "family": family, "number_classes": number_classes}
+            scenario.update(BENCHMARK_FAMILIES[family])
+            scenarios.append(scenario)
+
+    return scenarios
+
+
+def generate_scenario_graph(scenario):
+    """ Returns the synthetic taxonomy graph of the scenario. """
+
+    return generate_synthetic_taxonomy(scenario["number_classes"], scenario["depth"], scenario["branching_factor"],
+                                       scenario["multiple_inheritance"], scenario["typed_fraction"])
+
+
+def execute_benchmark_scenario(scenario, measure_memory=True):
+    """ Executes OntCatOWL for the scenario and returns its result, a dictionary with the scenario's fields and:
+        - status: "ok" or "inconsistent" (if the execution was interrupted).
+        - total_time: execution time of run_ontcatowl in seconds.
+        - rules_time and rules_times: total and per rule execution times, as registered in OntCatOWL's time_register.
+        - counters: fixpoint iteration counters of the rules' execution (see initialize_execution_counters).
+        - peak_memory: peak memory in MB allocated during a second execution, traced with tracemalloc (as tracing slows
+            the execution down, the times are measured in the first one). None if measure_memory is False.
+    """
+
+    logger = initialize_logger()
+    logger.info(f"Executing benchmark scenario {scenario['name']}...")
+
+    result = dict(scenario)
+    working_graph = generate_scenario_graph(scenario)
+
+    start_time = time.perf_counter()
+    try:
+        _, time_register, _, execution_counters = run_ontcatowl(dict(BENCHMARK_CONFIGURATIONS), working_graph)
+        result["status"] = "ok"
+    except:
+        time_register = {}
+        execution_counters = {}
+        result["status"] = "inconsistent"
+    result["total_time"] = time.perf_counter() - start_time
+
+    result["rules_time"] = time_register.get("total_time", 0)
+    result["rules_times"] = {rule_code: time_register.get(rule_code, 0) for rule_code in get_rules_codes()}
+    result["counters"] = execution_counters
+    result["peak_memory"] = None
+
+    if measure_memory:
+        working_graph = generate_scenario_graph(scenario)
+        tracemalloc.start()
+        try:
+            run_ontcatowl(dict(BENCHMARK_CONFIGURATIONS), working_graph)
+        except:
+            pass
+        result["peak_memory"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+
+    return result
+
+
+def calculate_scaling_exponents(results):
+    """ Sets, for each result, the scaling exponent of its total time in relation to the previous result of the same
+        family, i.e., the exponent k for which time grows as number_classes^k. Values clearly above 1 indicate
+        superlinear growth. The exponent is None for the first result of each family.
+    """
+
+    previous_result = None
+
+    for result in results:
+        result["scaling_exponent"] = None
+        if previous_result is not None and previous_result["family"] == result["family"] \
+                and previous_result["total_time"] > 0 and result["total_time"] > 0:
+            result["scaling_exponent"] = math.log(result["total_time"] / previous_result["total_time"]) / \
+                                         math.log(result["number_classes"] / previous_result["number_classes"])
+        previous_result = result
+
+
+def run_benchmark(families, sizes, measure_memory=True):
+    """ Executes all benchmark scenarios of the received families and sizes and returns their results. """
+
+    logger = initialize_logger()
+
+    scenarios = get_benchmark_scenarios(families, sizes)
+
+    # The GUFO data is loaded and a warm-up execution (whose result is discarded) is performed before the scenarios, so
+    # that the time spent in initializations performed only once per process is not included in the first scenario.
+    get_gufo_graph()
+    get_gufo_dictionary()
+    execute_benchmark_scenario(scenarios[0], measure_memory=False)
+
+    logger.info(f"Executing {len(scenarios)} benchmark scenarios.\n")
+
+    results = [execute_benchmark_scenario(scenario, measure_memory) for scenario in scenarios]
+    calculate_scaling_exponents(results)
+
+    return results
+
+
+def format_value(value, digits=3):
+    """ Returns the value rounded to the number of digits or "-" if the value is None. """
+
+    return "-" if value is None else round(value, digits)
+
+
+def generate_results_table(results):
+    """ Generates the table with the total time, peak memory and fixpoint iteration counters of each result. """
+
+    pretty_table = PrettyTable(["Scenario", "Classes", "Status", "Total time (s)", "Rules time (s)", "Scaling exp.",
+                                "Peak memory (MB)", "Loops", "Automatic loops", "Rules executed", "Rules skipped"])
+
+    for result in results:
+        counters = result["counters"]
+        pretty_table.add_row([result["name"], result["number_classes"], result["status"],
+                              format_value(result["total_time"]), format_value(result["rules_time"]),
+                              format_value(result["scaling_exponent"], 2), format_value(result["peak_memory"], 1),
+                              counters.get("loops", "-"), counters.get("automatic_loops", "-"),
+                              counters.get("rules_executions", "-"), counters.get("rules_skipped", "-")])
+
+    return pretty_table.get_string()
+
+
+def generate_rules_times_table(results):
+    """ Generates the table with the execution time of each rule (columns) for each result (rows). """
+
+    rules_codes = get_rules_codes()
+    pretty_table = PrettyTable(["Scenario"] + rules_codes)
+
+    for result in results:
+        pretty_table.add_row([result["name"]] + [format_value(result["rules_times"][rule_code])
+                                                 for rule_code in rules_codes])
+
+    return pretty_table.get_string()
+
+
+def save_benchmark_baseline(results, baseline_file_path):
+    """ Saves the benchmark results in a YAML file, so that they can be used as baseline for later executions. """
+
+    logger = initialize_logger()
+
+    try:
+        with open(baseline_file_path, 'w', encoding='utf-8') as file:
+            yaml.dump(results, file, sort_keys=False)
+    except OSError as error:
+        logger.error(f"Could not save {baseline_file_path} file. Exiting program.\n"
+                     f"System error reported: {error}")
+        exit(1)
+
+    logger.info(f"Benchmark baseline saved: {baseline_file_path}")
+
+
+def load_benchmark_baseline(baseline_file_path):
+    """ Loads benchmark results saved with save_benchmark_baseline. """
+
+    logger = initialize_logger()
+
+    try:
+        with open(baseline_file_path, encoding='utf-8') as file:
+            baseline_results = yaml.safe_load(file)
+    except OSError as error:
+        logger.error(f"Could not load {baseline_file_path} file. Exiting program.\n"
+                     f"System error reported: {error}")
+        exit(1)
+
+    return baseline_results
+
+
+def generate_comparison_table(results, baseline_results):
+    """ Generates the table comparing the total times and peak memories of the results with the ones of the baseline
+        results for the same scenarios. Regressions (ratios above REGRESSION_THRESHOLD) are reported as warnings.
+    """
+
+    logger = initialize_logger()
+
+    baseline_by_name = {baseline_result["name"]: baseline_result for baseline_result in baseline_results}
+
+    pretty_table = PrettyTable(["Scenario", "Baseline time (s)", "Current time (s)", "Time ratio",
+                                "Baseline memory (MB)", "Current memory (MB)", "Memory ratio"])
+
+    for result in results:
+        baseline_result = baseline_by_name.get(result["name"])
+        if baseline_result is None:
+            continue
+
+        ratios = {}
+        for measure in ["total_time", "peak_memory"]:
+            ratios[measure] = None
+            if result[measure] is not None and baseline_result.get(measure):
+                ratios[measure] = result[measure] / baseline_result[measure]
+                if ratios[measure] > REGRESSION_THRESHOLD:
+                    logger.warning(f"Regression in scenario {result['name']}: {measure} is "
+                                   f"{round(ratios[measure], 2)} times the baseline's value.")
+
+        pretty_table.add_row([result["name"], format_value(baseline_result["total_time"]),
+                              format_value(result["total_time"]), format_value(ratios["total_time"], 2),
+                              format_value(baseline_result.get("peak_memory"), 1),
+                              format_value(result["peak_memory"], 1), format_value(ratios["peak_memory"], 2)])
+
+    return pretty_table.get_string()
+
+
+def print_benchmark_results(results, baseline_results=None):
+    """ Prints the benchmark results and, if baseline results are received, their comparison with them. """
+
+    print("\n##### ONTCATOWL BENCHMARK RESULTS #####")
+    print(generate_results_table(results))
+    print("\n##### EXECUTION TIMES PER RULE (s) #####")
+    print(generate_rules_times_table(results))
+
+    if baseline_results is not None:
+        print("\n##### COMPARISON WITH BASELINE #####")
+        print(generate_comparison_table(results, baseline_results))
+
+    print()
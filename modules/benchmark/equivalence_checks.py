@@ -0,0 +1,151 @@
+""" Equivalence checks of optimized implementations against the reference implementations that they replaced. Each check
+    returns its number of mismatches, which are reported as errors.
+
+    - classes_yaml: the streaming emitter of the classes' yaml files (dump_classes_yaml) against yaml.dump_all.
+    - rules_scheduler: the "worklist" rules scheduler against the "fixed_order" one (see execute_rules_types), over
+        synthetic taxonomies of all benchmark families.
+"""
+import io
+import random
+
+import yaml
+
+from modules.benchmark.benchmark_ontcatowl import BENCHMARK_FAMILIES
+from modules.benchmark.synthetic_taxonomy import generate_synthetic_taxonomy
+from modules.ontcatowl.ontcatowl import run_ontcatowl
+from modules.run.classes_yaml import dump_classes_yaml
+from modules.tester.logger_config import initialize_logger
+
+# Class names of the classes_yaml check. They include plain names and names that the streaming emitter must leave to
+# the yaml library: names that need quotes, reserved words (resolved to booleans, nulls and numbers), non-ASCII names,
+# the empty name, and names around the size limit of the simple keys (MAXIMUM_SIMPLE_KEY_SIZE).
+CLASSES_YAML_NAMES = ["C1", "Class-1.2", "_Class", "a_b:c_d", "gufo:Kind",
+                      "a b", "a:b", "a: b", "a:", ":a", "-a", "a#b", "a,b", "a%b", "[a]", "!a", "&a", "*a", "@a",
+                      "'quoted'", '"quoted"', "a\nb", " a", "a ",
+                      "yes", "No", "on", "OFF", "true", "null", "~", "1", "1.5", "e5", "0x1F", ".inf", "2022-01-01",
+                      "Ação", "é", "Straße", "类", "",
+                      *["x" * size for size in [121, 122, 123, 124, 127, 128, 129, 150, 200]],
+                      "gufo:" + "y" * 130]
+
+CLASSES_YAML_TYPES = ["gufo:Kind", "gufo:SubKind", "gufo:Role", "gufo:Phase", "gufo:Category", "gufo:Mixin"]
+
+
+def generate_classes_yaml_documents(seed=0):
+    """ Returns the list of cases of the classes_yaml check. Each case is a list of classes' dictionaries with the
+        schema of the classes' yaml files (see convert_ontology_dataclass_list_to_dictionary_list_t2). Each name of
+        CLASSES_YAML_NAMES is used as a class name (alone and between plain classes) and as an element of a list.
+    """
+
+    random_generator = random.Random(seed)
+
+    def generate_class_information(special_element=None):
+        class_information = {"input": random_generator.random() < 0.5,
+                             "is_type": random_generator.sample(CLASSES_YAML_TYPES, random_generator.randint(0, 2)),
+                             "can_type": random_generator.sample(CLASSES_YAML_TYPES, random_generator.randint(0, 4)),
+                             "not_type": random_generator.sample(CLASSES_YAML_TYPES, random_generator.randint(0, 2)),
+                             "is_incomplete": random_generator.random() < 0.5,
+                             "detected_in": ["k_s_sup", "ns_s_spe"][:random_generator.randint(0, 2)]}
+        if special_element is not None:
+            class_information[random_generator.choice(["is_type", "can_type", "not_type"])].append(special_element)
+        return class_information
+
+    cases = [[]]
+
+    for name in CLASSES_YAML_NAMES:
+        cases.append([{name: generate_class_information()}])
+        cases.append([{"C0": generate_class_information()}, {name: generate_class_information()},
+                      {"C2": generate_class_information(special_element=name)}])
+
+    cases.append([{f"C{position}": generate_class_information()} for position in range(100)])
+
+    return cases
+
+
+def check_classes_yaml():
+    """ Verifies that dump_classes_yaml writes the same output as yaml.dump_all(..., sort_keys=True). """
+
+    logger = initialize_logger()
+
+    mismatches = 0
+    cases = generate_classes_yaml_documents()
+
+    for ontology_dictionary_list in cases:
+        expected_output = io.StringIO()
+        yaml.dump_all(ontology_dictionary_list, expected_output, sort_keys=True)
+
+        output = io.StringIO()
+        dump_classes_yaml(ontology_dictionary_list, output)
+
+        if output.getvalue() != expected_output.getvalue():
+            mismatches += 1
+            logger.error(f"dump_classes_yaml output differs from yaml.dump_all for {ontology_dictionary_list}.\n"
+                         f"Expected: {expected_output.getvalue()!r}\nObtained: {output.getvalue()!r}")
+
+    logger.info(f"Equivalence check classes_yaml: {len(cases)} cases verified, {mismatches} mismatches.")
+
+    return mismatches
+
+
+# Numbers of classes and seeds of the synthetic taxonomies of the rules_scheduler check, which are generated for each
+# benchmark family and executed with complete and incomplete configurations.
+RULES_SCHEDULER_SIZES = [20, 60]
+RULES_SCHEDULER_SEEDS = [0, 1, 2]
+
+
+def get_final_state(global_configurations, working_graph):
+    """ Executes OntCatOWL and returns the final state of its ontology dataclass list: a list with the tuple (uri, lists,
+        incompleteness information) of each dataclass. Returns "inconsistent" if the execution was interrupted.
+    """
+
+    try:
+        ontology_dataclass_list, _, _, _ = run_ontcatowl(global_configurations, working_graph)
+    except:
+        return "inconsistent"
+
+    return [(ontology_dataclass.uri, ontology_dataclass.is_type, ontology_dataclass.is_individual,
+             ontology_dataclass.can_type, ontology_dataclass.can_individual, ontology_dataclass.not_type,
+             ontology_dataclass.not_individual, ontology_dataclass.incompleteness_info["is_incomplete"],
+             ontology_dataclass.incompleteness_info["detected_in"])
+            for ontology_dataclass in ontology_dataclass_list]
+
+
+def check_rules_scheduler():
+    """ Verifies that the "worklist" and "fixed_order" rules schedulers reach the same final ontology dataclass list.
+    """
+
+    logger = initialize_logger()
+
+    mismatches = 0
+    number_cases = 0
+
+    for family, family_parameters in BENCHMARK_FAMILIES.items():
+        for number_classes in RULES_SCHEDULER_SIZES:
+            for seed in RULES_SCHEDULER_SEEDS:
+                for is_complete in [True, False]:
+                    number_cases += 1
+
+                    final_states = {}
+                    for rules_scheduler in ["worklist", "fixed_order"]:
+                        global_configurations = {"is_automatic": True, "is_complete": is_complete,
+                                                 "rules_scheduler": rules_scheduler}
+                        working_graph = generate_synthetic_taxonomy(number_classes, seed=seed, **family_parameters)
+                        final_states[rules_scheduler] = get_final_state(global_configurations, working_graph)
+
+                    if final_states["worklist"] != final_states["fixed_order"]:
+                        mismatches += 1
+                        logger.error(f"The rules schedulers reached different final states for the {family} taxonomy "
+                                     f"with {number_classes} classes (seed {seed}, is_complete {is_complete}).")
+
+    logger.info(f"Equivalence check rules_scheduler: {number_cases} cases verified, {mismatches} mismatches.")
+
+    return mismatches
+
+
+# Available checks, indexed by the names received in the benchmark's --check argument.
+EQUIVALENCE_CHECKS = {"classes_yaml": check_classes_yaml, "rules_scheduler": check_rules_scheduler}
+
+
+def run_equivalence_checks(checks_names):
+    """ Executes the received checks and returns their total number of mismatches. """
+
+    return sum(EQUIVALENCE_CHECKS[check_name]() for check_name in checks_names)
@@ -0,0 +1,112 @@
+""" Generation of synthetic taxonomies, in the same format as the taxonomy.ttl files of the catalog's datasets, used for
+    benchmarking OntCatOWL. """
+import bisect
+import random
+
+from rdflib import Graph, URIRef, RDF, RDFS, OWL
+
+NAMESPACE_GUFO = "http://purl.org/nemo/gufo#"
+NAMESPACE_TAXONOMY = "http://taxonomy.model/"
+
+# GUFO types that can be assigned to a class below a rigid (SubKind) or an anti-rigid (Role and Phase) superclass.
+GUFO_TYPES_BELOW_RIGID = ["gufo:SubKind", "gufo:Role", "gufo:Phase"]
+GUFO_TYPES_BELOW_ANTI_RIGID = ["gufo:Role", "gufo:Phase"]
+
+
+def generate_taxonomy_structure(number_classes, depth, branching_factor, multiple_inheritance, seed):
+    """ Returns the structure of a synthetic taxonomy with number_classes classes as a list in which each position
+        contains the tuple (class_name, level, tree, list_of_superclasses_positions).
+
+        The classes are created in trees whose roots have level 0. Each class has up to branching_factor subclasses and
+        each tree has up to depth levels. New trees are created until the number_classes is reached. Each non-root
+        class of level 2 or higher receives, with probability multiple_inheritance, an additional superclass of a lower
+        level of its tree.
+    """
+
+    random_generator = random.Random(seed)
+    structure = []
+    tree = 0
+
+    while len(structure) < number_classes:
+        structure.append((f"C{len(structure)}", 0, tree, []))
+        frontier = [len(structure) - 1]
+
+        for level in range(1, depth):
+            new_frontier = []
+            for superclass in frontier:
+                for _ in range(branching_factor):
+                    if len(structure) == number_classes:
+                        break
+                    structure.append((f"C{len(structure)}", level, tree, [superclass]))
+                    new_frontier.append(len(structure) - 1)
+            frontier = new_frontier
+
+        tree += 1
+
+    # Positions and levels of the classes of each tree. As classes are created by level, lower levels come first.
+    trees_positions = {}
+    trees_levels = {}
+    for position, (class_name, level, tree, superclasses) in enumerate(structure):
+        trees_positions.setdefault(tree, []).append(position)
+        trees_levels.setdefault(tree, []).append(level)
+
+    for position, (class_name, level, tree, superclasses) in enumerate(structure):
+        if level > 1 and random_generator.random() < multiple_inheritance:
+            number_candidates = bisect.bisect_left(trees_levels[tree], level)
+            candidate = trees_positions[tree][random_generator.randrange(number_candidates)]
+            if candidate not in superclasses:
+                superclasses.append(candidate)
+
+    return structure
+
+
+def assign_gufo_types(structure, seed):
+    """ Returns, for each class of the structure, a GUFO type that is consistent with all other assigned types.
+
+        Roots are kinds. Classes below an anti-rigid class (i.e., a role or a phase) are roles or phases, and the other
+        classes are subkinds, roles or phases. As additional superclasses are always in the same tree, each class is
+        specialization of only one kind.
+    """
+
+    random_generator = random.Random(seed)
+    gufo_types = []
+
+    for class_name, level, tree, superclasses in structure:
+        if level == 0:
+            gufo_types.append("gufo:Kind")
+        elif any(gufo_types[superclass] in GUFO_TYPES_BELOW_ANTI_RIGID for superclass in superclasses):
+            gufo_types.append(random_generator.choice(GUFO_TYPES_BELOW_ANTI_RIGID))
+        else:
+            gufo_types.append(random_generator.choice(GUFO_TYPES_BELOW_RIGID))
+
+    return gufo_types
+
+
+def generate_synthetic_taxonomy(number_classes, depth, branching_factor, multiple_inheritance=0.0, typed_fraction=0.0,
+                                seed=0):
+    """ Returns an RDFLib graph with a synthetic taxonomy (see generate_taxonomy_structure), in which a typed_fraction
+        of the classes have their GUFO types (see assign_gufo_types) declared. The same parameters always generate the
+        same graph.
+    """
+
+    structure = generate_taxonomy_structure(number_classes, depth, branching_factor, multiple_inheritance, seed)
+    gufo_types = assign_gufo_types(structure, seed)
+
+    random_generator = random.Random(seed)
+    typed_positions = random_generator.sample(range(len(structure)), round(typed_fraction * len(structure)))
+
+    taxonomy_graph = Graph()
+    taxonomy_graph.bind("gufo", NAMESPACE_GUFO)
+
+    for class_name, level, tree, superclasses in structure:
+        class_uri = URIRef(NAMESPACE_TAXONOMY + class_name)
+        taxonomy_graph.add((class_uri, RDF.type, OWL.Class))
+        for superclass in superclasses:
+            taxonomy_graph.add((class_uri, RDFS.subClassOf, URIRef(NAMESPACE_TAXONOMY + structure[superclass][0])))
+
+    for position in typed_positions:
+        class_uri = URIRef(NAMESPACE_TAXONOMY + structure[position][0])
+        gufo_type = URIRef(gufo_types[position].replace("gufo:", NAMESPACE_GUFO))
+        taxonomy_graph.add((class_uri, RDF.type, gufo_type))
+
+    return taxonomy_graph
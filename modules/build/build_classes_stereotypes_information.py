@@ -1,10 +1,9 @@
 """ Functions related to stereotypes. """
 
-from rdflib import URIRef, RDF
+from rdflib import URIRef
 
-from modules.build.build_taxonomy_files import clean_class_name
+from modules.build.build_taxonomy_files import clean_class_name, get_elements_of_type
 from modules.tester.logger_config import initialize_logger
-from modules.tester.utils_rdf import load_graph_safely
 
 VOCABULARY_CLASS_URI = URIRef("https://purl.org/ontouml-models/vocabulary/Class")
 VOCABULARY_GENERALIZATION_URI = URIRef("https://purl.org/ontouml-models/vocabulary/Generalization")
@@ -41,25 +40,26 @@ def get_gufo_stereotype(class_stereotype_original):
     return mapped_stereotype
 
 
-def collect_stereotypes_classes_information(catalog_path, dataset_classes_information, dataset, catalog_size, current):
-    """ Read all classes information related to stereotypes and updates the catalog_information. """
+def collect_stereotypes_classes_information(source_information, dataset_classes_information, dataset, catalog_size,
+                                            current):
+    """ Read all classes information related to stereotypes (from the source_information read with
+        read_source_information) and updates the catalog_information. """
 
     logger = initialize_logger()
 
-    source_owl_file_path = catalog_path + "\\" + dataset + "\\" + "ontology.ttl"
-    ontology_graph = load_graph_safely(source_owl_file_path)
+    classes_information_by_name = {class_in_list.name: class_in_list for class_in_list in dataset_classes_information}
 
-    for owl_class in ontology_graph.subjects(RDF.type, VOCABULARY_CLASS_URI):
+    for owl_class in get_elements_of_type(source_information, VOCABULARY_CLASS_URI):
 
         # Getting classes' names
-        class_name = ontology_graph.value(owl_class, VOCABULARY_NAME_URI)
+        class_name = source_information["names"].get(owl_class)
         class_name = class_name.n3()[1:-(len(class_name.language) + 2)]
         class_name = clean_class_name(class_name)
 
         if class_name != "string" and class_name != "int" and class_name != "char":
 
             # Getting classes' stereotypes
-            class_stereotype_original = ontology_graph.value(owl_class, VOCABULARY_STEREOTYPE_URI)
+            class_stereotype_original = source_information["stereotypes"].get(owl_class)
 
             if class_stereotype_original == None:
                 class_stereotype_original_string = "none"
@@ -69,9 +69,9 @@ def collect_stereotypes_classes_information(catalog_path, dataset_classes_inform
                 class_stereotype_original_string = class_stereotype_original_string.lower().strip()
                 class_stereotype_gufo = get_gufo_stereotype(class_stereotype_original_string)
 
-            for class_in_list in dataset_classes_information:
-                if class_in_list.name == class_name:
-                    class_in_list.stereotype_original = class_stereotype_original_string
-                    class_in_list.stereotype_gufo = class_stereotype_gufo
+            if class_name in classes_information_by_name:
+                class_in_list = classes_information_by_name[class_name]
+                class_in_list.stereotype_original = class_stereotype_original_string
+                class_in_list.stereotype_gufo = class_stereotype_gufo
 
     logger.info(f"Stereotypes information {current}/{catalog_size} collected from dataset {dataset}")
@@ -0,0 +1,55 @@
+""" Function for building one dataset of the catalog (an independent unit of the build, that can be executed in a
+    parallel process). """
+
+from modules.build.build_classes_stereotypes_information import collect_stereotypes_classes_information
+from modules.build.build_directories_structure import create_test_directory_folders_structure
+from modules.build.build_information_classes import saves_dataset_csv_classes_data
+from modules.build.build_taxonomy_classes_information import collect_taxonomy_information
+from modules.build.build_taxonomy_files import read_source_information, create_taxonomy_graph, \
+    create_taxonomy_ttl_file
+from modules.tester.logger_config import initialize_logger
+
+
+def get_dataset_generated_files_paths(internal_catalog_folder, dataset):
+    """ Returns the list of the paths of the files generated by build_dataset for the dataset. """
+
+    dataset_folder_path = internal_catalog_folder + "\\" + dataset
+
+    return [dataset_folder_path + "\\" + "taxonomy.ttl", dataset_folder_path + "\\" + "classes_data.csv"]
+
+
+def build_dataset(build_unit):
+    """ Builds the taxonomy.ttl and classes_data.csv files of one dataset.
+
+        The build_unit is a tuple (catalog_path, internal_catalog_folder, dataset, catalog_size, current), in which
+        current is the position of the dataset in the catalog. Returns the list of the generated files' paths, whose
+        hashes must be registered by the caller (the hash register is only written by one process).
+    """
+
+    catalog_path, internal_catalog_folder, dataset, catalog_size, current = build_unit
+
+    logger = initialize_logger()
+    logger.info(f"### Starting dataset {current}/{catalog_size}: {dataset} ###\n")
+
+    source_owl_file_path = catalog_path + "\\" + dataset + "\\" + "ontology.ttl"
+    dataset_folder_path = internal_catalog_folder + "\\" + dataset
+
+    create_test_directory_folders_structure(dataset_folder_path, catalog_size, current)
+
+    # The source file is parsed only once. The taxonomy and the classes information are built in memory.
+    source_information = read_source_information(source_owl_file_path)
+    taxonomy_graph = create_taxonomy_graph(source_information)
+
+    # Builds dataset_classes_information and collects attributes name, prefixed_name, and all taxonomic information
+    dataset_classes_information = collect_taxonomy_information(taxonomy_graph, dataset, catalog_size, current)
+
+    # Collects stereotype_original and stereotype_gufo for dataset_classes_information
+    collect_stereotypes_classes_information(source_information, dataset_classes_information,
+                                            dataset, catalog_size, current)
+
+    # Saving taxonomies files and classes information
+    taxonomy_file_path = create_taxonomy_ttl_file(taxonomy_graph, dataset_folder_path, catalog_size, current)
+    csv_file_path = saves_dataset_csv_classes_data(dataset_classes_information, dataset_folder_path, catalog_size,
+                                                   current)
+
+    return [taxonomy_file_path, csv_file_path]
@@ -2,7 +2,6 @@
 import csv
 import operator
 
-from modules.tester.hash_functions import register_sha256_hash_information
 from modules.tester.logger_config import initialize_logger
 
 
@@ -31,8 +30,9 @@ class class_information_structure(object):
         self.number_reachable_classes = number_reachable_classes
 
 
-def saves_dataset_csv_classes_data(catalog_information, dataset_path, catalog_size, current, source_owl_file_path):
-    """ Saves dataset classes information in CSV format. """
+def saves_dataset_csv_classes_data(catalog_information, dataset_path, catalog_size, current):
+    """ Saves dataset classes information in CSV format and returns the path of the saved file.
+        The hash of the saved file is registered by the caller. """
 
     logger = initialize_logger()
     csv_header = ["class_name", "stereotype_original", "stereotype_gufo", "is_root", "is_leaf", "is_intermediate",
@@ -68,8 +68,4 @@ def saves_dataset_csv_classes_data(catalog_information, dataset_path, catalog_si
                      f"System error reported: {error}")
         exit(1)
 
-    current += 1
-
-    register_sha256_hash_information(csv_file_full_path, source_owl_file_path)
-
     return csv_file_full_path
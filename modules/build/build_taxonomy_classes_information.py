@@ -1,11 +1,9 @@
 """ Fills the statistics with taxonomy information. """
-import pathlib
 
 from modules.build.build_information_classes import class_information_structure
 from modules.tester.graph_data import generates_nodes_lists
 from modules.tester.logger_config import initialize_logger
 from modules.tester.utils_graph import get_all_superclasses, get_all_subclasses, get_all_related_nodes
-from modules.tester.utils_rdf import load_graph_safely
 
 
 def get_taxonomy_position_information(class_taxonomy_information, taxonomy_nodes):
@@ -62,16 +60,11 @@ def calculate_class_taxonomy_information(taxonomy_graph, taxonomy_nodes):
     return list_classes_statistics
 
 
-def collect_taxonomy_information(dataset, catalog_size, current):
-    """ Populates the statistics list with taxonomy information. """
+def collect_taxonomy_information(taxonomy_graph, dataset, catalog_size, current):
+    """ Populates the statistics list with taxonomy information of the dataset's taxonomy_graph. """
 
     logger = initialize_logger()
 
-    dataset_folder_path = str(pathlib.Path().resolve()) + "\\" + "catalog" + "\\" + dataset
-    taxonomy_path = dataset_folder_path + "/taxonomy.ttl"
-
-    taxonomy_graph = load_graph_safely(taxonomy_path)
-
     taxonomy_prefixed_nodes_list = generates_nodes_lists(taxonomy_graph)
     list_classes_information = calculate_class_taxonomy_information(taxonomy_graph, taxonomy_prefixed_nodes_list)
 
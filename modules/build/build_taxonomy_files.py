@@ -2,7 +2,6 @@
 
 from rdflib import RDF, URIRef, Graph, RDFS, OWL
 
-from modules.tester.hash_functions import register_sha256_hash_information
 from modules.tester.logger_config import initialize_logger
 from modules.tester.utils_rdf import load_graph_safely
 
@@ -30,30 +29,87 @@ def clean_class_name(class_raw_name: str) -> str:
     return class_clean_name
 
 
-def create_taxonomy_graph(owl_file_path):
-    """ Extract the dataset model's taxonomy into a new graph. """
+def read_source_information(owl_file_path):
+    """ Loads the dataset's OntoUML serialization in OWL and collects all the information needed for building the
+        dataset: the types, names and stereotypes of its elements and the general and specific participants of its
+        generalizations. Only the triples of these predicates are read, in a single pass over each predicate's index.
+
+        Returns a dictionary in which each key (names, stereotypes, generals and specifics) maps the subjects to the
+        first object of a predicate (as done by rdflib's Graph.value). As elements may have more than one type, the key
+        types maps each subject to the list of its types (the first one being the one returned by Graph.value) and the
+        key elements_of_type maps each type to the list of its subjects (as returned by Graph.subjects).
+    """
 
     source_graph = load_graph_safely(owl_file_path)
+
+    source_information = {}
+    predicates_keys = {"names": VOCABULARY_NAME_URI,
+                       "stereotypes": VOCABULARY_STEREOTYPE_URI,
+                       "generals": VOCABULARY_GENERAL_URI,
+                       "specifics": VOCABULARY_SPECIFIC_URI}
+
+    for key, predicate in predicates_keys.items():
+        predicate_information = {}
+        for subj, obj in source_graph.subject_objects(predicate):
+            if subj not in predicate_information:
+                predicate_information[subj] = obj
+        source_information[key] = predicate_information
+
+    types_information = {}
+    elements_of_type = {}
+    for subj, obj in source_graph.subject_objects(RDF.type):
+        types_information.setdefault(subj, []).append(obj)
+        elements_of_type.setdefault(obj, []).append(subj)
+
+    # The index of types is ordered by type, so the types of the subjects with more than one type are read again to
+    # keep their first type the same as the one returned by Graph.value.
+    for subj, subject_types in types_information.items():
+        if len(subject_types) > 1:
+            types_information[subj] = list(source_graph.objects(subj, RDF.type))
+
+    source_information["types"] = types_information
+    source_information["elements_of_type"] = elements_of_type
+
+    return source_information
+
+
+def get_elements_of_type(source_information, element_type):
+    """ Returns the list of elements of the element_type (e.g., VOCABULARY_CLASS_URI) in the source_information. """
+
+    return source_information["elements_of_type"].get(element_type, [])
+
+
+def get_first_type(source_information, element):
+    """ Returns the first type of the element in the source_information (as done by rdflib's Graph.value) or None. """
+
+    element_types = source_information["types"].get(element)
+
+    return element_types[0] if element_types else None
+
+
+def create_taxonomy_graph(source_information):
+    """ Extract the dataset model's taxonomy (read with read_source_information) into a new graph. """
+
     taxonomy_graph = Graph()
 
     taxonomy_namespace = "http://taxonomy.model/"
 
     # Isolated classes are ignored for the creation of the taxonomy.ttl file.
-    for generalization in source_graph.subjects(RDF.type, VOCABULARY_GENERALIZATION_URI):
+    for generalization in get_elements_of_type(source_information, VOCABULARY_GENERALIZATION_URI):
         # Getting uri of the general and specific participants in the generalization
-        class_general = source_graph.value(generalization, VOCABULARY_GENERAL_URI)
-        class_specific = source_graph.value(generalization, VOCABULARY_SPECIFIC_URI)
+        class_general = source_information["generals"].get(generalization)
+        class_specific = source_information["specifics"].get(generalization)
 
         # continue if general and specific are classes
-        type_of_general = source_graph.value(class_general, RDF.type)
-        type_of_specific = source_graph.value(class_specific, RDF.type)
+        type_of_general = get_first_type(source_information, class_general)
+        type_of_specific = get_first_type(source_information, class_specific)
 
         if (type_of_general != VOCABULARY_CLASS_URI) or (type_of_specific != VOCABULARY_CLASS_URI):
             continue
 
         # Getting classes names
-        class_general_name = source_graph.value(class_general, VOCABULARY_NAME_URI)
-        class_specific_name = source_graph.value(class_specific, VOCABULARY_NAME_URI)
+        class_general_name = source_information["names"].get(class_general)
+        class_specific_name = source_information["names"].get(class_specific)
 
         # Converting Literals to URIRef in the following format ("http://taxonomy.model/Class_Name")
         class_general_name_string = class_general_name.n3()[1:-(len(class_general_name.language) + 2)]
@@ -75,13 +131,13 @@ def create_taxonomy_graph(owl_file_path):
     return taxonomy_graph
 
 
-def create_taxonomy_ttl_file(source_owl_file_path, dataset_folder_path, catalog_size, current):
-    """ Generates and saves the file taxonomy.ttl - rdf-s graph with the model's taxonomy - for a dataset. """
+def create_taxonomy_ttl_file(taxonomy_graph, dataset_folder_path, catalog_size, current):
+    """ Saves the file taxonomy.ttl - rdf-s graph with the model's taxonomy - for a dataset and returns its path.
+        The hash of the saved file is registered by the caller. """
 
     logger = initialize_logger()
 
-    # Creating and saving taxonomy file
-    taxonomy_graph = create_taxonomy_graph(source_owl_file_path)
+    # Saving taxonomy file
     taxonomy_file_path = dataset_folder_path + "\\" + "taxonomy.ttl"
 
     try:
@@ -92,4 +148,4 @@ def create_taxonomy_ttl_file(source_owl_file_path, dataset_folder_path, catalog_
                      f"System error reported: {error}")
         exit(1)
 
-    register_sha256_hash_information(taxonomy_file_path, source_owl_file_path)
+    return taxonomy_file_path
@@ -0,0 +1,307 @@
+""" Definition of the dataclass that holds the GUFO dictionary compiled into integer bitmasks.
+    Each GUFO element (types and individuals) is mapped to a bit index, so that the IS, CAN and NOT lists of the
+    Ontology DataClasses can be stored and manipulated as integers.
+"""
+import hashlib
+import json
+from dataclasses import dataclass, field
+
+from modules.ontcatowl.modules.logger_config import initialize_logger
+
+logger = initialize_logger()
+
+# The compiled bit indexes, keyed by the hash of their GUFO dictionaries (see get_gufo_dictionary_hash), and the last
+# dictionary received with its hash. The GUFO dictionary is shared (as a pointer) by all dataclasses, so it is usually
+# hashed only once.
+COMPILED_INDEXES = {}
+LAST_GUFO_DICTIONARY_HASH = {"gufo_dictionary": None, "gufo_dictionary_hash": None}
+
+
+@dataclass
+class GufoBitIndex(object):
+    """ Maps every GUFO element to a bit and keeps the GUFO dictionary rules as bitmasks.
+
+    elements is the list of all GUFO elements: first the types (sorted), then the individuals (sorted). The bit of an
+    element is 1 << (its position in elements).
+
+    implied_is and implied_not contain, for each bit position, the mask of the elements that are asserted (is_list) and
+    negated (not_list) when the element of that position is in the IS list of a dataclass.
+
+    complements is a list of tuples (key_mask, require_is_mask, require_not_mask, result_mask).
+    subtypes is a list of tuples (key_mask, subtypes_mask).
+
+    closures is the closure table: it maps a tuple (hierarchy_mask, is_mask, not_mask) to the tuple (is_mask, not_mask)
+    obtained after applying all GUFO dictionary updates until nothing changes, or to None if the updates lead to an
+    inconsistency. The table is filled by compile_closures and memoizes any other state calculated on demand.
+
+    closures_orders memoizes the results of get_closure_order.
+
+    influences memoizes the results of get_influence_masks.
+    """
+
+    elements: list[str] = field(default_factory=list[str])
+    bits: dict = field(default_factory=dict)
+    types_mask: int = 0
+    individuals_mask: int = 0
+    implied_is: list[int] = field(default_factory=list[int])
+    implied_not: list[int] = field(default_factory=list[int])
+    complements: list[tuple] = field(default_factory=list[tuple])
+    subtypes: list[tuple] = field(default_factory=list[tuple])
+    list_views: dict = field(default_factory=dict, repr=False)
+    closures: dict = field(default_factory=dict, repr=False)
+    is_closures_table_complete: bool = False
+    closures_orders: dict = field(default_factory=dict, repr=False)
+    influences: dict = field(default_factory=dict, repr=False)
+
+    def get_mask(self, elements_list):
+        """ Returns the mask of a list of GUFO elements. Unknown elements abort the program. """
+
+        mask = 0
+
+        for element in elements_list:
+            if element not in self.bits:
+                logger.error(f"The element {element} is not a known GUFO type or individual. Program aborted.")
+                exit(1)
+            mask |= self.bits[element]
+
+        return mask
+
+    def get_elements_list(self, mask):
+        """ Returns a new list with the names of all elements in the mask, in the order of the elements list.
+            Derived lists are memoized by mask, as only a few combinations of elements occur in practice.
+        """
+
+        if mask not in self.list_views:
+            self.list_views[mask] = tuple(element for position, element in enumerate(self.elements)
+                                          if mask & (1 << position))
+
+        return list(self.list_views[mask])
+
+    def get_implied_masks(self, is_mask):
+        """ Returns the masks of all elements that are implied as IS and as NOT by the elements in is_mask. """
+
+        implied_is = 0
+        implied_not = 0
+
+        while is_mask:
+            lowest_bit = is_mask & -is_mask
+            position = lowest_bit.bit_length() - 1
+            implied_is |= self.implied_is[position]
+            implied_not |= self.implied_not[position]
+            is_mask ^= lowest_bit
+
+        return implied_is, implied_not
+
+    def calculate_closure(self, is_mask, not_mask, hierarchy_mask, steps=None):
+        """ Applies the GUFO dictionary to the IS and NOT masks of a hierarchy until nothing changes and returns the
+            resulting tuple (is_mask, not_mask), or None if an element would be in both IS and NOT lists.
+            If a steps list is received, the mask of the elements moved in each update is appended to it.
+
+            Each iteration performs, only while there are elements of the hierarchy in the CAN list:
+                1) Update FROM IS LIST: elements in the is_list and not_list of the IS elements are moved.
+                2) Update FROM COMPLEMENT LIST: for all NOT elements that are complements keys, if require_is is
+                    subset of IS and require_not is subset of NOT, the result elements are moved to IS.
+                3) Update FROM SUBTYPE LIST: for all NOT elements that are subtypes keys, the elements of the key's
+                    list are moved to NOT. E.g., if a dataclass is not a gufo:IntrinsicAspect, then it is also not
+                    a gufo:IntrinsicMode or a gufo:Quality.
+        """
+
+        is_mask &= hierarchy_mask
+        not_mask &= hierarchy_mask
+        previous_masks = None
+
+        while previous_masks != (is_mask, not_mask):
+            previous_masks = (is_mask, not_mask)
+
+            if hierarchy_mask & ~(is_mask | not_mask):
+                moved_mask = ~(is_mask | not_mask)
+                implied_is, implied_not = self.get_implied_masks(is_mask)
+                is_mask |= implied_is
+                not_mask |= implied_not
+                if is_mask & not_mask:
+                    return None
+                if steps is not None:
+                    steps.append((is_mask | not_mask) & moved_mask)
+
+            if hierarchy_mask & ~(is_mask | not_mask):
+                moved_mask = ~(is_mask | not_mask)
+                for key_mask, require_is_mask, require_not_mask, result_mask in self.complements:
+                    if (key_mask & hierarchy_mask & not_mask) and not (require_is_mask & ~is_mask) \
+                            and not (require_not_mask & ~not_mask):
+                        is_mask |= result_mask
+                if is_mask & not_mask:
+                    return None
+                if steps is not None:
+                    steps.append((is_mask | not_mask) & moved_mask)
+
+            if hierarchy_mask & ~(is_mask | not_mask):
+                moved_mask = ~(is_mask | not_mask)
+                for key_mask, subtypes_mask in self.subtypes:
+                    if key_mask & hierarchy_mask & not_mask:
+                        not_mask |= subtypes_mask
+                if is_mask & not_mask:
+                    return None
+                if steps is not None:
+                    steps.append((is_mask | not_mask) & moved_mask)
+
+        return is_mask, not_mask
+
+    def get_closure(self, is_mask, not_mask, hierarchy_mask):
+        """ Returns the closure of the IS and NOT masks of a hierarchy from the closure table.
+            States not yet in the table are calculated and memoized.
+        """
+
+        key = (hierarchy_mask, is_mask & hierarchy_mask, not_mask & hierarchy_mask)
+
+        if key not in self.closures:
+            self.closures[key] = self.calculate_closure(is_mask, not_mask, hierarchy_mask)
+
+        return self.closures[key]
+
+    def get_closure_order(self, is_mask, not_mask, hierarchy_mask):
+        """ Returns the list of the elements moved by the closure of the IS and NOT masks of a hierarchy, in the order
+            in which the GUFO dictionary updates move them: the elements of each update are after the ones of the
+            previous updates and, inside an update, they are in the order of the elements list.
+        """
+
+        key = (hierarchy_mask, is_mask & hierarchy_mask, not_mask & hierarchy_mask)
+
+        if key not in self.closures_orders:
+            steps = []
+            self.calculate_closure(is_mask, not_mask, hierarchy_mask, steps)
+            self.closures_orders[key] = tuple(element for step_mask in steps
+                                              for element in self.get_elements_list(step_mask))
+
+        return list(self.closures_orders[key])
+
+    def compile_closures(self):
+        """ Fills the closure table with all states that can be reached by a dataclass.
+            Starting from the closure of an empty dataclass, every consistent closed state is expanded by moving each
+            one of its CAN elements to the IS or to the NOT list.
+        """
+
+        logger.debug("Compiling GUFO closure table...")
+
+        for hierarchy_mask in [self.types_mask, self.individuals_mask]:
+            initial_state = self.get_closure(0, 0, hierarchy_mask)
+            reached_states = {initial_state}
+            states_to_expand = [initial_state]
+
+            while states_to_expand:
+                is_mask, not_mask = states_to_expand.pop()
+                can_mask = hierarchy_mask & ~(is_mask | not_mask)
+
+                while can_mask:
+                    element_bit = can_mask & -can_mask
+                    can_mask ^= element_bit
+
+                    for new_state in [self.get_closure(is_mask | element_bit, not_mask, hierarchy_mask),
+                                      self.get_closure(is_mask, not_mask | element_bit, hierarchy_mask)]:
+                        if (new_state is not None) and (new_state not in reached_states):
+                            reached_states.add(new_state)
+                            states_to_expand.append(new_state)
+
+        self.is_closures_table_complete = True
+        logger.debug(f"GUFO closure table successfully compiled with {len(self.closures)} entries.")
+
+    def get_influence_masks(self, element, target_list):
+        """ Returns the tuple (is_mask, not_mask) of all elements that may be moved to the IS and to the NOT lists of a
+            dataclass when the element is moved to the target_list ("is" or "not"). I.e., the element itself and all
+            elements moved by the GUFO dictionary updates, considering all states that can be reached by a dataclass.
+        """
+
+        if (element, target_list) in self.influences:
+            return self.influences[(element, target_list)]
+
+        if not self.is_closures_table_complete:
+            self.compile_closures()
+
+        element_bit = self.get_mask([element])
+        influence_is_mask = element_bit if target_list == "is" else 0
+        influence_not_mask = element_bit if target_list == "not" else 0
+
+        reached_states = {(key[0], state[0], state[1]) for key, state in list(self.closures.items())
+                          if state is not None}
+
+        for hierarchy_mask, is_mask, not_mask in reached_states:
+            if not (element_bit & hierarchy_mask & ~(is_mask | not_mask)):
+                continue
+
+            if target_list == "is":
+                new_state = self.get_closure(is_mask | element_bit, not_mask, hierarchy_mask)
+            else:
+                new_state = self.get_closure(is_mask, not_mask | element_bit, hierarchy_mask)
+
+            if new_state is not None:
+                influence_is_mask |= new_state[0] & ~is_mask
+                influence_not_mask |= new_state[1] & ~not_mask
+
+        self.influences[(element, target_list)] = (influence_is_mask, influence_not_mask)
+
+        return influence_is_mask, influence_not_mask
+
+
+def build_gufo_bit_index(gufo_dictionary):
+    """ Compiles the GUFO dictionary (loaded from the GUFO YAML file) into a GufoBitIndex. """
+
+    logger.debug("Compiling GUFO dictionary into bitmasks...")
+
+    types = sorted(gufo_dictionary.get("types", {}).keys())
+    individuals = sorted(gufo_dictionary.get("individuals", {}).keys())
+
+    gufo_bit_index = GufoBitIndex(elements=types + individuals)
+
+    for position, element in enumerate(gufo_bit_index.elements):
+        gufo_bit_index.bits[element] = 1 << position
+
+    gufo_bit_index.types_mask = gufo_bit_index.get_mask(types)
+    gufo_bit_index.individuals_mask = gufo_bit_index.get_mask(individuals)
+
+    gufo_bit_index.implied_is = [0] * len(gufo_bit_index.elements)
+    gufo_bit_index.implied_not = [0] * len(gufo_bit_index.elements)
+
+    for hierarchy in ["types", "individuals"]:
+        for element, element_lists in gufo_dictionary.get(hierarchy, {}).items():
+            position = gufo_bit_index.elements.index(element)
+            gufo_bit_index.implied_is[position] = gufo_bit_index.get_mask(element_lists["is_list"])
+            gufo_bit_index.implied_not[position] = gufo_bit_index.get_mask(element_lists["not_list"])
+
+    for key, complement in gufo_dictionary.get("complements", {}).items():
+        gufo_bit_index.complements.append((gufo_bit_index.get_mask([key]),
+                                           gufo_bit_index.get_mask(complement["require_is"]),
+                                           gufo_bit_index.get_mask(complement["require_not"]),
+                                           gufo_bit_index.get_mask(complement["result"])))
+
+    for key, subtypes_list in gufo_dictionary.get("subtypes", {}).items():
+        gufo_bit_index.subtypes.append((gufo_bit_index.get_mask([key]), gufo_bit_index.get_mask(subtypes_list)))
+
+    logger.debug("GUFO dictionary successfully compiled into bitmasks.")
+
+    return gufo_bit_index
+
+
+def get_gufo_dictionary_hash(gufo_dictionary):
+    """ Returns the sha256 hash of the contents of the GUFO dictionary. """
+
+    return hashlib.sha256(json.dumps(gufo_dictionary, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def get_gufo_bit_index(gufo_dictionary):
+    """ Returns the GufoBitIndex of the received GUFO dictionary.
+        Each index is compiled only once per different dictionary (e.g., when reloaded from a modified YAML file), so
+        that its closure table can be reused. No index is compiled for an empty dictionary: a new empty one is returned.
+    """
+
+    if not gufo_dictionary:
+        return GufoBitIndex()
+
+    if LAST_GUFO_DICTIONARY_HASH["gufo_dictionary"] is not gufo_dictionary:
+        LAST_GUFO_DICTIONARY_HASH["gufo_dictionary_hash"] = get_gufo_dictionary_hash(gufo_dictionary)
+        LAST_GUFO_DICTIONARY_HASH["gufo_dictionary"] = gufo_dictionary
+
+    gufo_dictionary_hash = LAST_GUFO_DICTIONARY_HASH["gufo_dictionary_hash"]
+
+    if gufo_dictionary_hash not in COMPILED_INDEXES:
+        COMPILED_INDEXES[gufo_dictionary_hash] = build_gufo_bit_index(gufo_dictionary)
+
+    return COMPILED_INDEXES[gufo_dictionary_hash]
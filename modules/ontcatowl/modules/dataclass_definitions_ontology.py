@@ -4,17 +4,192 @@
 import hashlib
 from dataclasses import dataclass, field
 
+from modules.ontcatowl.modules.dataclass_definitions_gufo import GufoBitIndex, get_gufo_bit_index
 from modules.ontcatowl.modules.dataclass_verifications import verify_duplicates_in_lists_ontology
 from modules.ontcatowl.modules.logger_config import initialize_logger
 
+logger = initialize_logger()
+
+# For each list name, the dataclass mask that stores it and the GufoBitIndex mask of its hierarchy.
+LISTS_MASKS = {"is_type": ("is_mask", "types_mask"),
+               "is_individual": ("is_mask", "individuals_mask"),
+               "can_type": ("can_mask", "types_mask"),
+               "can_individual": ("can_mask", "individuals_mask"),
+               "not_type": ("not_mask", "types_mask"),
+               "not_individual": ("not_mask", "individuals_mask")}
+
 
 @dataclass
+class OntologyChangesRegister(object):
+    """ Register of the modifications performed in the lists of a group of Ontology DataClasses.
+        The changes_counter is monotonic: it is incremented every time an element is moved in any of the dataclasses
+        that share the register. Comparing two values of the counter tells (in O(1)) if any list was modified.
+
+        If the dataclasses belong to an OntologyDataClassRegistry (dataclass_registry), the registry is informed of
+        all modifications, so that its indexes are kept updated.
+    """
+
+    changes_counter: int = 0
+    dataclass_registry: object = field(default=None, repr=False, compare=False)
+
+    def register_change(self, ontology_dataclass, moved_to_is_mask, moved_to_not_mask):
+        """ Registers that the elements in moved_to_is_mask and in moved_to_not_mask were moved from the CAN lists
+            to the IS and to the NOT lists of the ontology_dataclass.
+        """
+
+        self.changes_counter += 1
+
+        if self.dataclass_registry is not None:
+            self.dataclass_registry.update_elements_indexes(ontology_dataclass, moved_to_is_mask, moved_to_not_mask)
+
+
+class OntologyDataClassRegistry(list):
+    """ Ordered collection of the Ontology DataClasses of an ontology. It is used by the whole engine instead of a
+    plain list: it keeps the order and all operations of a list and additionally indexes:
+        - the dataclasses by their URIs (dataclasses); and
+        - for each GUFO element, the set of URIs of the dataclasses that have the element in their IS, CAN and NOT
+            lists (elements_indexes["IS"], elements_indexes["CAN"] and elements_indexes["NOT"]).
+
+    All dataclasses in the registry share its changes_register, through which the registry is informed of all moves
+    of elements and keeps the elements indexes updated.
+    """
+
+    def __init__(self, ontology_dataclasses=None, changes_register=None):
+        super().__init__()
+        self.changes_register = changes_register if changes_register is not None else OntologyChangesRegister()
+        self.changes_register.dataclass_registry = self
+        self.dataclasses = {}
+        self.positions = {}
+        self.elements_indexes = {"IS": {}, "CAN": {}, "NOT": {}}
+
+        if ontology_dataclasses is not None:
+            self.extend(ontology_dataclasses)
+
+    def index_dataclass(self, ontology_dataclass, position):
+        """ Includes the ontology_dataclass in all indexes of the registry. """
+
+        ontology_dataclass.changes_register = self.changes_register
+        self.dataclasses[ontology_dataclass.uri] = ontology_dataclass
+        self.positions[ontology_dataclass.uri] = position
+
+        for search_list, mask in [("IS", ontology_dataclass.is_mask), ("CAN", ontology_dataclass.can_mask),
+                                  ("NOT", ontology_dataclass.not_mask)]:
+            for element in ontology_dataclass.gufo_bit_index.get_elements_list(mask):
+                self.elements_indexes[search_list].setdefault(element, set()).add(ontology_dataclass.uri)
+
+    def rebuild_indexes(self):
+        """ Rebuilds all indexes of the registry. Used after operations that modify the order of the dataclasses or
+            remove dataclasses from the registry.
+        """
+
+        self.dataclasses = {}
+        self.positions = {}
+        self.elements_indexes = {"IS": {}, "CAN": {}, "NOT": {}}
+
+        for position, ontology_dataclass in enumerate(self):
+            self.index_dataclass(ontology_dataclass, position)
+
+    def update_elements_indexes(self, ontology_dataclass, moved_to_is_mask, moved_to_not_mask):
+        """ Updates the elements indexes after elements are moved from the CAN lists to the IS and NOT lists. """
+
+        if self.dataclasses.get(ontology_dataclass.uri) is not ontology_dataclass:
+            return
+
+        gufo_bit_index = ontology_dataclass.gufo_bit_index
+
+        for search_list, moved_mask in [("IS", moved_to_is_mask), ("NOT", moved_to_not_mask)]:
+            for element in gufo_bit_index.get_elements_list(moved_mask):
+                self.elements_indexes[search_list].setdefault(element, set()).add(ontology_dataclass.uri)
+                self.elements_indexes["CAN"].get(element, set()).discard(ontology_dataclass.uri)
+
+    def get_dataclass(self, uri):
+        """ Returns the dataclass with the received URI or None if it is not in the registry. """
+
+        return self.dataclasses.get(uri)
+
+    def get_uris_with_element(self, search_list, element):
+        """ Returns the set of URIs of the dataclasses that have the element in the search_list (IS, CAN or NOT).
+            The returned set must not be modified.
+        """
+
+        return self.elements_indexes[search_list].get(element, set())
+
+    def sort_uris(self, uris):
+        """ Returns a list with the received URIs (of dataclasses in the registry) in the order of the registry. """
+
+        return sorted(uris, key=self.positions.__getitem__)
+
+    def append(self, ontology_dataclass):
+        self.index_dataclass(ontology_dataclass, len(self))
+        super().append(ontology_dataclass)
+
+    def extend(self, ontology_dataclasses):
+        for ontology_dataclass in ontology_dataclasses:
+            self.append(ontology_dataclass)
+
+    def __iadd__(self, ontology_dataclasses):
+        self.extend(ontology_dataclasses)
+        return self
+
+    def insert(self, position, ontology_dataclass):
+        super().insert(position, ontology_dataclass)
+        self.rebuild_indexes()
+
+    def remove(self, ontology_dataclass):
+        super().remove(ontology_dataclass)
+        self.rebuild_indexes()
+
+    def pop(self, position=-1):
+        ontology_dataclass = super().pop(position)
+        self.rebuild_indexes()
+        return ontology_dataclass
+
+    def clear(self):
+        super().clear()
+        self.rebuild_indexes()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.rebuild_indexes()
+
+    def reverse(self):
+        super().reverse()
+        self.rebuild_indexes()
+
+    def __setitem__(self, position, value):
+        super().__setitem__(position, value)
+        self.rebuild_indexes()
+
+    def __delitem__(self, position):
+        super().__delitem__(position)
+        self.rebuild_indexes()
+
+    def __reduce__(self):
+        """ The registry is pickled as a new registry of its dataclasses, whose indexes are rebuilt when unpickled. """
+
+        return OntologyDataClassRegistry, (list(self),)
+
+
+@dataclass(init=False)
 class OntologyDataClass(object):
     """ Each loaded ontology dataclass has a URI (identifier) and six lists of GUFO elements.
     The lists indicate which gufo elem. the dataclass is, can, or cannot be, for the types and individuals hierarchies.
 
+    The six lists are stored as three integer bitmasks (is_mask, can_mask and not_mask), in which each GUFO element
+    (type or individual) is represented by the bit defined in the gufo_bit_index. The lists is_type, is_individual,
+    can_type, can_individual, not_type and not_individual are derived from the masks when accessed. They are views:
+    modifying a returned list does not modify the dataclass.
+
+    elements_order keeps all GUFO elements of the dataclass in the order in which they were inserted in their current
+    lists, so that the derived lists keep the order of the list-based representation: the received lists' order and,
+    for moved elements, the order of the moves (for the elements moved by the GUFO dictionary updates, the order given
+    by GufoBitIndex.get_closure_order). Lists are only sorted when requested (see sort_all_internal_lists).
+
     gufo_dictionary brings information for faster classification manipulation.
 
+    changes_register is the OntologyChangesRegister shared by the dataclasses of the same ontology. All modifications
+    in the lists of the dataclass are registered in it.
+
     incompleteness_info is a dictionary with the following filds:
         - is_incomplete: True or False
         - detected_in: list of rule codes where the incompleteness was detected (no repetitions are allowed).
@@ -22,14 +197,100 @@ class OntologyDataClass(object):
     """
 
     uri: str = field(default_factory=str)
-    is_type: list[str] = field(default_factory=list[str])
-    is_individual: list[str] = field(default_factory=list[str])
-    can_type: list[str] = field(default_factory=list[str])
-    can_individual: list[str] = field(default_factory=list[str])
-    not_type: list[str] = field(default_factory=list[str])
-    not_individual: list[str] = field(default_factory=list[str])
+    is_mask: int = 0
+    can_mask: int = 0
+    not_mask: int = 0
     gufo_dictionary: dict = field(default_factory=dict)
     incompleteness_info: dict = field(default_factory=dict)
+    gufo_bit_index: GufoBitIndex = field(default=None, repr=False, compare=False)
+    elements_order: list[str] = field(default_factory=list[str], repr=False, compare=False)
+    changes_register: OntologyChangesRegister = field(default=None, repr=False, compare=False)
+
+    def __init__(self, uri="", is_type=None, is_individual=None, can_type=None, can_individual=None, not_type=None,
+                 not_individual=None, gufo_dictionary=None, incompleteness_info=None, changes_register=None):
+        """ Receives the lists of GUFO elements (as in the list-based representation) and stores them as masks.
+            If no changes_register is received, the dataclass uses a register of its own.
+        """
+
+        self.uri = uri
+        self.gufo_dictionary = gufo_dictionary if gufo_dictionary is not None else {}
+        self.incompleteness_info = incompleteness_info if incompleteness_info is not None else {}
+        self.gufo_bit_index = get_gufo_bit_index(self.gufo_dictionary)
+        self.changes_register = changes_register if changes_register is not None else OntologyChangesRegister()
+
+        self.is_mask = self.gufo_bit_index.get_mask((is_type or []) + (is_individual or []))
+        self.can_mask = self.gufo_bit_index.get_mask((can_type or []) + (can_individual or []))
+        self.not_mask = self.gufo_bit_index.get_mask((not_type or []) + (not_individual or []))
+
+        self.elements_order = list(dict.fromkeys((is_type or []) + (is_individual or []) + (can_type or []) +
+                                                 (can_individual or []) + (not_type or []) + (not_individual or [])))
+
+    @property
+    def is_type(self):
+        """ List of GUFO types that the dataclass is. """
+        return self.get_list("is_type")
+
+    @property
+    def is_individual(self):
+        """ List of GUFO individuals that the dataclass is. """
+        return self.get_list("is_individual")
+
+    @property
+    def can_type(self):
+        """ List of GUFO types that the dataclass can be. """
+        return self.get_list("can_type")
+
+    @property
+    def can_individual(self):
+        """ List of GUFO individuals that the dataclass can be. """
+        return self.get_list("can_individual")
+
+    @property
+    def not_type(self):
+        """ List of GUFO types that the dataclass is not. """
+        return self.get_list("not_type")
+
+    @property
+    def not_individual(self):
+        """ List of GUFO individuals that the dataclass is not. """
+        return self.get_list("not_individual")
+
+    def __reduce__(self):
+        """ The dataclass is pickled (e.g., for being sent between processes) through its lists. Its gufo_bit_index and
+            changes_register are not pickled, but obtained again when unpickled.
+        """
+
+        return OntologyDataClass, (self.uri, self.is_type, self.is_individual, self.can_type, self.can_individual,
+                                   self.not_type, self.not_individual, self.gufo_dictionary, self.incompleteness_info)
+
+    def get_list_mask(self, list_name):
+        """ Returns the mask of the list received as parameter (e.g., 'is_type'). """
+
+        mask_name, hierarchy_mask_name = LISTS_MASKS[list_name]
+
+        return getattr(self, mask_name) & getattr(self.gufo_bit_index, hierarchy_mask_name)
+
+    def get_list(self, list_name):
+        """ Returns a new list with the elements of the list received as parameter (e.g., 'is_type'), in the order in
+            which they were inserted in it.
+        """
+
+        list_mask = self.get_list_mask(list_name)
+        bits = self.gufo_bit_index.bits
+
+        return [element for element in self.elements_order if bits[element] & list_mask]
+
+    def in_is_list(self, element):
+        """ Returns True if the element is in one of the IS lists (is_type or is_individual). """
+        return bool(self.is_mask & self.gufo_bit_index.bits.get(element, 0))
+
+    def in_can_list(self, element):
+        """ Returns True if the element is in one of the CAN lists (can_type or can_individual). """
+        return bool(self.can_mask & self.gufo_bit_index.bits.get(element, 0))
+
+    def in_not_list(self, element):
+        """ Returns True if the element is in one of the NOT lists (not_type or not_individual). """
+        return bool(self.not_mask & self.gufo_bit_index.bits.get(element, 0))
 
     def is_consistent(self):
         """ Performs a consistency check on the dataclass. For now only one verification is performed, which is
@@ -47,12 +308,8 @@ class OntologyDataClass(object):
         """ Move an element between two lists in the same OntologyClass
             Elements can only be moved from CAN lists to IS or NOT lists
         """
-        logger = initialize_logger()
-        logger.debug(
-            f"Starting to move element {element} from {source_list} list to {target_list} list in {self.uri}...")
-
-        source = []
-        target = []
+        logger.debug("Starting to move element %s from %s list to %s list in %s...", element, source_list, target_list,
+                     self.uri)
 
         # VERIFICATION 1: Source and target lists must be different
         if source_list == target_list:
@@ -61,39 +318,35 @@ class OntologyDataClass(object):
             exit(1)
 
         # VERIFICATION 2: Only CAN lists are allowed as source list
-        if source_list == "can_type":
-            source = self.can_type
-        elif source_list == "can_individual":
-            source = self.can_individual
-        else:
+        if source_list not in ["can_type", "can_individual"]:
             logger.error(f"Error for {self.uri} when trying to move {element} from list {source_list} "
                          f"to list {target_list}. Source list {source_list} is unknown. Program aborted.")
             exit(1)
 
         # VERIFICATION 3: Only IS or NOT lists are allowed as target list
-        if target_list == "is_type":
-            target = self.is_type
-        elif target_list == "is_individual":
-            target = self.is_individual
-        elif target_list == "not_type":
-            target = self.not_type
-        elif target_list == "not_individual":
-            target = self.not_individual
-        else:
+        if target_list not in ["is_type", "is_individual", "not_type", "not_individual"]:
             logger.error(f"Error for {self.uri} when trying to move {element} from list {source_list} "
                          f"to list {target_list}. Target list {target_list} is unknown. Program aborted.")
             exit(1)
 
         # VERIFICATION 4: Element must be in source list
-        if element not in source:
+        element_bit = self.gufo_bit_index.bits.get(element, 0)
+        if not (element_bit & self.get_list_mask(source_list)):
             logger.error(f"Error for {self.uri} when trying to move {element} from list {source_list} "
                          f"to list {target_list}. The element {element} to be moved was not found "
                          f"in {source_list}. Program aborted.")
             exit(1)
 
         # Move element
-        source.remove(element)
-        target.append(element)
+        self.elements_order.remove(element)
+        self.elements_order.append(element)
+        self.can_mask &= ~element_bit
+        if target_list.startswith("is_"):
+            self.is_mask |= element_bit
+            self.changes_register.register_change(self, element_bit, 0)
+        else:
+            self.not_mask |= element_bit
+            self.changes_register.register_change(self, 0, element_bit)
 
         # Performs consistency check
         self.is_consistent()
@@ -101,8 +354,8 @@ class OntologyDataClass(object):
         # # Updates the class after any moving, so the class can always be in an updated state
         self.update_all_internal_lists_from_gufo()
 
-        logger.debug(f"Element {element} moved successfully from list {source_list} "
-                     f"to list {target_list} in {self.uri}.")
+        logger.debug("Element %s moved successfully from list %s to list %s in %s.", element, source_list,
+                     target_list, self.uri)
 
     def move_element_to_is_list(self, element):
         """ Check if the element to be moved is a type or instance
@@ -116,13 +369,12 @@ class OntologyDataClass(object):
             is analogous to the move_element_to_not_list method.
         """
 
-        logger = initialize_logger()
         target_list = "undefined"
 
         source_list = self.return_containing_list_name(element)
 
         if source_list == "is_type" or source_list == "is_individual":
-            logger.debug(f"Element {element} already in {source_list} for {self.uri}. No moving is necessary.")
+            logger.debug("Element %s already in %s for %s. No moving is necessary.", element, source_list, self.uri)
         else:
             if source_list == "can_type":
                 target_list = "is_type"
@@ -150,13 +402,12 @@ class OntologyDataClass(object):
             is analogous to the move_element_to_is_list method.
         """
 
-        logger = initialize_logger()
         target_list = "undefined"
 
         source_list = self.return_containing_list_name(element)
 
         if source_list == "not_type" or source_list == "not_individual":
-            logger.debug(f"Element {element} already in {source_list} for {self.uri}. No moving is necessary.")
+            logger.debug("Element %s already in %s for %s. No moving is necessary.", element, source_list, self.uri)
         else:
             if source_list == "can_type":
                 target_list = "not_type"
@@ -188,21 +439,19 @@ class OntologyDataClass(object):
     def return_containing_list_name(self, element):
         """ Verify to which of the dataclass lists the element belongs and returns the list name. """
 
-        logger = initialize_logger()
-        containing_list_name = "not set"
-
-        if element in self.is_type:
-            containing_list_name = "is_type"
-        elif element in self.is_individual:
-            containing_list_name = "is_individual"
-        elif element in self.can_type:
-            containing_list_name = "can_type"
-        elif element in self.can_individual:
-            containing_list_name = "can_individual"
-        elif element in self.not_type:
-            containing_list_name = "not_type"
-        elif element in self.not_individual:
-            containing_list_name = "not_individual"
+        element_bit = self.gufo_bit_index.bits.get(element, 0)
+
+        if element_bit & self.gufo_bit_index.types_mask:
+            hierarchy = "type"
+        else:
+            hierarchy = "individual"
+
+        if element_bit & self.is_mask:
+            containing_list_name = "is_" + hierarchy
+        elif element_bit & self.can_mask:
+            containing_list_name = "can_" + hierarchy
+        elif element_bit & self.not_mask:
+            containing_list_name = "not_" + hierarchy
         else:
             logger.error(f"Element {element} does not belong to any list for {self.uri}. Program aborted.")
             exit(1)
@@ -211,12 +460,8 @@ class OntologyDataClass(object):
 
     def sort_all_internal_lists(self):
         """ Sorts all internal lists. """
-        self.is_type.sort()
-        self.is_individual.sort()
-        self.can_type.sort()
-        self.can_individual.sort()
-        self.not_type.sort()
-        self.not_individual.sort()
+
+        self.elements_order.sort()
 
     def create_partial_hash(self, input_list):
         """ Creates a hash for a single list inside an Ontology DataClass.
@@ -224,26 +469,12 @@ class OntologyDataClass(object):
         """
 
         partial_hash = input_list
-        list_hash = "not set"
-
-        if input_list == "is_type":
-            list_hash = self.is_type
-        elif input_list == "is_individual":
-            list_hash = self.is_individual
-        elif input_list == "can_type":
-            list_hash = self.can_type
-        elif input_list == "can_individual":
-            list_hash = self.can_individual
-        elif input_list == "not_type":
-            list_hash = self.not_type
-        elif input_list == "not_individual":
-            list_hash = self.not_individual
-        else:
-            logger = initialize_logger()
+
+        if input_list not in LISTS_MASKS:
             logger.error("Unknown list type. Unable to create hash. Program aborted.")
             exit(1)
 
-        for hash_part in list_hash:
+        for hash_part in self.get_list(input_list):
             partial_hash += hash_part
 
         return partial_hash
@@ -260,8 +491,6 @@ class OntologyDataClass(object):
                 - INDIVIDUALS_ONLY: creates a hash with only the three individuals' lists of a dataclass
         """
 
-        # self.sort_all_internal_lists()
-
         hash_is_type = ""
         hash_is_individual = ""
         hash_can_type = ""
@@ -291,160 +520,67 @@ class OntologyDataClass(object):
     def update_all_internal_lists_from_gufo(self):
         """ Update all lists inside the Ontology DataClass using the GUFO Dictionary.
             Perform updates for is lists (type and individual) and for not lists (type and individual using complement)
-        """
-
-        logger = initialize_logger()
-        logger.debug(f"Updating lists for {self.uri} using GUFO.")
 
-        # Run only if there is any possibility for types or individuals (i.e., can list > 0).
-        if len(self.can_type) > 0 or len(self.can_individual) > 0:
-
-            hash_before = 0
-            hash_after = 1
-
-            while hash_before != hash_after:
-                hash_before = self.create_hash()
-
-                # If no element in can_type list, the solution for type was already found.
-                # Update FROM TYPE (IS) LIST
-                if len(self.can_type) > 0:
-                    self.update_type_list_from_gufo()
-                # Update FROM COMPLEMENT LIST
-                if len(self.can_type) > 0:
-                    self.update_complement_type()
-                # Update FROM SUBTYPE LIST
-                if len(self.can_type) > 0:
-                    self.update_type_subtypes_negation()
-
-                # If no element in can_individual list, the solution for individual was already found.
-                # Update FROM INDIVIDUAL (IS) LIST
-                if len(self.can_individual) > 0:
-                    self.update_individual_list_from_gufo()
-                # Update FROM COMPLEMENT LIST
-                if len(self.can_individual) > 0:
-                    self.update_complement_individual()
-                # Update FROM SUBTYPE LIST
-                if len(self.can_individual) > 0:
-                    self.update_individual_subtypes_negation()
-
-                hash_after = self.create_hash()
-
-                if hash_before == hash_after:
-                    logger.debug(f"Hash before equals hash after. Update completed for {self.uri}.")
-                else:
-                    logger.debug(f"Hash before NOT equals hash after. Continuing update for {self.uri}.")
-
-    def update_type_list_from_gufo(self):
-        """ Update the type list of an Ontology DataClass using the GUFO dictionary.
-            This method is analogous to the update_individual_list_from_gufo method.
-        """
-
-        for is_type in self.is_type:
-            new_is = self.gufo_dictionary["types"][is_type]["is_list"]
-            new_not = self.gufo_dictionary["types"][is_type]["not_list"]
-            self.move_list_of_elements_to_is_list(new_is)
-            self.move_list_of_elements_to_not_list(new_not)
-
-    def update_individual_list_from_gufo(self):
-        """ Update the individual list of an Ontology DataClass using the GUFO dictionary.
-            This method is analogous to the update_type_list_from_gufo method.
-        """
-        for is_individual in self.is_individual:
-            new_is = self.gufo_dictionary["individuals"][is_individual]["is_list"]
-            new_not = self.gufo_dictionary["individuals"][is_individual]["not_list"]
-            self.move_list_of_elements_to_is_list(new_is)
-            self.move_list_of_elements_to_not_list(new_not)
-
-    def update_complement_type(self):
-        """ for all elements in ontology not_list:
-                the ontology dataclass element must be at list of dict keys AND
-                list require_is must be subset of list is_type AND
-                list require_not must be subset of list not_type, THEN
-                    if all conditions are met, move the results to is_type
-            Analogous to method update_complement_individual.
+            The updates are not performed one by one: the final state of each hierarchy is read from the closure table
+            compiled from the GUFO dictionary (see GufoBitIndex.calculate_closure).
         """
 
-        list_complement_keys = list(self.gufo_dictionary["complements"].keys())
-
-        for not_type in self.not_type:
-            # Condition 1: the ontology dataclass element must be at list of dict keys
-            if not_type not in list_complement_keys:
-                continue
-            # Condition 2: list require_is must be subset of list is_type
-            if not set(self.gufo_dictionary["complements"][not_type]["require_is"]).issubset(set(self.is_type)):
-                continue
-            # Condition 3: list require_not must be subset of list not_type
-            if not set(self.gufo_dictionary["complements"][not_type]["require_not"]).issubset(set(self.not_type)):
-                continue
-
-            self.move_list_of_elements_to_is_list(self.gufo_dictionary["complements"][not_type]["result"])
-
-    def update_complement_individual(self):
-        """ for all elements in ontology not_list:
-                the ontology dataclass element must be at list of dict keys AND
-                list require_is must be subset of list is_individual AND
-                list require_not must be subset of list not_individual, THEN
-                    if all conditions are met, move the results to is_type
-            Analogous to method update_complement_individual.
-        """
+        logger.debug("Updating lists for %s using GUFO.", self.uri)
 
-        list_complement_keys = list(self.gufo_dictionary["complements"].keys())
-
-        for not_individual in self.not_individual:
-            # Condition 1: the ontology dataclass element must be at list of dict keys
-            if not_individual not in list_complement_keys:
-                continue
-            # Condition 2: list require_is must be subset of list is_individual
-            if not set(self.gufo_dictionary["complements"][not_individual]["require_is"]).issubset(
-                    set(self.is_individual)):
-                continue
-            # Condition 3: list require_not must be subset of list not_individual
-            if not set(self.gufo_dictionary["complements"][not_individual]["require_not"]) \
-                    .issubset(set(self.not_individual)):
-                continue
-
-            self.move_list_of_elements_to_is_list(self.gufo_dictionary["complements"][not_individual]["result"])
-
-    def update_type_subtypes_negation(self):
-        """ Update the "is list" of an Ontology DataClass using the GUFO dictionary.
-
-            General description (for types and individuals - however this method applies only to types):
-            If the dataclass has in its "not lists" one of the types of the dict keys,
-            then the dataclass is also not o the types of the keys' lists. E.g., if a dataclass
-            is not a gufo:IntrinsicAspect, then it is also not a gufo:IntrinsicMode or a gufo:Quality.
+        # Run only if there is any possibility for types or individuals (i.e., can list > 0).
+        if not self.can_mask:
+            return
 
-            Subtypes assertions are already performed on methods update_(type|individual)_list_from_gufo
-            Analogous to method update_individual_subtypes_negation.
+        new_is_mask = 0
+        new_not_mask = 0
+        moved_elements = []
 
-        """
+        for hierarchy_mask in [self.gufo_bit_index.types_mask, self.gufo_bit_index.individuals_mask]:
+            closure = self.gufo_bit_index.get_closure(self.is_mask, self.not_mask, hierarchy_mask)
 
-        list_subtypes_keys = list(self.gufo_dictionary["subtypes"].keys())
-
-        for not_type in self.not_type:
+            if closure is None:
+                logger.info(f"Inconsistency found. Error when trying to update the lists of {self.uri} using GUFO. "
+                            f"The elements to be moved were not found in the CAN list. Program aborted.")
+                raise Exception("INCONSISTENCY FOUND!")
 
-            # Condition: the ontology dataclass element must be at list of dict keys
-            if not_type in list_subtypes_keys:
-                # Move all the key's list elements to the dataclass not list
-                self.move_list_of_elements_to_not_list(self.gufo_dictionary["subtypes"][not_type])
+            new_is_mask |= closure[0]
+            new_not_mask |= closure[1]
+            if closure != (self.is_mask & hierarchy_mask, self.not_mask & hierarchy_mask):
+                moved_elements += self.gufo_bit_index.get_closure_order(self.is_mask, self.not_mask, hierarchy_mask)
 
-    def update_individual_subtypes_negation(self):
-        """ Update the "is list" of an Ontology DataClass using the GUFO dictionary.
+        self.apply_gufo_masks(new_is_mask, new_not_mask, moved_elements)
 
-            General description (for types and individuals - however this method applies only to individuals):
-            If the dataclass has in its "not lists" one of the types of the dict keys,
-            then the dataclass is also not o the types of the keys' lists. E.g., if a dataclass
-            is not a gufo:IntrinsicAspect, then it is also not a gufo:IntrinsicMode or a gufo:Quality.
+        logger.debug("Update completed for %s.", self.uri)
 
-            Subtypes assertions are already performed on methods update_(type|individual)_list_from_gufo
-            Analogous to method update_type_subtypes_negation.
+    def apply_gufo_masks(self, new_is_mask, new_not_mask, moved_elements=None):
+        """ Moves all elements of new_is_mask to the IS lists and all elements of new_not_mask to the NOT lists.
+            Elements already in the target list are ignored. As in move_element_to_is_list and
+            move_element_to_not_list, an exception is raised if an element is not in a CAN list.
 
+            The elements are inserted in their target lists in the order of moved_elements, if received, or in the
+            order of the GUFO elements list.
         """
 
-        list_subtypes_keys = list(self.gufo_dictionary["subtypes"].keys())
-
-        for not_individual in self.not_individual:
-
-            # Condition: the ontology dataclass element must be at list of dict keys
-            if not_individual in list_subtypes_keys:
-                # Move all the key's list elements to the dataclass not list
-                self.move_list_of_elements_to_not_list(self.gufo_dictionary["subtypes"][not_individual])
+        new_is_mask &= ~self.is_mask
+        new_not_mask &= ~self.not_mask
+
+        if (new_is_mask & (self.not_mask | new_not_mask)) or (new_not_mask & self.is_mask):
+            logger.info(f"Inconsistency found. Error when trying to update the lists of {self.uri} using GUFO. "
+                        f"The elements to be moved were not found in the CAN list. Program aborted.")
+            raise Exception("INCONSISTENCY FOUND!")
+
+        if new_is_mask or new_not_mask:
+            moved_mask = new_is_mask | new_not_mask
+            bits = self.gufo_bit_index.bits
+            if moved_elements is None:
+                moved_elements = self.gufo_bit_index.get_elements_list(moved_mask)
+            self.elements_order = [element for element in self.elements_order if not bits[element] & moved_mask] + \
+                [element for element in moved_elements if bits[element] & moved_mask]
+            self.can_mask &= ~(new_is_mask | new_not_mask)
+            self.is_mask |= new_is_mask
+            self.not_mask |= new_not_mask
+            self.changes_register.register_change(self, new_is_mask, new_not_mask)
+            self.is_consistent()
+
+        if new_is_mask:
+            self.clear_incompleteness()
@@ -0,0 +1,273 @@
+""" Definition of the dataclass that holds an in-memory index of the taxonomy (rdfs:subClassOf relations) of the
+    ontology being evaluated. It is built once per execution, so that rules and propagations do not need to query
+    the RDFLib graph.
+"""
+from dataclasses import dataclass, field
+
+from rdflib import RDFS, URIRef
+
+from modules.tester.logger_config import initialize_logger
+
+logger = initialize_logger()
+
+
+@dataclass
+class TaxonomyIndex(object):
+    """ Each class of the taxonomy is interned as an integer id, which is its position in the nodes list.
+
+    parents and children contain, for each id, the list of ids of the direct superclasses and of the direct subclasses
+    of the class, in the same order in which they are returned by the graph.
+
+    roots_mask and leaves_mask are bitsets in which the bit 1 << id is set if the class with that id is a root or a
+    leaf class, respectively.
+
+    ancestors_masks and descendants_masks contain, for each id, the bitset of all direct and indirect superclasses and
+    subclasses of the class. components contains, for each id, the id of the connected component of the class (the
+    position of its bitset in components_masks). As the taxonomy does not change during an execution, they are
+    calculated only once by compile_closures.
+
+    cycles is the list of cycles of rdfs:subClassOf relations found in the taxonomy. Each cycle is the list of the URIs
+    of the classes that are superclasses and subclasses of each other.
+    """
+
+    nodes: list[str] = field(default_factory=list[str])
+    ids: dict = field(default_factory=dict)
+    parents: list[list[int]] = field(default_factory=list[list[int]])
+    children: list[list[int]] = field(default_factory=list[list[int]])
+    roots_mask: int = 0
+    leaves_mask: int = 0
+    ancestors_masks: list[int] = field(default_factory=list[int], repr=False)
+    descendants_masks: list[int] = field(default_factory=list[int], repr=False)
+    components: list[int] = field(default_factory=list[int], repr=False)
+    components_masks: list[int] = field(default_factory=list[int], repr=False)
+    cycles: list[list[str]] = field(default_factory=list[list[str]])
+
+    def get_ids_mask(self, uris_list):
+        """ Returns the bitset of the ids of all classes in the uris_list that are in the index. """
+
+        mask = 0
+
+        for uri in uris_list:
+            if uri in self.ids:
+                mask |= 1 << self.ids[uri]
+
+        return mask
+
+    def get_superclasses(self, element):
+        """ Returns a list of all direct superclasses of the given element (URI string).
+            Returns an empty list if the element is not in the index. Analogous to function get_subclasses.
+        """
+
+        if element not in self.ids:
+            return []
+
+        return [self.nodes[parent_id] for parent_id in self.parents[self.ids[element]]]
+
+    def get_subclasses(self, element):
+        """ Returns a list of all direct subclasses of the given element (URI string).
+            Returns an empty list if the element is not in the index. Analogous to function get_superclasses.
+        """
+
+        if element not in self.ids:
+            return []
+
+        return [self.nodes[child_id] for child_id in self.children[self.ids[element]]]
+
+    def get_reachable_mask(self, element, adjacency_lists):
+        """ Returns the bitset of the ids of all classes reachable from the element (URI string) navigating through the
+            received adjacency lists (e.g., parents, children or both). The element itself is not included, unless it
+            is reachable from itself.
+        """
+
+        reachable_mask = 0
+
+        if element not in self.ids:
+            return reachable_mask
+
+        nodes_to_visit = [self.ids[element]]
+
+        while nodes_to_visit:
+            node_id = nodes_to_visit.pop()
+            for adjacency_list in adjacency_lists:
+                for neighbour_id in adjacency_list[node_id]:
+                    if not (reachable_mask & (1 << neighbour_id)):
+                        reachable_mask |= 1 << neighbour_id
+                        nodes_to_visit.append(neighbour_id)
+
+        return reachable_mask
+
+    def get_uris(self, ids_mask):
+        """ Returns the list of URIs of the classes whose ids are in the ids_mask, in the order of the ids. """
+
+        uris_list = []
+
+        while ids_mask:
+            lowest_bit = ids_mask & -ids_mask
+            uris_list.append(self.nodes[lowest_bit.bit_length() - 1])
+            ids_mask ^= lowest_bit
+
+        return uris_list
+
+    def compile_closure_masks(self, adjacency_list):
+        """ Returns, for each id, the bitset of all ids reachable from it navigating through the adjacency_list.
+
+            The ids are processed in topological order (Kahn's algorithm), so the bitset of each id is the union of the
+            bitsets of its neighbours. Ids that are never ready (i.e., in or after a cycle) are calculated by traversal.
+        """
+
+        closure_masks = [None] * len(self.nodes)
+        pending_neighbours = [len(neighbours) for neighbours in adjacency_list]
+        dependants = [[] for _ in self.nodes]
+
+        for node_id, neighbours in enumerate(adjacency_list):
+            for neighbour_id in neighbours:
+                dependants[neighbour_id].append(node_id)
+
+        ready_ids = [node_id for node_id, pending in enumerate(pending_neighbours) if pending == 0]
+
+        while ready_ids:
+            node_id = ready_ids.pop()
+            closure_mask = 0
+            for neighbour_id in adjacency_list[node_id]:
+                closure_mask |= (1 << neighbour_id) | closure_masks[neighbour_id]
+            closure_masks[node_id] = closure_mask
+
+            for dependant_id in dependants[node_id]:
+                pending_neighbours[dependant_id] -= 1
+                if pending_neighbours[dependant_id] == 0:
+                    ready_ids.append(dependant_id)
+
+        for node_id, closure_mask in enumerate(closure_masks):
+            if closure_mask is None:
+                closure_masks[node_id] = self.get_reachable_mask(self.nodes[node_id], [adjacency_list])
+
+        return closure_masks
+
+    def compile_closures(self):
+        """ Calculates the ancestors and descendants bitsets and the connected components of all classes. """
+
+        self.ancestors_masks = self.compile_closure_masks(self.parents)
+        self.descendants_masks = self.compile_closure_masks(self.children)
+
+        self.components = [None] * len(self.nodes)
+        self.components_masks = []
+
+        for node_id, node in enumerate(self.nodes):
+            if self.components[node_id] is None:
+                component_mask = self.get_reachable_mask(node, [self.parents, self.children]) | (1 << node_id)
+                for component_node in self.get_uris(component_mask):
+                    self.components[self.ids[component_node]] = len(self.components_masks)
+                self.components_masks.append(component_mask)
+
+        # A class is in a cycle if it is its own ancestor. Its cycle contains all its ancestors that are descendants.
+        cycles_masks = []
+        for node_id in range(len(self.nodes)):
+            if self.ancestors_masks[node_id] & (1 << node_id):
+                cycle_mask = self.ancestors_masks[node_id] & self.descendants_masks[node_id]
+                if cycle_mask not in cycles_masks:
+                    cycles_masks.append(cycle_mask)
+        self.cycles = [self.get_uris(cycle_mask) for cycle_mask in cycles_masks]
+
+    def get_all_superclasses(self, element):
+        """ Returns a list of all direct and indirect superclasses of the given element (URI string), without
+            repetitions and without the own element (even if it is in a cycle).
+            Analogous to function get_all_subclasses.
+        """
+
+        if element not in self.ids:
+            return []
+
+        return self.get_uris(self.ancestors_masks[self.ids[element]] & ~(1 << self.ids[element]))
+
+    def get_all_subclasses(self, element):
+        """ Returns a list of all direct and indirect subclasses of the given element (URI string), without
+            repetitions and without the own element (even if it is in a cycle).
+            Analogous to function get_all_superclasses.
+        """
+
+        if element not in self.ids:
+            return []
+
+        return self.get_uris(self.descendants_masks[self.ids[element]] & ~(1 << self.ids[element]))
+
+    def get_related_roots(self, element):
+        """ Returns a list of all root classes that are superclasses of the given element (URI string).
+            Analogous to function get_related_leaves.
+        """
+
+        if element not in self.ids:
+            return []
+
+        return self.get_uris(self.ancestors_masks[self.ids[element]] & self.roots_mask)
+
+    def get_related_leaves(self, element):
+        """ Returns a list of all leaf classes that are subclasses of the given element (URI string).
+            Analogous to function get_related_roots.
+        """
+
+        if element not in self.ids:
+            return []
+
+        return self.get_uris(self.descendants_masks[self.ids[element]] & self.leaves_mask)
+
+    def get_all_related_nodes(self, element):
+        """ Returns a list of all classes that are directly or indirectly related to the given element (URI string).
+            I.e., all classes in the same connected component of the element.
+            The returned list does not include the own element.
+        """
+
+        if element not in self.ids:
+            return []
+
+        element_id = self.ids[element]
+
+        return self.get_uris(self.components_masks[self.components[element_id]] & ~(1 << element_id))
+
+    def is_root(self, element):
+        """ Returns True if the element (URI string) is a root class. """
+
+        return element in self.ids and bool(self.roots_mask & (1 << self.ids[element]))
+
+    def is_leaf(self, element):
+        """ Returns True if the element (URI string) is a leaf class. """
+
+        return element in self.ids and bool(self.leaves_mask & (1 << self.ids[element]))
+
+
+def build_taxonomy_index(ontology_graph, nodes_list):
+    """ Builds the TaxonomyIndex of the ontology_graph for the classes of the nodes_list (with keys all, roots and
+        leaves). Only relations between classes of the nodes_list are indexed.
+    """
+
+    logger.debug("Building taxonomy index...")
+
+    taxonomy_index = TaxonomyIndex(nodes=list(nodes_list["all"]))
+
+    for node_id, node in enumerate(taxonomy_index.nodes):
+        taxonomy_index.ids[node] = node_id
+
+    for node in taxonomy_index.nodes:
+        node_ref = URIRef(node)
+
+        # The n3 representation is used as in the functions get_superclasses and get_subclasses of utils_graph.py
+        node_parents = [taxonomy_index.ids[obj.n3()[1:-1]] for obj in ontology_graph.objects(node_ref, RDFS.subClassOf)
+                        if obj.n3()[1:-1] in taxonomy_index.ids]
+        node_children = [taxonomy_index.ids[subj.n3()[1:-1]]
+                         for subj in ontology_graph.subjects(RDFS.subClassOf, node_ref)
+                         if subj.n3()[1:-1] in taxonomy_index.ids]
+
+        taxonomy_index.parents.append(node_parents)
+        taxonomy_index.children.append(node_children)
+
+    taxonomy_index.roots_mask = taxonomy_index.get_ids_mask(nodes_list["roots"])
+    taxonomy_index.leaves_mask = taxonomy_index.get_ids_mask(nodes_list["leaves"])
+    taxonomy_index.compile_closures()
+
+    # Reported with the OntCatOWL Tester logger, as the handlers of the OntCatOWL logger only emit errors.
+    if taxonomy_index.cycles:
+        logger.warning(f"{len(taxonomy_index.cycles)} cycle(s) of rdfs:subClassOf relations found in the taxonomy. "
+                       f"Classes in each cycle: {taxonomy_index.cycles}.")
+
+    logger.debug("Taxonomy index successfully built with %s classes.", len(taxonomy_index.nodes))
+
+    return taxonomy_index
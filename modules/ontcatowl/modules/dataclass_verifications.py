@@ -1,17 +1,18 @@
 """ This module implements functions for validate Ontology DataClasses. """
 
 from modules.tester.logger_config import initialize_logger
-from modules.tester.utils_general import has_duplicates
+
+logger = initialize_logger()
 
 
 def verify_duplicates_in_lists_ontology(ontology_dataclass):
-    """ No same string must be in two lists at the same time. """
+    """ No same string must be in two lists at the same time. I.e., the IS, CAN and NOT masks must not overlap. """
 
-    logger = initialize_logger()
-    merged_list = ontology_dataclass.is_type + ontology_dataclass.is_individual + ontology_dataclass.can_type + \
-                  ontology_dataclass.can_individual + ontology_dataclass.not_type + ontology_dataclass.not_individual
+    is_mask = ontology_dataclass.is_mask
+    can_mask = ontology_dataclass.can_mask
+    not_mask = ontology_dataclass.not_mask
 
-    if has_duplicates(merged_list):
+    if (is_mask & can_mask) or (is_mask & not_mask) or (can_mask & not_mask):
         logger.error(f"INCONSISTENCY DETECTED: Same element in two lists for {ontology_dataclass.uri}")
         exit(1)
 
@@ -19,7 +20,6 @@ def verify_duplicates_in_lists_ontology(ontology_dataclass):
 def verify_all_ontology_dataclasses_consistency(ontology_dataclass_list):
     """ Calls the consistency verification of all elements in a list of Ontology DataClasses. """
 
-    logger = initialize_logger()
     logger.debug("Initializing consistency checking for all ontology dataclasses...")
 
     for ontology_dataclass in ontology_dataclass_list:
@@ -31,7 +31,6 @@ def verify_all_ontology_dataclasses_consistency(ontology_dataclass_list):
 def updates_all_list_ontology_dataclasses(ontology_dataclass_list):
     """ Updates all the list of ontology dataclasses. """
 
-    logger = initialize_logger()
     logger.debug("Updating all ontology elements in the dataclass list ...")
 
     for ontology_dataclass in ontology_dataclass_list:
@@ -6,6 +6,8 @@ from rdflib import URIRef, RDF, RDFS, OWL, BNode
 from modules.tester.logger_config import initialize_logger
 from modules.tester.utils_rdf import get_ontology_uri
 
+logger = initialize_logger()
+
 
 def save_ontology_gufo_statements(dataclass_list, ontology_graph, restriction):
     """ Receives the list of dataclasses and use its information for creating new statements in the ontology graph.
@@ -84,8 +86,6 @@ def save_ontology_file(end_date_time, ontology_graph, configurations):
     If import_gufo parameter is set as True, the saved output is going to import the GUFO ontology.
     """
 
-    logger = initialize_logger()
-
     logger.info("Saving the output ontology file...")
 
     # Creating report file
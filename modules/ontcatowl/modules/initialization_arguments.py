@@ -4,11 +4,12 @@ import argparse
 
 from modules.tester.logger_config import initialize_logger
 
+logger = initialize_logger()
+
 
 def treat_arguments(software_acronym, software_name, software_version, software_url):
     """ Treats user ontologies arguments. """
 
-    logger = initialize_logger()
     logger.debug("Parsing arguments...")
 
     about_message = software_acronym + " - version " + software_version
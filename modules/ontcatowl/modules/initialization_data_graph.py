@@ -1,22 +1,28 @@
 """ Initialization of node lists """
 
+from modules.ontcatowl.modules.dataclass_definitions_taxonomy import build_taxonomy_index
 from modules.ontcatowl.modules.initialization_data_ontology_dataclass import get_list_of_all_classes_no_gufo
 from modules.tester.logger_config import initialize_logger
 from modules.tester.utils_graph import get_list_root_classes, get_list_leaf_classes
 
+logger = initialize_logger()
+
 
 def initialize_nodes_lists(ontology_graph):
     """ Return lists of different types of classes (string with the class URI) for the ontologies ontology to be used
         in other functions. This lists of classes must be initializated and, after that, not be edited anymore.
+
+        The key taxonomy_index contains the TaxonomyIndex built from these lists, which must be used for navigating
+        through the taxonomy instead of querying the graph.
     """
-    logger = initialize_logger()
     logger.debug("Initializing list of Ontology nodes...")
 
-    nodes = {"all": [], "roots": [], "leaves": []}
+    nodes = {"all": [], "roots": [], "leaves": [], "taxonomy_index": None}
 
     nodes["all"] = get_list_of_all_classes_no_gufo(ontology_graph)
     nodes["roots"] = get_list_root_classes(ontology_graph, nodes["all"])
     nodes["leaves"] = get_list_leaf_classes(ontology_graph, nodes["all"])
+    nodes["taxonomy_index"] = build_taxonomy_index(ontology_graph, nodes)
 
     logger.debug("List of Ontology concepts successfully initialized.")
 
@@ -3,16 +3,41 @@
 - Validate if the loaded data is correct.
 """
 
+import csv
+import os
+
 import yaml
 from yaml import SafeLoader
 
+from modules.ontcatowl.modules.dataclass_definitions_gufo import get_gufo_bit_index
+from modules.tester.hash_functions import generate_sha256_hash
 from modules.tester.logger_config import initialize_logger
 from modules.tester.utils_general import has_duplicates
 
+logger = initialize_logger()
+
 # TODO (@pedropaulofb): These values must be updated when the YAML file is updated.
 NUMBER_CLASSES_TYPES = 14
 NUMBER_CLASSES_INDIVIDUALS = 13
 
+GUFO_DATA_FILE = "modules/ontcatowl/resources/gufo_data.yaml"
+GUFO_CLOSURES_FILE = "modules/ontcatowl/resources/gufo_data_closures.csv"
+GUFO_CLOSURES_HEADER = ["hierarchy_mask", "is_mask", "not_mask", "closure_is_mask", "closure_not_mask"]
+
+# The GUFO dictionary loaded and validated by the current process. Shared by all executions, it must not be modified.
+LOADED_GUFO_DICTIONARY = {"gufo_dictionary": None}
+
+
+def get_gufo_dictionary():
+    """ Returns the GUFO dictionary of the current process. The GUFO YAML resource file is only loaded, validated and
+        compiled (see initialize_gufo_dictionary) in the first call.
+    """
+
+    if LOADED_GUFO_DICTIONARY["gufo_dictionary"] is None:
+        LOADED_GUFO_DICTIONARY["gufo_dictionary"] = initialize_gufo_dictionary()
+
+    return LOADED_GUFO_DICTIONARY["gufo_dictionary"]
+
 
 def initialize_gufo_dictionary():
     """ Loads GUFO Data from a YAML resource file and returns a multi-level dictionary. The dictionary contains:
@@ -50,9 +75,7 @@ def initialize_gufo_dictionary():
                 If the dataclass IS NOT a gufo:Object, than it IS a "gufo:Aspect"
     """
 
-    logger = initialize_logger()
-
-    gufo_data_file = "modules/ontcatowl/resources/gufo_data.yaml"
+    gufo_data_file = GUFO_DATA_FILE
     logger.debug(f"Loading {gufo_data_file} file...")
 
     try:
@@ -65,16 +88,110 @@ def initialize_gufo_dictionary():
         exit(1)
 
     validate_gufo_data(loaded_gufo_data)
+    initialize_gufo_closures(loaded_gufo_data, gufo_data_file)
 
     return loaded_gufo_data
 
     # TODO (@pedropaulofb): In the future the yaml file should be created automatically from the gufo.owl file
 
 
+def initialize_gufo_closures(gufo_data, gufo_data_file):
+    """ Fills the closure table of the GUFO bit index (see GufoBitIndex) used by all ontology dataclasses.
+
+        The compiled table is cached in the GUFO_CLOSURES_FILE, next to the GUFO YAML resource file. The cache is only
+        used if it was generated from a GUFO YAML file with the same sha256 hash. Otherwise, the table is compiled and
+        the cache file is (re)created.
+    """
+
+    gufo_bit_index = get_gufo_bit_index(gufo_data)
+
+    # The table was already loaded or compiled for an identical GUFO dictionary.
+    if gufo_bit_index.is_closures_table_complete:
+        return
+
+    gufo_data_hash = generate_sha256_hash(gufo_data_file)
+
+    if not load_gufo_closures_file(gufo_bit_index, gufo_data_hash):
+        gufo_bit_index.compile_closures()
+        save_gufo_closures_file(gufo_bit_index, gufo_data_hash)
+
+
+def load_gufo_closures_file(gufo_bit_index, gufo_data_hash):
+    """ Loads the closure table from the GUFO_CLOSURES_FILE into the gufo_bit_index.
+        Returns False if the file does not exist, if it was generated from a different GUFO YAML file, or if it is not
+        a valid closure table file (in which case it is treated as a missing cache and recreated by the caller).
+
+        The first row of the file contains the sha256 hash of the GUFO YAML file, the second row is the header and
+        each following row is an entry of the closure table. Inconsistent closures have empty result fields.
+    """
+
+    try:
+        with open(GUFO_CLOSURES_FILE, encoding='utf-8', newline='') as f:
+            csv_reader = csv.reader(f)
+
+            if next(csv_reader, []) != ["gufo_data_sha256", gufo_data_hash]:
+                logger.debug(f"Cached file {GUFO_CLOSURES_FILE} is outdated.")
+                return False
+
+            if next(csv_reader, []) != GUFO_CLOSURES_HEADER:
+                raise ValueError("unexpected header")
+
+            closures = {}
+            for row in csv_reader:
+                if len(row) != len(GUFO_CLOSURES_HEADER):
+                    raise ValueError(f"unexpected number of fields in row {row}")
+                key = (int(row[0]), int(row[1]), int(row[2]))
+                closures[key] = (int(row[3]), int(row[4])) if row[3] else None
+    except OSError:
+        logger.debug(f"Cached file {GUFO_CLOSURES_FILE} not found.")
+        return False
+    except (ValueError, IndexError) as error:
+        logger.warning(f"Cached file {GUFO_CLOSURES_FILE} is invalid and is going to be recreated.\n"
+                       f"Error reported: {error}")
+        return False
+
+    gufo_bit_index.closures.update(closures)
+    gufo_bit_index.is_closures_table_complete = True
+    logger.debug(f"GUFO closure table successfully loaded from {GUFO_CLOSURES_FILE}.")
+
+    return True
+
+
+def save_gufo_closures_file(gufo_bit_index, gufo_data_hash):
+    """ Saves the closure table of the gufo_bit_index into the GUFO_CLOSURES_FILE.
+        As the file is only a cache, failing to save it does not abort the program.
+
+        The table is written in a temporary file that then replaces the GUFO_CLOSURES_FILE, so that processes that
+        save and load the file at the same time (e.g., parallel workers with no cached file) never read a partial file.
+    """
+
+    temporary_file = f"{GUFO_CLOSURES_FILE}.{os.getpid()}.tmp"
+
+    try:
+        with open(temporary_file, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["gufo_data_sha256", gufo_data_hash])
+            writer.writerow(GUFO_CLOSURES_HEADER)
+            for key, closure in gufo_bit_index.closures.items():
+                if closure is None:
+                    writer.writerow([*key, "", ""])
+                else:
+                    writer.writerow([*key, *closure])
+        os.replace(temporary_file, GUFO_CLOSURES_FILE)
+    except OSError as error:
+        logger.warning(f"Could not save the GUFO closure table in {GUFO_CLOSURES_FILE}.\n"
+                       f"System error reported: {error}")
+        try:
+            os.remove(temporary_file)
+        except OSError:
+            pass
+    else:
+        logger.debug(f"GUFO closure table successfully saved in {GUFO_CLOSURES_FILE}.")
+
+
 def validate_gufo_data(gufo_data):
     """ Validate the GUFO data loaded from the YAML resource file. """
 
-    logger = initialize_logger()
     logger.debug("Performing validation of the GUFO data loaded from the YAML resource file...")
 
     # Verify if only the four necessary 1st level entries were loaded.
@@ -116,8 +233,6 @@ def validate_gufo_data(gufo_data):
 def verify_loaded_1st_level_entries(gufo_data, entry):
     """ Verify if the argument hierarchy was loaded. """
 
-    logger = initialize_logger()
-
     if entry not in gufo_data.keys():
         logger.error(f"Data provided in YAML resource file is invalid: "
                      f"{entry.upper()} 1ST LEVEL ENTRY not found. Exiting program.")
@@ -126,7 +241,6 @@ def verify_loaded_1st_level_entries(gufo_data, entry):
 
 def verify_num_classes_hierarchy(gufo_data, hierarchy):
     """ Verify if the number of classes in the argument hierarchy is the expected number. """
-    logger = initialize_logger()
 
     number_classes = expected_number(hierarchy)
 
@@ -143,7 +257,6 @@ def verify_num_items_classes(gufo_data, hierarchy):
     """ For each class in the argument hierarchy, verify if the sum of the items in its lists
     equals the expected number. """
 
-    logger = initialize_logger()
     number_classes = expected_number(hierarchy)
 
     classes_list = list(gufo_data[hierarchy].keys())
@@ -165,7 +278,6 @@ def verify_num_items_classes(gufo_data, hierarchy):
 
 def verify_repeated_classes_hierarchies(gufo_data, hierarchy):
     """ For each class in the argument hierarchy, there must be no duplicates (inside a list or between lists). """
-    logger = initialize_logger()
 
     classes_list = list(gufo_data[hierarchy].keys())
 
@@ -185,7 +297,6 @@ def verify_repeated_classes_hierarchies(gufo_data, hierarchy):
 def expected_number(hierarchy):
     """ Return the number of classes expected for the argument hierarchy. """
 
-    logger = initialize_logger()
     number_classes = 0
 
     if hierarchy == "types":
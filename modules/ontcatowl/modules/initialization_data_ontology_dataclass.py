@@ -1,18 +1,27 @@
 """ Module for initializing data read from the ontology to be evaluated """
 import copy
 
-from modules.ontcatowl.modules.dataclass_definitions_ontology import OntologyDataClass
+from rdflib import RDF, RDFS, OWL, Namespace
+
+from modules.ontcatowl.modules.dataclass_definitions_ontology import OntologyDataClass, OntologyDataClassRegistry
 from modules.ontcatowl.modules.logger_config import initialize_logger
 from modules.ontcatowl.modules.utils_rdf import get_list_of_all_classes
 
+logger = initialize_logger()
+
+GUFO_NAMESPACE = Namespace("http://purl.org/nemo/gufo#")
+
+# The last GUFO graph used and the sets of its classes that can be known types and individuals of ontology classes.
+LAST_GUFO_KNOWN_CLASSES = {"gufo_graph": None, "gufo_known_classes": None}
+
 
 def initialize_ontology_dataclasses(ontology_graph, gufo_input_yaml):
-    """ Return an OntologyClass list of all classes in the ontology to be evaluated with its related sub-lists """
+    """ Return an OntologyDataClassRegistry (an indexed list) of all classes in the ontology to be evaluated with its
+        related sub-lists """
 
-    logger = initialize_logger()
     logger.debug("Initializing list of Ontology concepts...")
 
-    ontology_list = []
+    ontology_list = OntologyDataClassRegistry()
     classes_list = get_list_of_all_classes_no_gufo(ontology_graph)
     gufo_can_list_types, gufo_can_list_individuals = get_gufo_possibilities(gufo_input_yaml)
 
@@ -24,13 +33,16 @@ def initialize_ontology_dataclasses(ontology_graph, gufo_input_yaml):
     # - OTHER LISTS (IS and NOT): Empty lists. No value received.
     # - GUFO DICTIONARY: Receives a POINTER (not values) to the dictionary loaded from the gufo_data.yaml file.
     # It is used inside the dataclass for updating the other lists. The information is read-only.
+    # - CHANGES REGISTER: Receives a POINTER to the register of the OntologyDataClassRegistry, shared by all its
+    # dataclasses, which keeps the registry's indexes updated.
 
     for new_class in classes_list:
         new_incompleteness_dict = copy.deepcopy(incompleteness_dict)
         ontology_list.append(OntologyDataClass(uri=new_class, can_type=gufo_can_list_types.copy(),
                                                can_individual=gufo_can_list_individuals.copy(),
                                                gufo_dictionary=gufo_input_yaml,
-                                               incompleteness_info=new_incompleteness_dict))
+                                               incompleteness_info=new_incompleteness_dict,
+                                               changes_register=ontology_list.changes_register))
 
     logger.debug("List of Ontology concepts successfully initialized.")
     return ontology_list
@@ -57,64 +69,51 @@ def get_gufo_possibilities(gufo_input_yaml):
     return can_list_types, can_list_individuals
 
 
-def get_known_gufo_types(united_graph):
-    """ For each class in the ontology_graph, return all its known GUFO TYPES in a tuple format.
-    Returned tuple format is: (ontology_class,gufo_type), being both fields strings.
-    Analogous to get_known_gufo_individuals.
-    """
+def get_gufo_known_classes(gufo_graph):
+    """ Returns a dictionary with the sets of GUFO classes (URIRefs) that are direct or indirect subclasses of
+        gufo:EndurantType (key "types") and of gufo:Endurant (key "individuals"). Only classes declared as owl:Class
+        in the GUFO namespace are considered.
 
-    list_elements = []
-    list_types = []
+        The sets are only calculated if the gufo_graph is different from the last one used.
+    """
 
-    query_string = """
-    PREFIX gufo: <http://purl.org/nemo/gufo#>
-    SELECT DISTINCT ?ontology_element ?element_type
-    WHERE {
-        ?ontology_element rdf:type owl:Class .
-        ?element_type rdf:type owl:Class .
-        ?ontology_element rdf:type ?element_type .
-        ?element_type rdfs:subClassOf+ gufo:EndurantType .
-        FILTER(STRSTARTS(STR(?element_type), STR(gufo:)))
-    } """
+    if LAST_GUFO_KNOWN_CLASSES["gufo_graph"] is not gufo_graph:
+        gufo_known_classes = {}
 
-    query_result = united_graph.query(query_string)
+        for key, gufo_root in [("types", GUFO_NAMESPACE.EndurantType), ("individuals", GUFO_NAMESPACE.Endurant)]:
+            subclasses = set()
+            nodes_to_visit = [gufo_root]
+            while nodes_to_visit:
+                node = nodes_to_visit.pop()
+                for subclass in gufo_graph.subjects(RDFS.subClassOf, node):
+                    if subclass not in subclasses:
+                        subclasses.add(subclass)
+                        nodes_to_visit.append(subclass)
 
-    for row in query_result:
-        list_elements.append(row.ontology_element.n3()[1:-1])
-        list_types.append(row.element_type.n3()[1:-1].replace("http://purl.org/nemo/gufo#", "gufo:"))
+            gufo_known_classes[key] = {subclass for subclass in subclasses
+                                       if str(subclass).startswith(str(GUFO_NAMESPACE))
+                                       and (subclass, RDF.type, OWL.Class) in gufo_graph}
 
-    list_tuples = list(zip(list_elements, list_types))
+        LAST_GUFO_KNOWN_CLASSES["gufo_known_classes"] = gufo_known_classes
+        LAST_GUFO_KNOWN_CLASSES["gufo_graph"] = gufo_graph
 
-    return list_tuples
+    return LAST_GUFO_KNOWN_CLASSES["gufo_known_classes"]
 
 
-def get_known_gufo_individuals(united_graph):
-    """ For each class in the ontology_graph, return all its known GUFO INDIVIDUALS in a tuple format.
-    Returned tuple format is: (ontology_class,gufo_type), being both fields strings.
-    Analogous to get_known_gufo_types.
+def get_known_gufo_elements(ontology_graph, predicate, gufo_classes):
+    """ Returns all known GUFO elements of the classes in the ontology_graph in a tuple format, i.e., the gufo_classes
+    related to the classes through the received predicate (rdf:type for GUFO types and rdfs:subClassOf for GUFO
+    individuals). Returned tuple format is: (ontology_class,gufo_element), being both fields strings.
     """
 
-    list_elements = []
-    list_individuals = []
-
-    query_string = """
-        PREFIX gufo: <http://purl.org/nemo/gufo#>
-        SELECT DISTINCT ?ontology_element ?element_type
-        WHERE {
-            ?ontology_element rdf:type owl:Class .
-            ?element_type rdf:type owl:Class .
-            ?ontology_element rdfs:subClassOf ?element_type .
-            ?element_type rdfs:subClassOf+ gufo:Endurant .
-            FILTER(STRSTARTS(STR(?element_type), STR(gufo:)))
-        } """
-
-    query_result = united_graph.query(query_string)
-
-    for row in query_result:
-        list_elements.append(row.ontology_element.n3()[1:-1])
-        list_individuals.append(row.element_type.n3()[1:-1].replace("http://purl.org/nemo/gufo#", "gufo:"))
+    list_tuples = []
 
-    list_tuples = list(zip(list_elements, list_individuals))
+    # Only the objects of the predicate are scanned, so triples not pointing to GUFO classes are quickly discarded.
+    for gufo_class in ontology_graph.objects(None, predicate, unique=True):
+        if gufo_class in gufo_classes:
+            gufo_element = gufo_class.n3()[1:-1].replace(str(GUFO_NAMESPACE), "gufo:")
+            for ontology_element in ontology_graph.subjects(predicate, gufo_class, unique=True):
+                list_tuples.append((ontology_element.n3()[1:-1], gufo_element))
 
     return list_tuples
 
@@ -126,15 +125,14 @@ def load_known_gufo_information(ontology_graph, gufo_graph, ontology_dataclass_l
     dataclass's can_type (default) list to its is_type list.
     """
 
-    united_graph = gufo_graph + ontology_graph
+    gufo_known_classes = get_gufo_known_classes(gufo_graph)
 
-    list_known_gufo_types = get_known_gufo_types(united_graph)
-    list_known_gufo_individuals = get_known_gufo_individuals(united_graph)
+    list_known_gufo_types = get_known_gufo_elements(ontology_graph, RDF.type, gufo_known_classes["types"])
+    list_known_gufo_individuals = get_known_gufo_elements(ontology_graph, RDFS.subClassOf,
+                                                          gufo_known_classes["individuals"])
 
-    for ontology_dataclass in ontology_dataclass_list:
-        for known_gufo_type in list_known_gufo_types:
-            if known_gufo_type[0] == ontology_dataclass.uri:
-                ontology_dataclass.move_element_to_is_list(known_gufo_type[1])
-        for known_gufo_individual in list_known_gufo_individuals:
-            if known_gufo_individual[0] == ontology_dataclass.uri:
-                ontology_dataclass.move_element_to_is_list(known_gufo_individual[1])
+    # Ontology classes are only the ones in the ontology_dataclass_list (i.e., declared as owl:Class).
+    for known_gufo_element in list_known_gufo_types + list_known_gufo_individuals:
+        ontology_dataclass = ontology_dataclass_list.get_dataclass(known_gufo_element[0])
+        if ontology_dataclass is not None:
+            ontology_dataclass.move_element_to_is_list(known_gufo_element[1])
@@ -5,20 +5,29 @@ import os
 
 from modules.tester.utils_general import get_date_time
 
+LOGGER_NAME = "OntCatOWL"
+
+# Levels of the handlers of the OntCatOWL logger.
+LOGGING_LEVELS = {"console": logging.ERROR, "file": logging.ERROR}
+
 
 def initialize_logger():
-    """ Initialize OntCatOWL Logger. """
+    """ Initialize OntCatOWL Logger. It is called once by each module, which keeps the returned logger in its
+        module-level variable logger.
+
+        The level of the logger is the lowest level of its handlers. Hence, messages that no handler would emit are
+        discarded by the logger's isEnabledFor check, before any record is created or message is formatted.
+    """
 
     # Create a custom logger
-    new_logger = logging.getLogger("OntCatOWL")
-    new_logger.setLevel(logging.DEBUG)
+    new_logger = logging.getLogger(LOGGER_NAME)
 
     # Creates a new logger only if OntCatOWL does not exist
-    if not logging.getLogger("OntCatOWL").hasHandlers():
+    if not new_logger.hasHandlers():
 
         # Creating CONSOLE handler
         console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.ERROR)
+        console_handler.setLevel(LOGGING_LEVELS["console"])
 
         # If directory "/log" does not exist, create it
         log_dir = "logs/"
@@ -29,9 +38,9 @@ def initialize_logger():
                 print(f"Directory {log_dir} could not be created. Program aborted.\n"
                       f"System error reported: {error}")
 
-        # Creating FILE handler
-        file_handler = logging.FileHandler(f"{log_dir}{get_date_time()}.log")
-        file_handler.setLevel(logging.ERROR)
+        # Creating FILE handler. The file is only created when the first message is written.
+        file_handler = logging.FileHandler(f"{log_dir}{get_date_time()}.log", delay=True)
+        file_handler.setLevel(LOGGING_LEVELS["file"])
 
         # Create formatters and add it to handlers
         console_format = logging.Formatter('%(levelname)s - %(message)s')
@@ -43,5 +52,6 @@ def initialize_logger():
         # Add handlers to the logger
         new_logger.addHandler(console_handler)
         new_logger.addHandler(file_handler)
+        new_logger.setLevel(min(LOGGING_LEVELS.values()))
 
     return new_logger
@@ -1,7 +1,38 @@
 """ Functions related to the propagation of modifications in the graph. """
 from modules.ontcatowl.modules.rules_types_actions import perform_rule_actions_types
 from modules.tester.logger_config import initialize_logger
-from modules.tester.utils_graph import get_subclasses, get_superclasses
+
+logger = initialize_logger()
+
+
+def execute_and_propagate(ontology_dataclasses_list, nodes_list, input_node, action_code, list_restrictions,
+                          direction):
+    """ Propagates from a specific node in the received direction ("UP" to the graph's root nodes or "DOWN" to the
+        graph's leaf nodes), executing the action_code in the input_node and in all its ancestors (or descendants) that
+        are not in the list_restrictions.
+
+        The target nodes are obtained at once from the taxonomy closure, so the action is applied in a single batch and
+        each node receives it only once, even if reachable through more than one path or through a cycle.
+
+        Returns the number of classes that were modified by the action.
+    """
+
+    taxonomy_index = nodes_list["taxonomy_index"]
+
+    if direction == "UP":
+        reached_nodes = taxonomy_index.get_all_superclasses(input_node)
+    else:
+        reached_nodes = taxonomy_index.get_all_subclasses(input_node)
+
+    target_nodes = ({input_node} | set(reached_nodes)) - set(list_restrictions)
+
+    logger.debug("Propagating %s from %s to %s nodes: %s.", action_code, input_node, direction, reached_nodes)
+
+    number_changed = perform_rule_actions_types(ontology_dataclasses_list, target_nodes, action_code)
+
+    logger.debug("Propagation of %s from %s modified %s classes.", action_code, input_node, number_changed)
+
+    return number_changed
 
 
 def execute_and_propagate_up(ontology_dataclasses_list, graph, nodes_list, input_node, action_code,
@@ -13,25 +44,15 @@ def execute_and_propagate_up(ontology_dataclasses_list, graph, nodes_list, input
 
         Info: The list_restrictions guarantees that the action_code is not going to be performed to that node, but it
             does not interrupt the propagation for upper nodes.
-    """
 
-    logger = initialize_logger()
+        Returns the number of classes that were modified by the action.
+    """
 
     if list_restrictions is None:
         list_restrictions = []
 
-    # Execute actions if input_node is not in list_restrictions.
-    if input_node not in list_restrictions:
-        perform_rule_actions_types(ontology_dataclasses_list, [input_node], action_code,
-                                   list_restrictions)
-
-    # If input_node is not a root node, propagate to upper nodes.
-    if input_node not in nodes_list["roots"]:
-        list_parent_nodes = get_superclasses(graph, nodes_list["all"], input_node)
-        logger.debug(f"Propagating {action_code} from {input_node} to UP nodes: {list_parent_nodes}.")
-        for parent_node in list_parent_nodes:
-            execute_and_propagate_up(ontology_dataclasses_list, graph, nodes_list, parent_node,
-                                     action_code, list_restrictions)
+    return execute_and_propagate(ontology_dataclasses_list, nodes_list, input_node, action_code, list_restrictions,
+                                 "UP")
 
 
 def execute_and_propagate_down(ontology_dataclasses_list, graph, nodes_list, input_node, action_code,
@@ -43,22 +64,12 @@ def execute_and_propagate_down(ontology_dataclasses_list, graph, nodes_list, inp
 
         Info: The list_restrictions guarantees that the action_code is not going to be performed to that node, but it
             does not interrupt the propagation for upper nodes.
-    """
 
-    logger = initialize_logger()
+        Returns the number of classes that were modified by the action.
+    """
 
     if list_restrictions is None:
         list_restrictions = []
 
-    # Execute actions if input_node is not in list_restrictions.
-    if input_node not in list_restrictions:
-        perform_rule_actions_types(ontology_dataclasses_list, [input_node], action_code,
-                                   list_restrictions)
-
-    # If input_node is not a leaf node, propagate to lower nodes.
-    if input_node not in nodes_list["leaves"]:
-        list_child_nodes = get_subclasses(graph, nodes_list["all"], input_node)
-        logger.debug(f"Propagating {action_code} from {input_node} to DOWN nodes: {list_child_nodes}.")
-        for child_node in list_child_nodes:
-            execute_and_propagate_down(ontology_dataclasses_list, graph, nodes_list, child_node,
-                                       action_code, list_restrictions)
+    return execute_and_propagate(ontology_dataclasses_list, nodes_list, input_node, action_code, list_restrictions,
+                                 "DOWN")
@@ -7,6 +7,8 @@ from modules.ontcatowl.modules.results_printer import generate_incompleteness_ta
     generate_classifications_table
 from modules.tester.logger_config import initialize_logger
 
+logger = initialize_logger()
+
 
 def get_content100(restriction="PRINT_ALL"):
     """ Final Results Report - TABLE OF CONTENTS
@@ -118,7 +120,6 @@ def get_content300_400(result_lists, restriction="PRINT_ALL"):
 
     """
 
-    logger = initialize_logger()
     intro = ""
 
     if result_lists[0] == "Before":
@@ -243,8 +244,6 @@ def get_content600(ontology_dataclass_list, restriction="PRINT_ALL"):
         - "TOTAL_ONLY" - prints only total table.
     """
 
-    logger = initialize_logger()
-
     class_print_information = ""
 
     if restriction == "TYPES_ONLY":
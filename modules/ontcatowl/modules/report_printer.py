@@ -10,6 +10,8 @@ from modules.utils_dataclass import sort_all_ontology_dataclass_list
 from modules.tester.logger_config import initialize_logger
 from modules.tester.utils_general import get_date_time
 
+logger = initialize_logger()
+
 
 def print_report_file(ontology_dataclass_list, start_date_time, end_date_time, end_date_time_out, elapsed_time,
                       global_configurations, before_statistics, after_statistics,
@@ -24,7 +26,6 @@ def print_report_file(ontology_dataclass_list, start_date_time, end_date_time, e
         - "TOTAL_ONLY" - prints only total table.
     """
 
-    logger = initialize_logger()
     logger.info("Printing report of the current state of the ontology dataclass list using markdown syntax ...")
 
     sort_all_ontology_dataclass_list(ontology_dataclass_list)
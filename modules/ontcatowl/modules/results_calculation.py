@@ -5,6 +5,8 @@ from modules.ontcatowl.modules.results_classes import dataclass_statistics, clas
     classifications_statistics, list_classes_by_situation, consolidated_statistics
 from modules.tester.logger_config import initialize_logger
 
+logger = initialize_logger()
+
 # These values must be updated for newer versions of OntCatOWL, after including elements other than Endurants.
 NUMBER_GUFO_TYPES = 14
 NUMBER_GUFO_INDIVIDUALS = 13
@@ -163,8 +165,6 @@ def get_list_totally_unknown_classes(class_statistics_list):
     """ Receives a statistics_list and generate three other lists, grouped in a list_classes_by_situation class.
         All lists there contained are already alphabetically sorted. """
 
-    logger = initialize_logger()
-
     logger.debug("Generating list_totally_unknown_classes ...")
 
     list_classes_totally_unknown_types = []
@@ -196,8 +196,6 @@ def get_list_partially_known_classes(class_statistics_list):
     """ Receives a statistics_list and generate three other lists, grouped in an list_classes_by_situation class.
         All lists there contained are already alphabetically sorted. """
 
-    logger = initialize_logger()
-
     logger.debug("Generating list_partially_known_classes ...")
 
     list_classes_partially_known_types = []
@@ -230,8 +228,6 @@ def get_list_totally_known_classes(class_statistics_list):
     """ Receives a statistics_list and generate three other lists, grouped in an list_classes_by_situation class.
     All lists there contained are already alphabetically sorted. """
 
-    logger = initialize_logger()
-
     logger.debug("Generating list_totally_known_classes ...")
 
     list_classes_totally_known_types = []
@@ -19,6 +19,8 @@ _a = after
 
 from modules.tester.logger_config import initialize_logger
 
+logger = initialize_logger()
+
 
 class dataclass_statistics(object):
     """ Class that contains the statistics for a single dataclass. """
@@ -41,7 +43,6 @@ class list_classes_by_situation(object):
 
     def __init__(self, situation, list_uris_types, list_uris_individuals, list_uris_all):
 
-        logger = initialize_logger()
         if situation == "Totally Unknown" or situation == "Partially Known" or situation == "Totally Known":
             self.situation = situation
             self.list_uris_types = list_uris_types
@@ -92,7 +93,6 @@ class classes_statistics(object):
         total_classes_all = self.tu_classes_all_v + self.pk_classes_all_v + self.tk_classes_all_v
 
         if (total_classes_types + total_classes_indiv + total_classes_all) != (3 * self.total_classes_number):
-            logger = initialize_logger()
             logger.error("Sum of number of classes is incorrect when calculating statistics. Program aborted.")
             exit(1)
 
@@ -131,7 +131,6 @@ class classifications_statistics(object):
 
     def validate(self):
         if self.unknown_classif_total_v + self.known_classif_total_v != self.total_classif_number:
-            logger = initialize_logger()
             logger.error("Sum of number of classifications is incorrect when calculating statistics. Program aborted.")
             exit(1)
 
@@ -209,13 +208,11 @@ class consolidated_statistics(object):
     def validate(self):
 
         if self.classes_stats_b.total_classes_number != self.classes_stats_a.total_classes_number:
-            logger = initialize_logger()
             logger.error("Number of classes must be the same before and after the software execution. "
                          "Program aborted.")
             exit(1)
 
         if self.classif_stats_b.total_classif_number != self.classif_stats_a.total_classif_number:
-            logger = initialize_logger()
             logger.error("Number of classifications must be the same before and after the software execution. "
                          "Program aborted.")
             exit(1)
@@ -5,6 +5,8 @@ from prettytable import PrettyTable, SINGLE_BORDER
 
 from modules.tester.logger_config import initialize_logger
 
+logger = initialize_logger()
+
 
 def generate_times_table(time_register, border_option):
     """ Generates table with aggregated execution times for all rules to be printed. """
@@ -52,8 +54,6 @@ def generate_classes_table(consolidated_statistics, table_option, border_option)
         BORDER OPTIONS can be all values accepted by prettytable lib.
     """
 
-    logger = initialize_logger()
-
     before = consolidated_statistics.classes_stats_b
     after = consolidated_statistics.classes_stats_a
     ba = consolidated_statistics
@@ -149,8 +149,6 @@ def generate_classifications_table(consolidated_statistics, table_option, border
         BORDER OPTIONS can be all values accepted by prettytable lib.
         """
 
-    logger = initialize_logger()
-
     before = consolidated_statistics.classif_stats_b
     after = consolidated_statistics.classif_stats_a
     ba = consolidated_statistics
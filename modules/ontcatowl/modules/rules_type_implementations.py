@@ -4,7 +4,8 @@ from modules.ontcatowl.modules.user_interactions import print_class_types, set_i
     select_class_from_list
 from modules.ontcatowl.modules.utils_dataclass import external_move_to_is_list, get_list_gufo_classification, \
     external_move_list_to_is_list, return_dataclass_from_class_name, get_element_list
-from modules.tester.utils_graph import get_all_related_nodes, get_all_superclasses, get_subclasses, get_superclasses
+
+logger = initialize_logger()
 
 # Frequent GUFO types
 GUFO_KIND = "gufo:Kind"
@@ -35,11 +36,10 @@ def register_incompleteness(rule_code, ontology_dataclass):
 
 def treat_rule_n_r_t(rule_code, ontology_dataclass, configurations):
     """ Implements rule n_r_t for types."""
-    logger = initialize_logger()
 
     if configurations["is_complete"]:
         # ACTION: Report incompleteness
-        if GUFO_KIND in ontology_dataclass.can_type and not check_incompleteness_registered(rule_code,
+        if ontology_dataclass.in_can_list(GUFO_KIND) and not check_incompleteness_registered(rule_code,
                                                                                             ontology_dataclass):
             logger.info(f"An incompleteness detected during rule {rule_code} was solved. "
                         f"The class {ontology_dataclass.uri} had no identity principle and now was set as a gufo:Kind.")
@@ -53,7 +53,7 @@ def treat_rule_n_r_t(rule_code, ontology_dataclass, configurations):
     elif not check_incompleteness_registered(rule_code, ontology_dataclass):
         logger.warning(f"Incompleteness detected during rule {rule_code}! "
                        f"There is no identity principle associated to the class {ontology_dataclass.uri}.")
-        if (not configurations["is_automatic"]) and (GUFO_KIND in ontology_dataclass.can_type):
+        if (not configurations["is_automatic"]) and ontology_dataclass.in_can_list(GUFO_KIND):
             set_interactively_class_as_gufo_type(ontology_dataclass, GUFO_KIND)
             register_incompleteness(rule_code, ontology_dataclass)
 
@@ -97,35 +97,32 @@ def decide_action_rule_ns_s_spe(configurations, number_possibilities, number_nec
 def treat_rule_ns_s_spe(rule_code, ontology_dataclass, list_ontology_dataclasses, graph, nodes_list, configurations):
     """ Implements rule ns_s_spe for types."""
 
-    logger = initialize_logger()
-
     # Get all ontology dataclasses that are reachable from the ontologies dataclass
-    list_all_related_nodes = get_all_related_nodes(graph, nodes_list, ontology_dataclass.uri)
+    list_all_related_nodes = nodes_list["taxonomy_index"].get_all_related_nodes(ontology_dataclass.uri)
 
-    logger.debug(f"Related nodes of {ontology_dataclass.uri} are: {list_all_related_nodes}")
+    logger.debug("Related nodes of %s are: %s", ontology_dataclass.uri, list_all_related_nodes)
 
     # From the previous list, get all the ones that ARE gufo:Kinds
     related_is_kinds_list = get_list_gufo_classification(list_ontology_dataclasses, list_all_related_nodes, "IS",
                                                          GUFO_KIND)
     number_related_kinds = len(related_is_kinds_list)
 
-    logger.debug(f"Related nodes of {ontology_dataclass.uri} that ARE Kinds: {list_all_related_nodes}")
+    logger.debug("Related nodes of %s that ARE Kinds: %s", ontology_dataclass.uri, list_all_related_nodes)
 
     # Get all related classes that CAN be classified as gufo:Kinds
     related_can_kinds_list = get_list_gufo_classification(list_ontology_dataclasses, list_all_related_nodes, "CAN",
                                                           GUFO_KIND)
 
-    logger.debug(f"Related nodes of {ontology_dataclass.uri} that CAN BE Kinds: {list_all_related_nodes}")
+    logger.debug("Related nodes of %s that CAN BE Kinds: %s", ontology_dataclass.uri, list_all_related_nodes)
 
     number_can_kinds_list = len(related_can_kinds_list)
 
     number_possibilities = number_can_kinds_list
     number_necessary = 2 - number_related_kinds
 
-    logger.debug(f"For {ontology_dataclass.uri}: K = {number_related_kinds}, "
-                 f"P = {number_possibilities}, N = {number_necessary} "
-                 f"K list = {related_is_kinds_list} "
-                 f"P list = {related_can_kinds_list} ")
+    logger.debug("For %s: K = %s, P = %s, N = %s K list = %s P list = %s ", ontology_dataclass.uri,
+                 number_related_kinds, number_possibilities, number_necessary, related_is_kinds_list,
+                 related_can_kinds_list)
 
     # The rule is already accomplished, so there is no need to do any action.
     if number_necessary <= 0:
@@ -162,8 +159,6 @@ def treat_rule_ns_s_spe(rule_code, ontology_dataclass, list_ontology_dataclasses
 def interaction_rule_nk_k_sup(ontology_dataclass, list_ontology_dataclasses, list_possibilities):
     """ User interaction for rule nk_k_sup. """
 
-    logger = initialize_logger()
-
     print(f"The following classes were identified as possible identity providers:")
     selected_class = select_class_from_list(list_ontology_dataclasses, list_possibilities)
 
@@ -176,11 +171,9 @@ def interaction_rule_nk_k_sup(ontology_dataclass, list_ontology_dataclasses, lis
 def treat_rule_nk_k_sup(rule_code, ontology_dataclass, list_ontology_dataclasses, graph, nodes_list, configurations):
     """ Implements rule nk_k_sup for types."""
 
-    logger = initialize_logger()
-
     # Get all ontology dataclasses that are directly or indirectly superclasses of ontology_dataclass
-    list_superclasses = get_all_superclasses(graph, nodes_list, ontology_dataclass.uri)
-    logger.debug(f"Superclasses of {ontology_dataclass.uri} are: {list_superclasses}")
+    list_superclasses = nodes_list["taxonomy_index"].get_all_superclasses(ontology_dataclass.uri)
+    logger.debug("Superclasses of %s are: %s", ontology_dataclass.uri, list_superclasses)
 
     # Verify if there is a Kind in the superclass list
     kind_sortals = get_list_gufo_classification(list_ontology_dataclasses, list_superclasses, "IS", GUFO_KIND)
@@ -229,10 +222,9 @@ def treat_rule_nk_k_sup(rule_code, ontology_dataclass, list_ontology_dataclasses
 
 def treat_rule_s_nsup_k(rule_code, ontology_dataclass, graph, nodes_list, configurations):
     """ Implements the treatment of rule n_nsup_k for types. """
-    logger = initialize_logger()
 
     # Get list of all superclasses up to leaves.
-    all_superclasses = get_all_superclasses(graph, nodes_list, ontology_dataclass.uri)
+    all_superclasses = nodes_list["taxonomy_index"].get_all_superclasses(ontology_dataclass.uri)
 
     # CONDITION 2: list of superclasses must be empty
     if len(all_superclasses) != 0:
@@ -254,10 +246,8 @@ def treat_rule_s_nsup_k(rule_code, ontology_dataclass, graph, nodes_list, config
 def treat_rule_ns_sub_r(rule_code, list_ontology_dataclasses, ontology_dataclass, graph, nodes_list):
     """ Implements the treatment of rule ns_sub_r for types. """
 
-    logger = initialize_logger()
-
     # Get list of all direct subclasses of the ontolgy_dataclass
-    direct_subclasses = get_subclasses(graph, nodes_list["all"], ontology_dataclass.uri)
+    direct_subclasses = nodes_list["taxonomy_index"].get_subclasses(ontology_dataclass.uri)
 
     # CONDITION 2: list of subclasses cannot be empty
     if len(direct_subclasses) == 0:
@@ -267,7 +257,7 @@ def treat_rule_ns_sub_r(rule_code, list_ontology_dataclasses, ontology_dataclass
         subclass = return_dataclass_from_class_name(list_ontology_dataclasses, subclass_name)
 
         # If one of the subclasses is not a RigidType, nothing can be asserted for the superclass.
-        if "gufo:RigidType" not in subclass.is_type:
+        if not subclass.in_is_list("gufo:RigidType"):
             break
     else:
         # Only executed when the loop had no break. All subclasses were RigidTypes.
@@ -280,14 +270,12 @@ def treat_rule_ns_sub_r(rule_code, list_ontology_dataclasses, ontology_dataclass
 def treat_rule_nrs_ns_r(rule_code, ontology_dataclass, graph, nodes_list, configurations):
     """ Implements the treatment of rule nrs_ns_r for types. """
 
-    logger = initialize_logger()
-
     # Get all direct superclasses
-    superclasses_list = get_superclasses(graph, nodes_list["all"], ontology_dataclass.uri)
+    superclasses_list = nodes_list["taxonomy_index"].get_superclasses(ontology_dataclass.uri)
 
     # For each superclass, verify the number of direct subclasses. If only one, perform action (else, do nothing).
     for superclass in superclasses_list:
-        superclass_children = get_subclasses(graph, nodes_list["all"], superclass)
+        superclass_children = nodes_list["taxonomy_index"].get_subclasses(superclass)
         number_children = len(superclass_children)
 
         if number_children > 1:
@@ -321,10 +309,8 @@ def treat_rule_nrs_ns_r(rule_code, ontology_dataclass, graph, nodes_list, config
 def treat_rule_ks_sf_in(rule_code, list_ontology_dataclasses, ontology_dataclass, graph, nodes_list):
     """ Implements the treatment of rule ks_sf_in for types. """
 
-    logger = initialize_logger()
-
     # Get all direct superclasses
-    superclasses_list = get_superclasses(graph, nodes_list["all"], ontology_dataclass.uri)
+    superclasses_list = nodes_list["taxonomy_index"].get_superclasses(ontology_dataclass.uri)
 
     # Treating case of root classes
     if len(superclasses_list) == 0:
@@ -336,7 +322,7 @@ def treat_rule_ks_sf_in(rule_code, list_ontology_dataclasses, ontology_dataclass
         if superclass == "ROOT_CLASS":
             number_siblings = 0
         else:
-            siblings_list = get_subclasses(graph, nodes_list["all"], superclass)
+            siblings_list = nodes_list["taxonomy_index"].get_subclasses(superclass)
             siblings_list.remove(ontology_dataclass.uri)
             number_siblings = len(siblings_list)
 
@@ -352,8 +338,7 @@ def treat_rule_ks_sf_in(rule_code, list_ontology_dataclasses, ontology_dataclass
                 for sibling in siblings_list:
                     sibling_dataclass = return_dataclass_from_class_name(list_ontology_dataclasses, sibling)
 
-                    if ("gufo:Sortal" in sibling_dataclass.is_type) or (
-                            "gufo:NonRigidType" in sibling_dataclass.is_type):
+                    if sibling_dataclass.in_is_list("gufo:Sortal") or sibling_dataclass.in_is_list("gufo:NonRigidType"):
                         break
                 else:
                     # Report incompleteness
@@ -1,29 +1,36 @@
 """ Execution of rules actions. """
 from modules.tester.logger_config import initialize_logger
 
+logger = initialize_logger()
+
 
 def perform_rule_actions_types(list_ontology_dataclasses, list_nodes, action, list_restrictions=None):
     """ Runs actions to be performed in propagation functions for enforced rules.
     The actions are informed through the parameter list_actions_code.
+
+    Returns the number of ontology dataclasses that were modified by the action.
     """
 
     if list_restrictions is None:
         list_restrictions = []
 
-    logger = initialize_logger()
+    # Condition 1: ontology dataclass must be in the list of nodes
+    list_nodes_uris = list_ontology_dataclasses.sort_uris(uri for uri in set(list_nodes)
+                                                          if list_ontology_dataclasses.get_dataclass(uri) is not None)
 
-    for ontology_dataclass in list_ontology_dataclasses:
+    number_changed = 0
 
-        # Condition 1: ontology dataclass must be in the list of nodes
-        if ontology_dataclass.uri not in list_nodes:
-            continue
+    for ontology_dataclass_uri in list_nodes_uris:
 
         # Condition 2: ontology dataclass must not be in the list of restrictions
-        if ontology_dataclass.uri in list_restrictions:
+        if ontology_dataclass_uri in list_restrictions:
             continue
 
+        ontology_dataclass = list_ontology_dataclasses.get_dataclass(ontology_dataclass_uri)
+
         # Conditions met. Executing.
-        logger.debug(f"Executing {action} in {ontology_dataclass}...")
+        logger.debug("Executing %s in %s...", action, ontology_dataclass)
+        previous_masks = (ontology_dataclass.is_mask, ontology_dataclass.not_mask)
 
         if (action == "k_s_sup") or (action == "ns_s_sup"):
             ontology_dataclass.move_element_to_not_list("gufo:Sortal")
@@ -41,4 +48,9 @@ def perform_rule_actions_types(list_ontology_dataclasses, list_nodes, action, li
             ontology_dataclass.move_element_to_not_list("gufo:RigidType")
             ontology_dataclass.move_element_to_not_list("gufo:SemiRigidType")
 
-        logger.debug(f"Successfully executed {action} in {ontology_dataclass}.")
+        if previous_masks != (ontology_dataclass.is_mask, ontology_dataclass.not_mask):
+            number_changed += 1
+
+        logger.debug("Successfully executed %s in %s.", action, ontology_dataclass)
+
+    return number_changed
@@ -2,10 +2,12 @@
 
 from modules.ontcatowl.modules.propagation import execute_and_propagate_up, execute_and_propagate_down
 from modules.ontcatowl.modules.rules_type_implementations import treat_rule_n_r_t, treat_rule_s_nsup_k, \
-    treat_rule_ns_s_spe, treat_rule_ns_sub_r, treat_rule_nk_k_sup, treat_rule_nrs_ns_r, treat_rule_ks_sf_in
+    treat_rule_ns_s_spe, treat_rule_ns_sub_r, treat_rule_nk_k_sup, treat_rule_nrs_ns_r, treat_rule_ks_sf_in, \
+    check_incompleteness_registered
 from modules.ontcatowl.modules.utils_dataclass import get_list_gufo_classification
 from modules.tester.logger_config import initialize_logger
-from modules.tester.utils_graph import get_subclasses, get_superclasses
+
+logger = initialize_logger()
 
 # Frequent GUFO types
 GUFO_KIND = "gufo:Kind"
@@ -13,7 +15,37 @@ GUFO_SORTAL = "gufo:Sortal"
 GUFO_NON_SORTAL = "gufo:NonSortal"
 
 
-def rule_k_s_sup(list_ontology_dataclasses, graph, nodes_list):
+def register_rule_firing(ontology_dataclass, fired_classes):
+    """ Verifies if a propagation rule must be fired for the ontology_dataclass.
+
+        Propagation rules always have the same effect when fired for the same class. Hence, when using the worklist
+        scheduler, each one of them is fired only once per class and the classes for which it was fired are registered
+        in the set fired_classes. When fired_classes is None (fixed-order scheduler), the rule is always fired.
+
+        Returns True if the rule must be fired (registering it in fired_classes) and False otherwise.
+    """
+
+    if fired_classes is None:
+        return True
+
+    if ontology_dataclass.uri in fired_classes:
+        return False
+
+    fired_classes.add(ontology_dataclass.uri)
+    return True
+
+
+def is_rule_evaluation_skipped(rule_code, ontology_dataclass, skip_registered):
+    """ Verifies if the evaluation of a rule that registers incompleteness can be skipped for the ontology_dataclass.
+
+        The evaluation of these rules has no effect for classes for which the incompleteness detected by the rule is
+        already registered. When using the worklist scheduler (skip_registered is True), these classes are skipped.
+    """
+
+    return skip_registered and check_incompleteness_registered(rule_code, ontology_dataclass)
+
+
+def rule_k_s_sup(list_ontology_dataclasses, graph, nodes_list, fired_classes=None):
     """
     - REASON: Every Sortal (types that carry or supply an identity principle) must have exactly one identity principle.
 
@@ -28,21 +60,20 @@ def rule_k_s_sup(list_ontology_dataclasses, graph, nodes_list):
     """
 
     rule_code = "k_s_sup"
-    logger = initialize_logger()
 
     for ontology_dataclass in list_ontology_dataclasses:
-        if GUFO_KIND in ontology_dataclass.is_type:
-            logger.debug(f"Starting rule {rule_code} for ontology class {ontology_dataclass.uri} ...")
+        if ontology_dataclass.in_is_list(GUFO_KIND) and register_rule_firing(ontology_dataclass, fired_classes):
+            logger.debug("Starting rule %s for ontology class %s ...", rule_code, ontology_dataclass.uri)
 
             # The selected dataclass is included in the exclusion list because the action must not be performed on it.
             execute_and_propagate_up(list_ontology_dataclasses, graph, nodes_list,
                                      ontology_dataclass.uri,
                                      rule_code, [ontology_dataclass.uri])
 
-            logger.debug(f"Rule {rule_code} successfully concluded for ontology class {ontology_dataclass.uri}.")
+            logger.debug("Rule %s successfully concluded for ontology class %s.", rule_code, ontology_dataclass.uri)
 
 
-def rule_s_k_sub(list_ontology_dataclasses, graph, nodes_list):
+def rule_s_k_sub(list_ontology_dataclasses, graph, nodes_list, fired_classes=None):
     """
     - REASON: Every Sortal (types that carry or supply an identity principle) must have exactly one identity principle.
 
@@ -57,20 +88,19 @@ def rule_s_k_sub(list_ontology_dataclasses, graph, nodes_list):
     """
 
     rule_code = "s_k_sub"
-    logger = initialize_logger()
 
     for ontology_dataclass in list_ontology_dataclasses:
-        if GUFO_SORTAL in ontology_dataclass.is_type:
-            logger.debug(f"Starting rule {rule_code} for ontology class {ontology_dataclass.uri} ...")
+        if ontology_dataclass.in_is_list(GUFO_SORTAL) and register_rule_firing(ontology_dataclass, fired_classes):
+            logger.debug("Starting rule %s for ontology class %s ...", rule_code, ontology_dataclass.uri)
 
             # The selected dataclass is included in the exclusion list because the action must not be performed on it.
             execute_and_propagate_down(list_ontology_dataclasses, graph, nodes_list,
                                        ontology_dataclass.uri, rule_code, [ontology_dataclass.uri])
 
-            logger.debug(f"Rule {rule_code} successfully concluded for ontology class {ontology_dataclass.uri}.")
+            logger.debug("Rule %s successfully concluded for ontology class %s.", rule_code, ontology_dataclass.uri)
 
 
-def rule_t_k_sup(list_ontology_dataclasses, graph, nodes_list):
+def rule_t_k_sup(list_ontology_dataclasses, graph, nodes_list, fired_classes=None):
     """
     - REASON: Every Sortal (types that carry or supply an identity principle) must have exactly one identity principle.
 
@@ -85,20 +115,19 @@ def rule_t_k_sup(list_ontology_dataclasses, graph, nodes_list):
     """
 
     rule_code = "t_k_sup"
-    logger = initialize_logger()
 
     for ontology_dataclass in list_ontology_dataclasses:
-        if GUFO_KIND in ontology_dataclass.is_type:
-            logger.debug(f"Starting rule {rule_code} for ontology class {ontology_dataclass.uri} ...")
+        if ontology_dataclass.in_is_list(GUFO_KIND) and register_rule_firing(ontology_dataclass, fired_classes):
+            logger.debug("Starting rule %s for ontology class %s ...", rule_code, ontology_dataclass.uri)
 
             # Get all subclasses
-            all_subclasses = get_subclasses(graph, nodes_list["all"], ontology_dataclass.uri).copy()
+            all_subclasses = nodes_list["taxonomy_index"].get_subclasses(ontology_dataclass.uri)
 
             # For all subclasses
             for subclass in all_subclasses:
 
                 # Get all superclasses
-                all_superclasses_of_subclasses = get_superclasses(graph, nodes_list["all"], subclass).copy()
+                all_superclasses_of_subclasses = nodes_list["taxonomy_index"].get_superclasses(subclass)
 
                 # Return all superclasses that are of type Kind
                 return_list = get_list_gufo_classification(list_ontology_dataclasses, all_superclasses_of_subclasses,
@@ -116,10 +145,10 @@ def rule_t_k_sup(list_ontology_dataclasses, graph, nodes_list):
                     execute_and_propagate_up(list_ontology_dataclasses, graph, nodes_list, subclass,
                                              "t_k_sup", return_list)
 
-            logger.debug(f"Rule {rule_code} successfully concluded for ontology class {ontology_dataclass.uri}.")
+            logger.debug("Rule %s successfully concluded for ontology class %s.", rule_code, ontology_dataclass.uri)
 
 
-def rule_ns_s_sup(list_ontology_dataclasses, graph, nodes_list):
+def rule_ns_s_sup(list_ontology_dataclasses, graph, nodes_list, fired_classes=None):
     """
     - REASON: NonSortals aggregates identities from at least two different identity principles providers.
 
@@ -134,19 +163,17 @@ def rule_ns_s_sup(list_ontology_dataclasses, graph, nodes_list):
 
     rule_code = "ns_s_sup"
 
-    logger = initialize_logger()
-
     for ontology_dataclass in list_ontology_dataclasses:
-        if GUFO_NON_SORTAL in ontology_dataclass.is_type:
-            logger.debug(f"Starting rule {rule_code} for ontology class {ontology_dataclass.uri} ...")
+        if ontology_dataclass.in_is_list(GUFO_NON_SORTAL) and register_rule_firing(ontology_dataclass, fired_classes):
+            logger.debug("Starting rule %s for ontology class %s ...", rule_code, ontology_dataclass.uri)
 
             execute_and_propagate_up(list_ontology_dataclasses, graph, nodes_list,
                                      ontology_dataclass.uri, rule_code, [ontology_dataclass.uri])
 
-            logger.debug(f"Rule {rule_code} successfully concluded for ontology class {ontology_dataclass.uri}.")
+            logger.debug("Rule %s successfully concluded for ontology class %s.", rule_code, ontology_dataclass.uri)
 
 
-def rule_s_ns_sub(list_ontology_dataclasses, graph, nodes_list):
+def rule_s_ns_sub(list_ontology_dataclasses, graph, nodes_list, fired_classes=None):
     """
     - REASON: Every Sortal (types that carry or supply an identity principle) must have exactly one identity principle.
 
@@ -161,19 +188,17 @@ def rule_s_ns_sub(list_ontology_dataclasses, graph, nodes_list):
 
     rule_code = "s_ns_sub"
 
-    logger = initialize_logger()
-
     for ontology_dataclass in list_ontology_dataclasses:
-        if GUFO_SORTAL in ontology_dataclass.is_type:
-            logger.debug(f"Starting rule {rule_code} for ontology class {ontology_dataclass.uri} ...")
+        if ontology_dataclass.in_is_list(GUFO_SORTAL) and register_rule_firing(ontology_dataclass, fired_classes):
+            logger.debug("Starting rule %s for ontology class %s ...", rule_code, ontology_dataclass.uri)
 
             execute_and_propagate_down(list_ontology_dataclasses, graph, nodes_list,
                                        ontology_dataclass.uri, rule_code, [ontology_dataclass.uri])
 
-            logger.debug(f"Rule {rule_code} successfully concluded for ontology class {ontology_dataclass.uri}.")
+            logger.debug("Rule %s successfully concluded for ontology class %s.", rule_code, ontology_dataclass.uri)
 
 
-def rule_r_ar_sup(list_ontology_dataclasses, graph, nodes_list):
+def rule_r_ar_sup(list_ontology_dataclasses, graph, nodes_list, fired_classes=None):
     """
     - REASON: Rigid types cannot specialize AntiRigid types.
 
@@ -189,21 +214,20 @@ def rule_r_ar_sup(list_ontology_dataclasses, graph, nodes_list):
 
     rule_code = "r_ar_sup"
 
-    logger = initialize_logger()
-
     for ontology_dataclass in list_ontology_dataclasses:
         # Getting RigidType or SemiRigidType types
-        if ("gufo:RigidType" in ontology_dataclass.is_type) or ("gufo:SemiRigidType" in ontology_dataclass.is_type):
-            logger.debug(f"Starting rule {rule_code} for ontology class {ontology_dataclass.uri} ...")
+        if (ontology_dataclass.in_is_list("gufo:RigidType") or ontology_dataclass.in_is_list("gufo:SemiRigidType")) \
+                and register_rule_firing(ontology_dataclass, fired_classes):
+            logger.debug("Starting rule %s for ontology class %s ...", rule_code, ontology_dataclass.uri)
 
             execute_and_propagate_up(list_ontology_dataclasses, graph, nodes_list,
                                      ontology_dataclass.uri,
                                      rule_code, [ontology_dataclass.uri])
 
-            logger.debug(f"Rule {rule_code} successfully concluded for ontology class {ontology_dataclass.uri}.")
+            logger.debug("Rule %s successfully concluded for ontology class %s.", rule_code, ontology_dataclass.uri)
 
 
-def rule_ar_r_sub(list_ontology_dataclasses, graph, nodes_list):
+def rule_ar_r_sub(list_ontology_dataclasses, graph, nodes_list, fired_classes=None):
     """
     - REASON: Rigid types cannot specialize AntiRigid types.
 
@@ -219,19 +243,18 @@ def rule_ar_r_sub(list_ontology_dataclasses, graph, nodes_list):
 
     rule_code = "ar_r_sub"
 
-    logger = initialize_logger()
-
     for ontology_dataclass in list_ontology_dataclasses:
-        if "gufo:AntiRigidType" in ontology_dataclass.is_type:
-            logger.debug(f"Starting rule {rule_code} for ontology class {ontology_dataclass.uri} ...")
+        if ontology_dataclass.in_is_list("gufo:AntiRigidType") \
+                and register_rule_firing(ontology_dataclass, fired_classes):
+            logger.debug("Starting rule %s for ontology class %s ...", rule_code, ontology_dataclass.uri)
 
             execute_and_propagate_down(list_ontology_dataclasses, graph, nodes_list,
                                        ontology_dataclass.uri, rule_code, [ontology_dataclass.uri])
 
-            logger.debug(f"Rule {rule_code} successfully concluded for ontology class {ontology_dataclass.uri}.")
+            logger.debug("Rule %s successfully concluded for ontology class %s.", rule_code, ontology_dataclass.uri)
 
 
-def rule_n_r_t(list_ontology_dataclasses, nodes_list, configurations):
+def rule_n_r_t(list_ontology_dataclasses, nodes_list, configurations, skip_registered=False):
     """
     - REASON: Every type must supply (Kinds) or carry (Non-Kind Sortals) a single identity principle or
     aggregate (NonSortals) multiple identity principles.
@@ -250,27 +273,29 @@ def rule_n_r_t(list_ontology_dataclasses, nodes_list, configurations):
 
     rule_code = "n_r_t"
 
-    logger = initialize_logger()
-
     for ontology_dataclass in list_ontology_dataclasses:
 
+        if is_rule_evaluation_skipped(rule_code, ontology_dataclass, skip_registered):
+            continue
+
         # CONDITION 1
-        if GUFO_KIND in ontology_dataclass.is_type:
+        if ontology_dataclass.in_is_list(GUFO_KIND):
             continue
 
         # CONDITION 2
-        if (ontology_dataclass.uri not in nodes_list["roots"]) or (ontology_dataclass.uri not in nodes_list["leaves"]):
+        if not nodes_list["taxonomy_index"].is_root(ontology_dataclass.uri) \
+                or not nodes_list["taxonomy_index"].is_leaf(ontology_dataclass.uri):
             continue
 
         # Rule treatment when conditions are met
-        logger.debug(f"Starting rule {rule_code} for ontology class {ontology_dataclass.uri} ...")
+        logger.debug("Starting rule %s for ontology class %s ...", rule_code, ontology_dataclass.uri)
 
         treat_rule_n_r_t(rule_code, ontology_dataclass, configurations)
 
-        logger.debug(f"Rule {rule_code} successfully concluded for ontology class {ontology_dataclass.uri}.")
+        logger.debug("Rule %s successfully concluded for ontology class %s.", rule_code, ontology_dataclass.uri)
 
 
-def rule_ns_s_spe(list_ontology_dataclasses, graph, nodes_list, configurations):
+def rule_ns_s_spe(list_ontology_dataclasses, graph, nodes_list, configurations, skip_registered=False):
     """
     - REASON: NonSortals aggregates identities from at least two different identity principles providers.
 
@@ -315,22 +340,23 @@ def rule_ns_s_spe(list_ontology_dataclasses, graph, nodes_list, configurations):
 
     rule_code = "ns_s_spe"
 
-    logger = initialize_logger()
-
     for ontology_dataclass in list_ontology_dataclasses:
 
+        if is_rule_evaluation_skipped(rule_code, ontology_dataclass, skip_registered):
+            continue
+
         # CONDITION 1
-        if GUFO_NON_SORTAL not in ontology_dataclass.is_type:
+        if not ontology_dataclass.in_is_list(GUFO_NON_SORTAL):
             continue
 
-        logger.debug(f"Starting rule {rule_code} for ontology class {ontology_dataclass.uri} ...")
+        logger.debug("Starting rule %s for ontology class %s ...", rule_code, ontology_dataclass.uri)
 
         treat_rule_ns_s_spe(rule_code, ontology_dataclass, list_ontology_dataclasses, graph, nodes_list, configurations)
 
-        logger.debug(f"Rule {rule_code} successfully concluded for ontology class {ontology_dataclass.uri}.")
+        logger.debug("Rule %s successfully concluded for ontology class %s.", rule_code, ontology_dataclass.uri)
 
 
-def rule_nk_k_sup(list_ontology_dataclasses, graph, nodes_list, configurations):
+def rule_nk_k_sup(list_ontology_dataclasses, graph, nodes_list, configurations, skip_registered=False):
     """
     - REASON: Every Sortal (types that carry or supply an identity principle) must have exactly one identity principle.
 
@@ -374,22 +400,23 @@ def rule_nk_k_sup(list_ontology_dataclasses, graph, nodes_list, configurations):
 
     rule_code = "nk_k_sup"
 
-    logger = initialize_logger()
-
     for ontology_dataclass in list_ontology_dataclasses:
 
+        if is_rule_evaluation_skipped(rule_code, ontology_dataclass, skip_registered):
+            continue
+
         # CONDITION 1: class has is_type Sortal and not_type Kind:
-        if (GUFO_SORTAL not in ontology_dataclass.is_type) or (GUFO_KIND not in ontology_dataclass.not_type):
+        if not ontology_dataclass.in_is_list(GUFO_SORTAL) or not ontology_dataclass.in_not_list(GUFO_KIND):
             continue
 
-        logger.debug(f"Starting rule {rule_code} for ontology class {ontology_dataclass.uri} ...")
+        logger.debug("Starting rule %s for ontology class %s ...", rule_code, ontology_dataclass.uri)
 
         treat_rule_nk_k_sup(rule_code, ontology_dataclass, list_ontology_dataclasses, graph, nodes_list, configurations)
 
-        logger.debug(f"Rule {rule_code} successfully concluded for ontology class {ontology_dataclass.uri}.")
+        logger.debug("Rule %s successfully concluded for ontology class %s.", rule_code, ontology_dataclass.uri)
 
 
-def rule_s_nsup_k(list_ontology_dataclasses, graph, nodes_list, configurations):
+def rule_s_nsup_k(list_ontology_dataclasses, graph, nodes_list, configurations, skip_registered=False):
     """
         - REASON: Every Sortal (types that carry or supply an identity principle) must have exactly
         one identity principle, which is provided by a Kind.
@@ -407,19 +434,20 @@ def rule_s_nsup_k(list_ontology_dataclasses, graph, nodes_list, configurations):
 
     rule_code = "s_nsup_k"
 
-    logger = initialize_logger()
-
     for ontology_dataclass in list_ontology_dataclasses:
 
+        if is_rule_evaluation_skipped(rule_code, ontology_dataclass, skip_registered):
+            continue
+
         # CONDITION 1: ontology_dataclass must be a gufo:Sortal and must not be a gufo:Kind
-        if (GUFO_SORTAL not in ontology_dataclass.is_type) or (GUFO_KIND in ontology_dataclass.is_type):
+        if not ontology_dataclass.in_is_list(GUFO_SORTAL) or ontology_dataclass.in_is_list(GUFO_KIND):
             continue
 
-        logger.debug(f"Starting rule {rule_code} for ontology class {ontology_dataclass.uri} ...")
+        logger.debug("Starting rule %s for ontology class %s ...", rule_code, ontology_dataclass.uri)
 
         treat_rule_s_nsup_k(rule_code, ontology_dataclass, graph, nodes_list, configurations)
 
-        logger.debug(f"Rule {rule_code} successfully concluded for ontology class {ontology_dataclass.uri}.")
+        logger.debug("Rule %s successfully concluded for ontology class %s.", rule_code, ontology_dataclass.uri)
 
 
 def rule_ns_sub_r(list_ontology_dataclasses, graph, nodes_list, configurations):
@@ -440,22 +468,20 @@ def rule_ns_sub_r(list_ontology_dataclasses, graph, nodes_list, configurations):
     if not configurations["is_complete"]:
         return
 
-    logger = initialize_logger()
-
     for ontology_dataclass in list_ontology_dataclasses:
 
         # CONDITION 2: ontology_dataclass must be a gufo:NonSortals and must be able to be a gufo:Category
-        if ("gufo:NonSortal" not in ontology_dataclass.is_type) or ("gufo:Category" not in ontology_dataclass.can_type):
+        if not ontology_dataclass.in_is_list("gufo:NonSortal") or not ontology_dataclass.in_can_list("gufo:Category"):
             continue
 
-        logger.debug(f"Starting rule {rule_code} for ontology class {ontology_dataclass.uri} ...")
+        logger.debug("Starting rule %s for ontology class %s ...", rule_code, ontology_dataclass.uri)
 
         treat_rule_ns_sub_r(rule_code, list_ontology_dataclasses, ontology_dataclass, graph, nodes_list)
 
-        logger.debug(f"Rule {rule_code} successfully concluded for ontology class {ontology_dataclass.uri}.")
+        logger.debug("Rule %s successfully concluded for ontology class %s.", rule_code, ontology_dataclass.uri)
 
 
-def rule_nrs_ns_r(list_ontology_dataclasses, graph, nodes_list, configurations):
+def rule_nrs_ns_r(list_ontology_dataclasses, graph, nodes_list, configurations, skip_registered=False):
     """
         - REASON: Phases always occur in phase partitions.
 
@@ -471,29 +497,30 @@ def rule_nrs_ns_r(list_ontology_dataclasses, graph, nodes_list, configurations):
 
     rule_code = "nrs_ns_r"
 
-    logger = initialize_logger()
-
     for ontology_dataclass in list_ontology_dataclasses:
 
+        if is_rule_evaluation_skipped(rule_code, ontology_dataclass, skip_registered):
+            continue
+
         # CONDITION 1: ontology_dataclass must be able to be classified as a gufo:Role
-        if "gufo:Role" not in ontology_dataclass.can_type:
+        if not ontology_dataclass.in_can_list("gufo:Role"):
             continue
 
         # CONDITION 2: ontology_dataclass must be a gufo:Sortals and must be a gufo:NonRigidType
-        if ("gufo:Sortal" not in ontology_dataclass.is_type) \
-                or ("gufo:NonRigidType" not in ontology_dataclass.is_type):
+        if not ontology_dataclass.in_is_list("gufo:Sortal") \
+                or not ontology_dataclass.in_is_list("gufo:NonRigidType"):
             continue
 
-        logger.debug(f"Starting rule {rule_code} for ontology class {ontology_dataclass.uri} ...")
+        logger.debug("Starting rule %s for ontology class %s ...", rule_code, ontology_dataclass.uri)
 
         treat_rule_nrs_ns_r(rule_code, ontology_dataclass, graph, nodes_list, configurations)
 
-        logger.debug(f"Rule {rule_code} successfully concluded for ontology class {ontology_dataclass.uri}.")
+        logger.debug("Rule %s successfully concluded for ontology class %s.", rule_code, ontology_dataclass.uri)
 
 
 # TODO (@pedropaulofb): This rule must be improved with identification of partition sets. The rule to be created to
 #  substitute this one is: Partition sets with at least one known phase must have all its components as phases.
-def rule_ks_sf_in(list_ontology_dataclasses, graph, nodes_list):
+def rule_ks_sf_in(list_ontology_dataclasses, graph, nodes_list, skip_registered=False):
     """
         - REASON: Phases always occur in phase partitions.
 
@@ -506,16 +533,17 @@ def rule_ks_sf_in(list_ontology_dataclasses, graph, nodes_list):
 
     rule_code = "ks_sf_in"
 
-    logger = initialize_logger()
-
     for ontology_dataclass in list_ontology_dataclasses:
 
+        if is_rule_evaluation_skipped(rule_code, ontology_dataclass, skip_registered):
+            continue
+
         # CONDITION 1: ontology_dataclass must be a Phase
-        if "gufo:Phase" not in ontology_dataclass.is_type:
+        if not ontology_dataclass.in_is_list("gufo:Phase"):
             continue
 
-        logger.debug(f"Starting rule {rule_code} for ontology class {ontology_dataclass.uri} ...")
+        logger.debug("Starting rule %s for ontology class %s ...", rule_code, ontology_dataclass.uri)
 
         treat_rule_ks_sf_in(rule_code, list_ontology_dataclasses, ontology_dataclass, graph, nodes_list)
 
-        logger.debug(f"Rule {rule_code} successfully concluded for ontology class {ontology_dataclass.uri}.")
+        logger.debug("Rule %s successfully concluded for ontology class %s.", rule_code, ontology_dataclass.uri)
@@ -0,0 +1,256 @@
+""" Registry of the rules applied to the TYPES HIERARCHY.
+
+    Each rule declares as metadata the GUFO types it reads from the dataclasses' lists (triggers) and the GUFO types it
+    moves in the dataclasses' lists (effects). From this metadata, a dependency graph between the rules is built. It is
+    used for defining the order of execution of the rules and for skipping rules that cannot be affected.
+
+    Fields of each rule in the registry:
+        - function: the function that implements the rule (in rules_types_definitions.py).
+        - parameters: parameters received by the function after the ontology dataclass list.
+        - group: "automatic" for the rules executed in the automatic loop or "general" for the other rules.
+        - scheduling: how the worklist scheduler avoids executions with no effect. "propagation" for rules fired only
+            once per class, "registering" for rules that skip classes in which the incompleteness is already registered
+            and "state" for rules that are only skipped when not affected by any other rule.
+        - triggers: list of GUFO types whose situation (IS, CAN or NOT) is read by the rule.
+        - effects: list of tuples (target_list, GUFO type) moved by the rule, where target_list is "is" or "not".
+"""
+
+from modules.ontcatowl.modules.logger_config import initialize_logger
+from modules.ontcatowl.modules.rules_types_definitions import rule_k_s_sup, rule_s_k_sub, rule_t_k_sup, \
+    rule_ns_s_sup, rule_s_ns_sub, rule_r_ar_sup, rule_ar_r_sub, rule_n_r_t, rule_ns_s_spe, rule_nk_k_sup, \
+    rule_s_nsup_k, rule_ns_sub_r, rule_nrs_ns_r, rule_ks_sf_in
+
+logger = initialize_logger()
+
+RULES_TYPES_REGISTRY = {
+    "k_s_sup": {"function": rule_k_s_sup,
+                "parameters": ["graph", "nodes_list", "fired_classes"],
+                "group": "automatic", "scheduling": "propagation",
+                "triggers": ["gufo:Kind"],
+                "effects": [("not", "gufo:Sortal")]},
+    "s_k_sub": {"function": rule_s_k_sub,
+                "parameters": ["graph", "nodes_list", "fired_classes"],
+                "group": "automatic", "scheduling": "propagation",
+                "triggers": ["gufo:Sortal"],
+                "effects": [("not", "gufo:Kind")]},
+    "t_k_sup": {"function": rule_t_k_sup,
+                "parameters": ["graph", "nodes_list", "fired_classes"],
+                "group": "automatic", "scheduling": "propagation",
+                "triggers": ["gufo:Kind"],
+                "effects": [("not", "gufo:Kind")]},
+    "ns_s_sup": {"function": rule_ns_s_sup,
+                 "parameters": ["graph", "nodes_list", "fired_classes"],
+                 "group": "automatic", "scheduling": "propagation",
+                 "triggers": ["gufo:NonSortal"],
+                 "effects": [("not", "gufo:Sortal")]},
+    "s_ns_sub": {"function": rule_s_ns_sub,
+                 "parameters": ["graph", "nodes_list", "fired_classes"],
+                 "group": "automatic", "scheduling": "propagation",
+                 "triggers": ["gufo:Sortal"],
+                 "effects": [("not", "gufo:NonSortal")]},
+    "r_ar_sup": {"function": rule_r_ar_sup,
+                 "parameters": ["graph", "nodes_list", "fired_classes"],
+                 "group": "automatic", "scheduling": "propagation",
+                 "triggers": ["gufo:RigidType", "gufo:SemiRigidType"],
+                 "effects": [("not", "gufo:AntiRigidType")]},
+    "ar_r_sub": {"function": rule_ar_r_sub,
+                 "parameters": ["graph", "nodes_list", "fired_classes"],
+                 "group": "automatic", "scheduling": "propagation",
+                 "triggers": ["gufo:AntiRigidType"],
+                 "effects": [("not", "gufo:RigidType"), ("not", "gufo:SemiRigidType")]},
+    "ns_sub_r": {"function": rule_ns_sub_r,
+                 "parameters": ["graph", "nodes_list", "configurations"],
+                 "group": "automatic", "scheduling": "state",
+                 "triggers": ["gufo:NonSortal", "gufo:Category", "gufo:RigidType"],
+                 "effects": [("is", "gufo:Category")]},
+    "ks_sf_in": {"function": rule_ks_sf_in,
+                 "parameters": ["graph", "nodes_list", "skip_registered"],
+                 "group": "automatic", "scheduling": "registering",
+                 "triggers": ["gufo:Phase", "gufo:Sortal", "gufo:NonRigidType"],
+                 "effects": []},
+    "n_r_t": {"function": rule_n_r_t,
+              "parameters": ["nodes_list", "configurations", "skip_registered"],
+              "group": "general", "scheduling": "registering",
+              "triggers": ["gufo:Kind"],
+              "effects": [("is", "gufo:Kind")]},
+    "ns_s_spe": {"function": rule_ns_s_spe,
+                 "parameters": ["graph", "nodes_list", "configurations", "skip_registered"],
+                 "group": "general", "scheduling": "registering",
+                 "triggers": ["gufo:NonSortal", "gufo:Kind"],
+                 "effects": [("is", "gufo:Kind")]},
+    "nk_k_sup": {"function": rule_nk_k_sup,
+                 "parameters": ["graph", "nodes_list", "configurations", "skip_registered"],
+                 "group": "general", "scheduling": "registering",
+                 "triggers": ["gufo:Sortal", "gufo:Kind"],
+                 "effects": [("is", "gufo:Kind")]},
+    "s_nsup_k": {"function": rule_s_nsup_k,
+                 "parameters": ["graph", "nodes_list", "configurations", "skip_registered"],
+                 "group": "general", "scheduling": "registering",
+                 "triggers": ["gufo:Sortal", "gufo:Kind"],
+                 "effects": [("is", "gufo:Kind")]},
+    "nrs_ns_r": {"function": rule_nrs_ns_r,
+                 "parameters": ["graph", "nodes_list", "configurations", "skip_registered"],
+                 "group": "general", "scheduling": "registering",
+                 "triggers": ["gufo:Role", "gufo:Sortal", "gufo:NonRigidType"],
+                 "effects": [("is", "gufo:Role")]}
+}
+
+# The last GUFO bit index used and the rules plan built with it.
+LAST_RULES_PLAN = {"gufo_bit_index": None, "rules_plan": None}
+
+
+def get_rules_codes(scheduling=None):
+    """ Returns the codes of all registered rules (in the registry order) that use the received scheduling.
+        If no scheduling is received, the codes of all registered rules are returned.
+    """
+
+    return [rule_code for rule_code, rule in RULES_TYPES_REGISTRY.items()
+            if (scheduling is None) or (rule["scheduling"] == scheduling)]
+
+
+def build_rules_dependency_graph(gufo_bit_index):
+    """ Returns the dependency graph between the registered rules as a dictionary in which the keys are the rules'
+        codes and the values are the sets of rules affected by them.
+
+        A rule A affects a rule B if the effects of A (including the ones caused by the GUFO dictionary updates) move a
+        GUFO type that is a trigger or an effect of B. As incompleteness registers are cleared whenever a dataclass
+        receives a new element in its IS lists, registering rules are also affected by all rules that may do it.
+    """
+
+    reads_masks = {}
+    for rule_code, rule in RULES_TYPES_REGISTRY.items():
+        effects_elements = [element for target_list, element in rule["effects"]]
+        reads_masks[rule_code] = gufo_bit_index.get_mask(rule["triggers"] + effects_elements)
+
+    dependency_graph = {}
+
+    for rule_code, rule in RULES_TYPES_REGISTRY.items():
+        influence_is_mask = 0
+        influence_not_mask = 0
+        for target_list, element in rule["effects"]:
+            effect_is_mask, effect_not_mask = gufo_bit_index.get_influence_masks(element, target_list)
+            influence_is_mask |= effect_is_mask
+            influence_not_mask |= effect_not_mask
+
+        dependency_graph[rule_code] = set()
+        for affected_code, affected_rule in RULES_TYPES_REGISTRY.items():
+            if ((influence_is_mask | influence_not_mask) & reads_masks[affected_code]) or \
+                    (influence_is_mask and affected_rule["scheduling"] == "registering"):
+                dependency_graph[rule_code].add(affected_code)
+
+    return dependency_graph
+
+
+def get_strongly_connected_components(dependency_graph):
+    """ Returns the list of strongly connected components (Tarjan's algorithm) of the dependency graph.
+        Each component is a list of rules' codes in the registry order.
+    """
+
+    index_counter = [0]
+    indexes = {}
+    low_links = {}
+    stack = []
+    components = []
+
+    def strong_connect(rule_code):
+        indexes[rule_code] = index_counter[0]
+        low_links[rule_code] = index_counter[0]
+        index_counter[0] += 1
+        stack.append(rule_code)
+
+        for affected_code in dependency_graph[rule_code]:
+            if affected_code not in indexes:
+                strong_connect(affected_code)
+                low_links[rule_code] = min(low_links[rule_code], low_links[affected_code])
+            elif affected_code in stack:
+                low_links[rule_code] = min(low_links[rule_code], indexes[affected_code])
+
+        if low_links[rule_code] == indexes[rule_code]:
+            component = []
+            while True:
+                component_code = stack.pop()
+                component.append(component_code)
+                if component_code == rule_code:
+                    break
+            components.append([code for code in dependency_graph if code in component])
+
+    for rule_code in dependency_graph:
+        if rule_code not in indexes:
+            strong_connect(rule_code)
+
+    return components
+
+
+def get_topological_order(dependency_graph, components):
+    """ Returns the list of rules' codes ordered so that rules are executed before all rules they affect (except the
+        ones in their own strongly connected component). When more than one component can be executed, the one with
+        the first rule in the registry order is selected, so the registry order is kept whenever possible.
+    """
+
+    registry_order = list(dependency_graph.keys())
+    component_of = {}
+    for component_number, component in enumerate(components):
+        for rule_code in component:
+            component_of[rule_code] = component_number
+
+    predecessors = {component_number: set() for component_number in range(len(components))}
+    for rule_code, affected_codes in dependency_graph.items():
+        for affected_code in affected_codes:
+            if component_of[rule_code] != component_of[affected_code]:
+                predecessors[component_of[affected_code]].add(component_of[rule_code])
+
+    topological_order = []
+    remaining = set(predecessors.keys())
+
+    while remaining:
+        ready = [component_number for component_number in remaining if not (predecessors[component_number] & remaining)]
+        selected = min(ready, key=lambda component_number: registry_order.index(components[component_number][0]))
+        topological_order.extend(components[selected])
+        remaining.remove(selected)
+
+    return topological_order
+
+
+def build_rules_plan(gufo_bit_index):
+    """ Builds the rules plan, a dictionary with:
+        - affected_by: for each rule, the set of rules that affect it.
+        - components: the strongly connected components of the dependency graph.
+        - automatic and general: the rules of each group in topological order.
+    """
+
+    logger.debug("Building rules dependency graph...")
+
+    dependency_graph = build_rules_dependency_graph(gufo_bit_index)
+
+    affected_by = {rule_code: set() for rule_code in dependency_graph}
+    for rule_code, affected_codes in dependency_graph.items():
+        for affected_code in affected_codes:
+            affected_by[affected_code].add(rule_code)
+
+    rules_plan = {"affected_by": affected_by,
+                  "components": get_strongly_connected_components(dependency_graph)}
+
+    # The order of each group is calculated considering only the dependencies between the group's rules.
+    for group in ["automatic", "general"]:
+        group_graph = {rule_code: affected_codes & {code for code in dependency_graph
+                                                    if RULES_TYPES_REGISTRY[code]["group"] == group}
+                       for rule_code, affected_codes in dependency_graph.items()
+                       if RULES_TYPES_REGISTRY[rule_code]["group"] == group}
+        rules_plan[group] = get_topological_order(group_graph, get_strongly_connected_components(group_graph))
+
+    logger.debug(f"Rules dependency graph successfully built. "
+                 f"Strongly connected components: {rules_plan['components']}.")
+
+    return rules_plan
+
+
+def get_rules_plan(gufo_bit_index):
+    """ Returns the rules plan for the received GUFO bit index. The plan is only built if the index is different from
+        the last one used.
+    """
+
+    if LAST_RULES_PLAN["gufo_bit_index"] is not gufo_bit_index:
+        LAST_RULES_PLAN["rules_plan"] = build_rules_plan(gufo_bit_index)
+        LAST_RULES_PLAN["gufo_bit_index"] = gufo_bit_index
+
+    return LAST_RULES_PLAN["rules_plan"]
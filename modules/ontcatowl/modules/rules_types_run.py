@@ -2,109 +2,205 @@
 import time
 
 from modules.ontcatowl.modules.logger_config import initialize_logger
-from modules.ontcatowl.modules.rules_types_definitions import rule_k_s_sup, rule_s_k_sub, rule_t_k_sup, rule_ns_s_sup, \
-    rule_s_ns_sub, rule_r_ar_sup, rule_ar_r_sub, rule_n_r_t, rule_ns_s_spe, rule_nk_k_sup, rule_s_nsup_k, rule_ns_sub_r, \
-    rule_nrs_ns_r, rule_ks_sf_in
-from modules.ontcatowl.modules.utils_dataclass import generate_hash_ontology_dataclass_list
+from modules.ontcatowl.modules.rules_types_registry import RULES_TYPES_REGISTRY, get_rules_codes, get_rules_plan
+from modules.ontcatowl.modules.utils_dataclass import get_state_ontology_dataclass_list
+
+logger = initialize_logger()
+
+
+def initialize_execution_counters():
+    """ Returns the counters of the fixpoint iterations of execute_rules_types, which are returned with its time_register
+        (e.g., for benchmarking):
+
+        - loops: number of iterations of the outer loop (automatic and general rules).
+        - automatic_loops: number of iterations of the inner loop (automatic rules only).
+        - rules_executions: number of rules' executions.
+        - rules_skipped: number of rules' executions skipped by the worklist scheduler.
+    """
+
+    return {"loops": 0, "automatic_loops": 0, "rules_executions": 0, "rules_skipped": 0}
+
+
+def initialize_worklist_register():
+    """ Returns the register used by the worklist scheduler to avoid executions of rules that have no effect.
+
+        - fired_classes: for each propagation rule, the set of classes for which the rule was already fired.
+        - last_starts: for each rule, the state of the ontology dataclass list when the rule was last executed.
+        - last_changes: for each rule, the state of the ontology dataclass list after the last execution of the rule
+            that modified it.
+    """
+
+    worklist_register = {"fired_classes": {}, "last_starts": {}, "last_changes": {}}
+
+    for rule_code in get_rules_codes("propagation"):
+        worklist_register["fired_classes"][rule_code] = set()
+
+    return worklist_register
+
+
+def is_rule_execution_skipped(ontology_dataclass_list, rule_code, rules_plan, worklist_register):
+    """ Verifies if the execution of a rule can be skipped by the worklist scheduler.
+
+        A rule can only be affected by the modifications performed by the rules it depends on (see
+        rules_types_registry.py). If none of them modified the ontology dataclass list since the rule's last execution,
+        executing it again produces no effect.
+    """
+
+    last_start = worklist_register["last_starts"].get(rule_code)
+
+    if last_start is None:
+        return False
+
+    for affecting_rule in rules_plan["affected_by"][rule_code]:
+        if worklist_register["last_changes"].get(affecting_rule, -1) > last_start:
+            return False
+
+    return True
 
 
 def execute_rules_types(ontology_dataclass_list, graph, nodes_list, configurations):
-    """ Executes all rules related to types. """
-    logger = initialize_logger()
+    """ Executes all rules related to types.
+
+        The rules are executed until the ontology dataclass list is not modified anymore. Modifications are detected
+        using the list's changes counter. If the optional configuration "verify_with_hash" is True, they are detected
+        by comparing hashes of the complete list (slower, used for debugging and verification).
+
+        The optional configuration "rules_scheduler" selects how rules are executed in each loop:
+            - "worklist" (default): rules are only executed for the classes in which they can still produce an effect.
+                I.e., rules that were not affected by any rule since their last execution (according to the rules
+                dependency graph) are skipped, propagation rules are fired only once per class, and rules that
+                register incompleteness skip the classes in which it is already registered.
+            - "fixed_order": all rules are always executed for all classes.
+        Both schedulers execute the rules in the same order and, hence, reach the same final dataclass list.
+    """
     logger.info("Starting GUFO types hierarchy rules ...")
 
-    # Rules
-    always_automatic_rules = ["k_s_sup", "s_k_sub", "t_k_sup", "ns_s_sup", "s_ns_sub", "r_ar_sup", "ar_r_sub",
-                              "ns_sub_r", "ks_sf_in"]
+    execution_counters = initialize_execution_counters()
 
-    general_rules = ["n_r_t", "ns_s_spe", "nk_k_sup", "s_nsup_k", "nrs_ns_r"]
+    if len(ontology_dataclass_list) == 0:
+        logger.info("There are no classes to be evaluated. GUFO types hierarchy rules concluded.")
+        return initialize_time_register(), execution_counters
+
+    # Rules of each group in the order defined by their dependencies.
+    rules_plan = get_rules_plan(ontology_dataclass_list[0].gufo_bit_index)
+    always_automatic_rules = rules_plan["automatic"]
+    general_rules = rules_plan["general"]
 
     # Execution time calculation
-    time_register = {"execution": 0,
-                     "k_s_sup": 0, "s_k_sub": 0, "t_k_sup": 0, "ns_s_sup": 0, "s_ns_sub": 0,
-                     "r_ar_sup": 0, "ar_r_sub": 0, "ns_sub_r": 0, "ks_sf_in": 0, "n_r_t": 0,
-                     "ns_s_spe": 0, "nk_k_sup": 0, "s_nsup_k": 0, "nrs_ns_r": 0,
-                     "total_time": 0}
+    time_register = initialize_time_register()
 
     list_of_rules = always_automatic_rules + general_rules
 
-    initial_hash = generate_hash_ontology_dataclass_list(ontology_dataclass_list)
-    final_hash = 0
+    verify_with_hash = configurations.get("verify_with_hash", False)
+
+    rules_scheduler = configurations.get("rules_scheduler", "worklist")
+    if rules_scheduler == "worklist":
+        worklist_register = initialize_worklist_register()
+    elif rules_scheduler == "fixed_order":
+        worklist_register = None
+    else:
+        logger.error(f"Unknown rules scheduler ({rules_scheduler}) received as configuration! Program aborted.")
+        exit(1)
+
+    initial_state = get_state_ontology_dataclass_list(ontology_dataclass_list, verify_with_hash)
+    final_state = None
 
     # LOOP(LOOP(automatic) + interactive)
-    while initial_hash != final_hash:
+    while initial_state != final_state:
+        execution_counters["loops"] += 1
 
         # Loop always_automatic_rules only
-        while initial_hash != final_hash:
-            initial_hash = final_hash
+        while initial_state != final_state:
+            execution_counters["automatic_loops"] += 1
+            initial_state = final_state
             for automatic_rule in always_automatic_rules:
                 switch_rule_execution(ontology_dataclass_list, graph, nodes_list, automatic_rule, configurations,
-                                      time_register)
-            final_hash = generate_hash_ontology_dataclass_list(ontology_dataclass_list)
+                                      time_register, rules_plan, worklist_register, execution_counters)
+            final_state = get_state_ontology_dataclass_list(ontology_dataclass_list, verify_with_hash)
 
         # Loop always_automatic_rules + general_rules
-        initial_hash = final_hash
+        initial_state = final_state
         for rule in list_of_rules:
-            switch_rule_execution(ontology_dataclass_list, graph, nodes_list, rule, configurations, time_register)
-        final_hash = generate_hash_ontology_dataclass_list(ontology_dataclass_list)
+            switch_rule_execution(ontology_dataclass_list, graph, nodes_list, rule, configurations, time_register,
+                                  rules_plan, worklist_register, execution_counters)
+        final_state = get_state_ontology_dataclass_list(ontology_dataclass_list, verify_with_hash)
 
-        if initial_hash == final_hash:
-            logger.debug("Final hash equals initial hash for the dataclass list. "
+        if initial_state == final_state:
+            logger.debug("Final state equals initial state for the dataclass list. "
                          "GUFO types hierarchy rules successfully concluded.")
         else:
-            logger.debug("Final hash does not equals initial hash for the dataclass list. Re-executing rules.")
+            logger.debug("Final state does not equals initial state for the dataclass list. Re-executing rules.")
 
     logger.info("GUFO types hierarchy rules concluded.")
 
-    return time_register
+    return time_register, execution_counters
 
 
-def switch_rule_execution(ontology_dataclass_list, graph, nodes_list, rule_code, configurations, time_register):
-    """ A switch function that calls the rule received in its parameter. """
+def initialize_time_register():
+    """ Returns the register of the execution times of all rules, in the registry order. """
 
-    logger = initialize_logger()
+    time_register = {"execution": 0}
 
-    logger.debug(f"Acessing rule {rule_code} ...")
+    for rule_code in get_rules_codes():
+        time_register[rule_code] = 0
 
-    st = time.perf_counter()
+    time_register["total_time"] = 0
 
-    if rule_code == "k_s_sup":
-        rule_k_s_sup(ontology_dataclass_list, graph, nodes_list)
-    elif rule_code == "s_k_sub":
-        rule_s_k_sub(ontology_dataclass_list, graph, nodes_list)
-    elif rule_code == "t_k_sup":
-        rule_t_k_sup(ontology_dataclass_list, graph, nodes_list)
-    elif rule_code == "ns_s_sup":
-        rule_ns_s_sup(ontology_dataclass_list, graph, nodes_list)
-    elif rule_code == "s_ns_sub":
-        rule_s_ns_sub(ontology_dataclass_list, graph, nodes_list)
-    elif rule_code == "r_ar_sup":
-        rule_r_ar_sup(ontology_dataclass_list, graph, nodes_list)
-    elif rule_code == "ar_r_sub":
-        rule_ar_r_sub(ontology_dataclass_list, graph, nodes_list)
-    elif rule_code == "n_r_t":
-        rule_n_r_t(ontology_dataclass_list, nodes_list, configurations)
-    elif rule_code == "ns_s_spe":
-        rule_ns_s_spe(ontology_dataclass_list, graph, nodes_list, configurations)
-    elif rule_code == "nk_k_sup":
-        rule_nk_k_sup(ontology_dataclass_list, graph, nodes_list, configurations)
-    elif rule_code == "s_nsup_k":
-        rule_s_nsup_k(ontology_dataclass_list, graph, nodes_list, configurations)
-    elif rule_code == "ns_sub_r":
-        rule_ns_sub_r(ontology_dataclass_list, graph, nodes_list, configurations)
-    elif rule_code == "nrs_ns_r":
-        rule_nrs_ns_r(ontology_dataclass_list, graph, nodes_list, configurations)
-    elif rule_code == "ks_sf_in":
-        rule_ks_sf_in(ontology_dataclass_list, graph, nodes_list)
-    else:
+    return time_register
+
+
+def switch_rule_execution(ontology_dataclass_list, graph, nodes_list, rule_code, configurations, time_register,
+                          rules_plan=None, worklist_register=None, execution_counters=None):
+    """ Calls the rule received in its parameter using its function and parameters registered in RULES_TYPES_REGISTRY.
+        If a worklist_register is received (worklist scheduler), it is used to skip the rule's executions with no effect.
+        If execution_counters are received (see initialize_execution_counters), the rule's execution is counted in them.
+    """
+
+    logger.debug("Acessing rule %s ...", rule_code)
+
+    if rule_code not in RULES_TYPES_REGISTRY:
         logger.error(f"Unexpected rule code ({rule_code}) received as parameter! Program aborted.")
         exit(1)
 
+    rule = RULES_TYPES_REGISTRY[rule_code]
+
+    st = time.perf_counter()
+
+    rule_arguments = {"graph": graph,
+                      "nodes_list": nodes_list,
+                      "configurations": configurations,
+                      "fired_classes": None,
+                      "skip_registered": False}
+
+    if worklist_register is not None:
+        if is_rule_execution_skipped(ontology_dataclass_list, rule_code, rules_plan, worklist_register):
+            logger.debug("Rule %s skipped. It was not affected by any rule since its last execution.", rule_code)
+            if execution_counters is not None:
+                execution_counters["rules_skipped"] += 1
+            return time_register
+
+        if rule["scheduling"] == "propagation":
+            rule_arguments["fired_classes"] = worklist_register["fired_classes"][rule_code]
+        elif rule["scheduling"] == "registering":
+            rule_arguments["skip_registered"] = True
+
+        initial_state = get_state_ontology_dataclass_list(ontology_dataclass_list)
+        worklist_register["last_starts"][rule_code] = initial_state
+
+    rule["function"](ontology_dataclass_list, *[rule_arguments[parameter] for parameter in rule["parameters"]])
+    if execution_counters is not None:
+        execution_counters["rules_executions"] += 1
+
+    if worklist_register is not None:
+        final_state = get_state_ontology_dataclass_list(ontology_dataclass_list)
+        if final_state != initial_state:
+            worklist_register["last_changes"][rule_code] = final_state
+
     et = time.perf_counter()
     elapsed_time = et - st
     time_register[rule_code] += elapsed_time
     time_register["total_time"] += elapsed_time
 
-    logger.debug(f"Rule {rule_code} successfully performed.")
+    logger.debug("Rule %s successfully performed.", rule_code)
 
     return time_register
@@ -6,6 +6,8 @@ from prettytable import PrettyTable
 from modules.ontcatowl.modules.utils_dataclass import get_element_list, select_list
 from modules.tester.logger_config import initialize_logger
 
+logger = initialize_logger()
+
 # Frequent GUFO types
 GUFO_KIND = "gufo:Kind"
 
@@ -44,8 +46,6 @@ def select_class_from_list(list_ontology_dataclasses, list_option_classes):
     Return values can be: the URI of the selected class (string) or "skipped".
     """
 
-    logger = initialize_logger()
-
     list_option_classes.sort()
 
     if len(list_option_classes) == 0:
@@ -72,8 +72,6 @@ def select_class_from_list(list_ontology_dataclasses, list_option_classes):
 def set_interactively_class_as_gufo_type(ontology_dataclass, gufo_type):
     """ User interaction for setting the parameter ontology_dataclass as the gufo_type provided as parameter. """
 
-    logger = initialize_logger()
-
     option = None
     valid = False
 
@@ -99,8 +97,6 @@ def set_type_for_class(ontology_dataclass):
         ontology_dataclass = return_dataclass_from_class_name(list_ontology_dataclasses, class_name)
     """
 
-    logger = initialize_logger()
-
     print_class_types(ontology_dataclass)
     print("\n")
 
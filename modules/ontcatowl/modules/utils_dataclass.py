@@ -3,18 +3,37 @@ import operator
 
 from modules.tester.logger_config import initialize_logger
 
+logger = initialize_logger()
+
 
 def update_all_ontology_dataclass_list(ontology_dataclass_list):
     """ Updates all lists of all dataclasses inside the ontology dataclass list. """
 
-    initial_hash = generate_hash_ontology_dataclass_list(ontology_dataclass_list)
-    final_hash = 0
+    initial_state = get_state_ontology_dataclass_list(ontology_dataclass_list)
+    final_state = None
 
-    while initial_hash != final_hash:
-        initial_hash = final_hash
+    while initial_state != final_state:
+        initial_state = final_state
         for ontology_dataclass in ontology_dataclass_list:
             ontology_dataclass.update_all_internal_lists_from_gufo()
-        final_hash = generate_hash_ontology_dataclass_list(ontology_dataclass_list)
+        final_state = get_state_ontology_dataclass_list(ontology_dataclass_list)
+
+
+def get_state_ontology_dataclass_list(ontology_dataclass_list, verify_with_hash=False):
+    """ Returns a value that changes whenever the lists of the dataclasses in the ontology dataclass list are modified.
+        Used for verifying if a group of operations (e.g., a round of rules) modified the list.
+
+        By default, the value is the counter of the OntologyChangesRegister of the OntologyDataClassRegistry,
+        which is obtained in O(1).
+
+        If verify_with_hash is True, the hash of the complete list (generate_hash_ontology_dataclass_list) is returned
+        instead. This is much slower and is only intended for debugging and verification purposes.
+    """
+
+    if verify_with_hash:
+        return generate_hash_ontology_dataclass_list(ontology_dataclass_list)
+
+    return ontology_dataclass_list.changes_register.changes_counter
 
 
 def generate_hash_ontology_dataclass_list(ontology_dataclass_list, hash_type="TOTAL"):
@@ -27,7 +46,6 @@ def generate_hash_ontology_dataclass_list(ontology_dataclass_list, hash_type="TO
 
     """
 
-    logger = initialize_logger()
     logger.debug("Generating hash for the complete list of ontology dataclasses...")
 
     total_hash = 0
@@ -36,8 +54,8 @@ def generate_hash_ontology_dataclass_list(ontology_dataclass_list, hash_type="TO
         class_hash = ontology_dataclass.create_hash(hash_type)
         total_hash += class_hash
 
-    logger.debug(
-        f"Hash for the complete list of ontology dataclasses successfully created. Hash value is: {total_hash}")
+    logger.debug("Hash for the complete list of ontology dataclasses successfully created. Hash value is: %s",
+                 total_hash)
 
     return total_hash
 
@@ -46,35 +64,16 @@ def get_list_gufo_classification(ontology_dataclass_list, list_uris, search_list
     """ Receives a list of URIs (list_uris), the name of the list to be searched (search_list), and the element that
     must be in that list. Allowed search_list values can be: IS, CAN or NOT (valid for both types or individuals).
 
-    Returns a list of URIs of the elements from the list_uris that have the element in its search_list.
+    Returns a list of URIs of the elements from the list_uris that have the element in its search_list, in the order
+    of the ontology_dataclass_list (an OntologyDataClassRegistry, whose indexes are used for the search).
     """
 
-    global search_individual, search_type
-
-    logger = initialize_logger()
-    return_list = []
-
-    for ontology_dataclass in ontology_dataclass_list:
-
-        # CONDITION 1: The searched occurs for the URIs inside the list_uris.
-        if ontology_dataclass.uri not in list_uris:
-            continue
-
-        if search_list == "IS":
-            search_type = ontology_dataclass.is_type
-            search_individual = ontology_dataclass.is_individual
-        elif search_list == "CAN":
-            search_type = ontology_dataclass.can_type
-            search_individual = ontology_dataclass.can_individual
-        elif search_list == "NOT":
-            search_type = ontology_dataclass.not_type
-            search_individual = ontology_dataclass.not_individual
-        else:
-            logger.error("Unexpected search list value. Program aborted.")
-            exit(1)
+    if search_list not in ["IS", "CAN", "NOT"]:
+        logger.error("Unexpected search list value. Program aborted.")
+        exit(1)
 
-        if (gufo_element in search_type) or (gufo_element in search_individual):
-            return_list.append(ontology_dataclass.uri)
+    uris_with_element = ontology_dataclass_list.get_uris_with_element(search_list, gufo_element)
+    return_list = ontology_dataclass_list.sort_uris(uri for uri in set(list_uris) if uri in uris_with_element)
 
     return return_list
 
@@ -82,51 +81,29 @@ def get_list_gufo_classification(ontology_dataclass_list, list_uris, search_list
 def get_element_list(ontology_dataclass_list, element, desired_list):
     """ Returns the list of known types for the inputted element (string). """
 
-    logger = initialize_logger()
-
-    returned_object = None
-
-    for ontology_dataclass in ontology_dataclass_list:
+    ontology_dataclass = ontology_dataclass_list.get_dataclass(element)
 
-        # Element identified. Returning list.
-        if ontology_dataclass.uri == element:
-            if desired_list == "is_type":
-                returned_object = ontology_dataclass.is_type
-                break
-            elif desired_list == "can_type":
-                returned_object = ontology_dataclass.can_type
-                break
-            elif desired_list == "not_type":
-                returned_object = ontology_dataclass.not_type
-                break
-            elif desired_list == "is_individual":
-                returned_object = ontology_dataclass.is_individual
-                break
-            elif desired_list == "can_individual":
-                returned_object = ontology_dataclass.can_individual
-                break
-            elif desired_list == "not_individual":
-                returned_object = ontology_dataclass.not_individual
-                break
-            else:
-                # Error. List unknown.
-                logger.error(f"Could not return the unknown list {desired_list} for "
-                             f"element {element}. Program aborted.")
-                exit(1)
-    else:
+    if ontology_dataclass is None:
         # Error. Element not found, report problem and exit program.
         logger.error(f"Could not return list {desired_list} for the unknown element {element}. Program aborted.")
         exit(1)
 
-    return returned_object
+    if desired_list not in ["is_type", "can_type", "not_type", "is_individual", "can_individual", "not_individual"]:
+        # Error. List unknown.
+        logger.error(f"Could not return the unknown list {desired_list} for "
+                     f"element {element}. Program aborted.")
+        exit(1)
+
+    return ontology_dataclass.get_list(desired_list)
 
 
 def external_move_to_is_list(list_ontology_dataclasses, class_name, classification):
     """ Receives the URI of an ontology dataclass and moves an element (from inputted element name) to its is list. """
 
-    for ontology_dataclass in list_ontology_dataclasses:
-        if ontology_dataclass.uri == class_name:
-            ontology_dataclass.move_element_to_is_list(classification)
+    ontology_dataclass = list_ontology_dataclasses.get_dataclass(class_name)
+
+    if ontology_dataclass is not None:
+        ontology_dataclass.move_element_to_is_list(classification)
 
 
 def external_move_list_to_is_list(list_ontology_dataclasses, list_classes_to_move, classification):
@@ -134,23 +111,15 @@ def external_move_list_to_is_list(list_ontology_dataclasses, list_classes_to_mov
     to their is_list. """
 
     for dataclass_to_move in list_classes_to_move:
-        for ontology_dataclass in list_ontology_dataclasses:
-            if ontology_dataclass.uri == dataclass_to_move:
-                ontology_dataclass.move_element_to_is_list(classification)
+        external_move_to_is_list(list_ontology_dataclasses, dataclass_to_move, classification)
 
 
 def return_dataclass_from_class_name(list_ontology_dataclasses, class_name):
     """ Receives a class name and returns the corresponding dataclass element from the list of dataclasses. """
 
-    logger = initialize_logger()
-
-    return_object = None
+    return_object = list_ontology_dataclasses.get_dataclass(class_name)
 
-    for ontology_dataclass in list_ontology_dataclasses:
-        if ontology_dataclass.uri == class_name:
-            return_object = ontology_dataclass
-            break
-    else:
+    if return_object is None:
         logger.error("Class not found in the list of ontology dataclasses. Program aborted.")
         exit(1)
 
@@ -185,9 +154,4 @@ def sort_all_ontology_dataclass_list(ontology_dataclass_list):
     ontology_dataclass_list.sort(key=operator.attrgetter('uri'))
 
     for ontology_dataclass in ontology_dataclass_list:
-        ontology_dataclass.is_type.sort()
-        ontology_dataclass.can_type.sort()
-        ontology_dataclass.not_type.sort()
-        ontology_dataclass.is_individual.sort()
-        ontology_dataclass.can_individual.sort()
-        ontology_dataclass.not_individual.sort()
+        ontology_dataclass.sort_all_internal_lists()
@@ -1,5 +1,6 @@
 """ Auxiliary functions for extending and complementing RDFLib's RDF treatment functions """
 import copy
+import sys
 import time
 
 from owlrl import DeductiveClosure, RDFS_Semantics
@@ -7,6 +8,8 @@ from rdflib import RDF, OWL, Graph
 
 from modules.tester.logger_config import initialize_logger
 
+logger = initialize_logger()
+
 
 def load_graph_safely_considering_restrictions(ontology_file, graph_restriction=None):
     """ Safely load graph from file to working memory.
@@ -24,8 +27,6 @@ def load_graph_safely_considering_restrictions(ontology_file, graph_restriction=
 def load_all_graph_safely(ontology_file):
     """ Safely load graph from file to working memory. """
 
-    logger = initialize_logger()
-
     ontology_graph = Graph()
 
     try:
@@ -54,13 +55,19 @@ def reduce_graph_considering_restrictions(original_graph, restrictions_list):
 
 
 def load_restrictions_only_graph_safely(owl_file_path, restrictions_list):
-    """ Extract the dataset model's taxonomy into a new graph. """
+    """ Extract the dataset model's taxonomy into a new graph.
+        Only the triples whose predicates are in the restrictions_list are copied from the loaded graph.
+    """
 
-    working_graph = load_all_graph_safely(owl_file_path)
+    loaded_graph = load_all_graph_safely(owl_file_path)
 
-    for subj, pred, obj in working_graph:
-        if pred not in restrictions_list:
-            working_graph.remove((subj, pred, obj))
+    working_graph = Graph()
+    for prefix, namespace in loaded_graph.namespaces():
+        working_graph.bind(prefix, namespace)
+
+    for restriction in restrictions_list:
+        for triple in loaded_graph.triples((None, restriction, None)):
+            working_graph.add(triple)
 
     return working_graph
 
@@ -118,45 +125,29 @@ def get_ontology_uri(ontology_graph):
 
 
 def get_list_of_all_classes(ontology_graph, exceptions_list=None):
-    """ Returns a list of all classes as URI strings without repetitions available in a Graph.
-    Classes that have namespaces included in the exception_list parameter are not included in the returned list. """
-
-    if exceptions_list == None:
-        exceptions_list = []
+    """ Returns a sorted list of all classes (i.e., subjects of rdf:type owl:Class) as URI strings without repetitions
+    available in a Graph. Classes that have namespaces included in the exception_list parameter are not included in
+    the returned list. The URI strings are interned, as they are used as keys in all indexes of the classes. """
 
-    classes_list = []
+    exceptions_prefixes = tuple(set(exceptions_list)) if exceptions_list else ()
 
-    for sub, pred, obj in ontology_graph:
-        if (sub, RDF.type, OWL.Class) in ontology_graph:
-            # Eliminating BNodes
-            if type(sub).__name__ != "BNode":
-                # N3 necessary for returning string and [1:-1] necessary for removing <>
-                classes_list.append(sub.n3()[1:-1])
-        if (obj, RDF.type, OWL.Class) in ontology_graph:
-            # Eliminating BNodes
-            if type(obj).__name__ != "BNode":
-                # N3 necessary for returning string and [1:-1] necessary for removing <>
-                classes_list.append(obj.n3()[1:-1])
+    classes_set = set()
 
-    # Removing repetitions
-    no_rep_classes_list = [*set(classes_list)]
+    for sub in ontology_graph.subjects(RDF.type, OWL.Class):
+        # Eliminating BNodes
+        if type(sub).__name__ != "BNode":
+            # N3 necessary for returning string and [1:-1] necessary for removing <>
+            class_uri = sub.n3()[1:-1]
+            # Removing classes that have namespace in the exceptions_list
+            if not class_uri.startswith(exceptions_prefixes):
+                classes_set.add(sys.intern(class_uri))
 
-    # Removing classes that have namespace in the exceptions_list
-    classes_list = no_rep_classes_list.copy()
-    for class_uri in no_rep_classes_list:
-        for exception_item in exceptions_list:
-            if class_uri.startswith(exception_item):
-                classes_list.remove(class_uri)
-                break
-
-    return classes_list
+    return sorted(classes_set)
 
 
 def perform_reasoning(ontology_graph):
     """Perform reasoner and consequently expands the ontology graph. """
 
-    logger = initialize_logger()
-
     logger.info("Initializing RDFS reasoning. This may take a while...")
 
     st = time.perf_counter()
@@ -0,0 +1,84 @@
+""" Writer of the classes' yaml files of Test 1 and Test 2 (classes_*.yaml), which contain one document per class.
+
+    The documents are written by a streaming emitter for the files' fixed schema, which is much faster than the yaml
+    library's pure-Python emitter. Documents with strings that are not written as plain scalars (e.g., class names that
+    need quotes) are left to the yaml library. The output is the same as yaml.dump_all(ontology_dictionary_list, file,
+    sort_keys=True).
+
+    The libyaml-based yaml.CDumper is not used, as its output differs in some cases (e.g., keys with 123 to 128
+    characters and empty keys), and it is also slower than the streaming emitter.
+"""
+import re
+
+import yaml
+from yaml.resolver import Resolver
+
+# Keys of the classes' dictionaries (see convert_ontology_dataclass_list_to_dictionary_list_t2), sorted.
+CLASSES_YAML_KEYS = ["can_type", "detected_in", "input", "is_incomplete", "is_type", "not_type"]
+
+# Strings with only these characters are plain scalars, unless they are resolved to another type (e.g., "no").
+PLAIN_STRING_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_.\-]*(:[A-Za-z0-9_.\-]+)*")
+
+# Keys are emitted as simple keys (i.e., without "? ") only when they are shorter than this size. The yaml emitter's
+# limit is 128 characters, in which the key's tag (!!str) is also counted.
+MAXIMUM_SIMPLE_KEY_SIZE = 123
+
+STRING_RESOLVER = Resolver()
+
+
+def is_plain_yaml_string(string):
+    """ Returns True if the yaml emitter writes the string as a plain (i.e., not quoted) scalar. """
+
+    return PLAIN_STRING_PATTERN.fullmatch(string) is not None and \
+        STRING_RESOLVER.resolve(yaml.ScalarNode, string, (True, False)) == Resolver.DEFAULT_SCALAR_TAG
+
+
+def emit_classes_yaml_document(ontology_dictionary):
+    """ Returns the yaml document of a class' dictionary, or None if it does not follow the classes' schema or contains
+        strings that are not written as plain scalars.
+    """
+
+    if len(ontology_dictionary) != 1:
+        return None
+
+    (class_name, class_information), = ontology_dictionary.items()
+
+    if not isinstance(class_name, str) or len(class_name) >= MAXIMUM_SIMPLE_KEY_SIZE or \
+            not is_plain_yaml_string(class_name) or sorted(class_information) != CLASSES_YAML_KEYS:
+        return None
+
+    lines = [class_name + ":"]
+
+    for key in CLASSES_YAML_KEYS:
+        value = class_information[key]
+
+        if isinstance(value, bool):
+            lines.append(f"  {key}: {'true' if value else 'false'}")
+        elif isinstance(value, list) and not value:
+            lines.append(f"  {key}: []")
+        elif isinstance(value, list) and all(isinstance(element, str) and is_plain_yaml_string(element)
+                                             for element in value):
+            lines.append(f"  {key}:")
+            lines.extend(f"  - {element}" for element in value)
+        else:
+            return None
+
+    lines.append("")
+
+    return "\n".join(lines)
+
+
+def dump_classes_yaml(ontology_dictionary_list, file):
+    """ Writes the list of classes' dictionaries in the file, one yaml document per class, with the same output as
+        yaml.dump_all(ontology_dictionary_list, file, sort_keys=True).
+    """
+
+    for position, ontology_dictionary in enumerate(ontology_dictionary_list):
+        if position > 0:
+            file.write("---\n")
+
+        document = emit_classes_yaml_document(ontology_dictionary)
+        if document is None:
+            document = yaml.dump(ontology_dictionary, sort_keys=True)
+
+        file.write(document)
@@ -0,0 +1,55 @@
+""" Functions for executing the tests' units (independent executions of OntCatOWL) in parallel processes. """
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from modules.ontcatowl.modules.initialization_data_gufo_dictionary import get_gufo_dictionary
+from modules.ontcatowl.ontcatowl import get_gufo_graph
+from modules.tester.logger_config import initialize_logger
+
+# Maximum number of units dispatched to the pool and not yet yielded, per worker. Results are kept in the parent process
+# until yielded, hence this limit bounds the memory used by results waiting for the writer.
+UNITS_IN_FLIGHT_PER_WORKER = 2
+
+
+def initialize_test_worker():
+    """ Initializer of each worker process. Pre-loads the GUFO graph and data (including its closure table), so that
+        they are reused by all executions of OntCatOWL performed by the worker.
+    """
+
+    logger = initialize_logger()
+    logger.debug("Initializing test worker process...")
+
+    get_gufo_graph()
+    get_gufo_dictionary()
+
+
+def execute_test_units(unit_function, test_units, number_workers, worker_initializer=initialize_test_worker):
+    """ Generator that executes the unit_function for each one of the test_units and yields the results in the order of
+        the test_units, so that they can be written by a single writer (the caller) as in a sequential execution.
+
+        If number_workers is 1, the units are executed sequentially in the current process. Otherwise, they are
+        dispatched to a pool of number_workers processes, each one initialized by the worker_initializer (if not None).
+        At most UNITS_IN_FLIGHT_PER_WORKER * number_workers units are dispatched and not yet yielded: a new unit is only
+        dispatched after the result of the oldest one is yielded. The unit_function and the test units must be
+        picklable.
+    """
+
+    if number_workers <= 1:
+        for test_unit in test_units:
+            yield unit_function(test_unit)
+        return
+
+    logger = initialize_logger()
+    logger.info(f"Executing {len(test_units)} units in {number_workers} parallel processes.\n")
+
+    with ProcessPoolExecutor(max_workers=number_workers, initializer=worker_initializer) as executor:
+        pending_futures = deque()
+        maximum_in_flight = UNITS_IN_FLIGHT_PER_WORKER * number_workers
+
+        for test_unit in test_units:
+            if len(pending_futures) >= maximum_in_flight:
+                yield pending_futures.popleft().result()
+            pending_futures.append(executor.submit(unit_function, test_unit))
+
+        while pending_futures:
+            yield pending_futures.popleft().result()
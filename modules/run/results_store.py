@@ -0,0 +1,328 @@
+""" Results store: a binary alternative to the YAML and CSV output files of Test 2.
+
+    All results of a dataset's test (the classes' states, times and statistics of every execution and the list of
+    inconsistent executions) are appended to a single file, instead of being written in a few files per execution. The
+    files can be read through a memory map (see ResultsStoreReader) or exported to the YAML and CSV files' layout (see
+    export_results_store_t2 in test2.py).
+
+    FILE FORMAT (all integers are little-endian):
+        - RESULTS_STORE_MAGIC, followed by a sequence of records.
+        - Each record has a header (kind: 4 bytes, payload_size: uint32) followed by its payload.
+        - Strings (class names, GUFO types, rule codes, etc.) are stored only once, in STRS records, and referenced by
+            their ids (uint32), which are their positions in the order in which they were stored. A STRS record
+            always precedes the first record that references its strings.
+
+    RECORDS:
+        - STRS: number of strings (uint32) and, for each string, its size (uint32) and its UTF-8 encoding.
+        - EXEC: percentage and execution (int32 each), followed by the execution's columns (see EXECUTION_COLUMNS).
+        - INCO: percentage and execution (int32 each) of an execution in which an inconsistency was found.
+
+    Inside an EXEC record, the values of each column are stored contiguously (i.e., each execution is a row group of a
+    columnar file). A column is its number of values (uint32) followed by the values:
+        - "ids" and "counts" columns: uint32 values.
+        - "flags" columns: uint8 values.
+        - "values" columns: one type code (uint8, see VALUE_TYPES) for each value, followed by the values as float64.
+            Strings are stored as the float64 of their ids.
+    A list of lists (e.g., the is_type lists of all classes) is stored as a "counts" column with the size of each list
+    followed by an "ids" column with the concatenation of all lists.
+"""
+import mmap
+import struct
+
+from modules.tester.logger_config import initialize_logger
+
+RESULTS_STORE_FILENAME = "results_store.bin"
+
+RESULTS_STORE_MAGIC = b"OntCatOWL-ResultsStore-1\n"
+
+RECORD_HEADER = struct.Struct("<4sI")
+EXECUTION_KEY = struct.Struct("<ii")
+
+# Columns of the EXEC records, in the order in which they are stored.
+EXECUTION_COLUMNS = [("classes", "ids"), ("input", "flags"),
+                     ("is_type_counts", "counts"), ("is_type", "ids"),
+                     ("can_type_counts", "counts"), ("can_type", "ids"),
+                     ("not_type_counts", "counts"), ("not_type", "ids"),
+                     ("is_incomplete", "flags"),
+                     ("detected_in_counts", "counts"), ("detected_in", "ids"),
+                     ("results_classes", "ids"), ("results_stereotypes", "ids"), ("results_final_lists", "ids"),
+                     ("times_keys", "ids"), ("times_values", "values"),
+                     ("statistics_values", "values")]
+
+# Type codes of the "values" columns.
+VALUE_TYPES = {int: 0, float: 1, str: 2, bool: 3}
+
+# Lists of the classes' states stored in the EXEC records (the keys of the classes' YAML dictionaries).
+CLASSES_LISTS = ["is_type", "can_type", "not_type", "detected_in"]
+
+
+class ResultsStoreWriter(object):
+    """ Writes a results store file. The file is created (or overwritten) when the writer is created and the records
+        are only appended to it, in the order in which the append methods are called. The writes are buffered.
+    """
+
+    def __init__(self, store_path):
+
+        logger = initialize_logger()
+
+        self.store_path = store_path
+        self.strings_ids = {}
+        self.new_strings = []
+
+        try:
+            self.file = open(store_path, 'wb')
+        except OSError as error:
+            logger.error(f"Could not create {store_path} file. Exiting program.\n"
+                         f"System error reported: {error}")
+            exit(1)
+
+        self.file.write(RESULTS_STORE_MAGIC)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_string_id(self, string):
+        """ Returns the id of the string, which is stored in the next STRS record if it is new. """
+
+        string_id = self.strings_ids.get(string)
+
+        if string_id is None:
+            string_id = len(self.strings_ids)
+            self.strings_ids[string] = string_id
+            self.new_strings.append(string)
+
+        return string_id
+
+    def encode_column(self, column, column_type, values):
+        """ Returns the bytes of a column of one of the types described in this module's docstring.
+            Raises a ValueError if a value of a "values" column is not of one of the VALUE_TYPES.
+        """
+
+        number_values = len(values)
+
+        if column_type == "flags":
+            return struct.pack("<I", number_values) + bytes(values)
+
+        if column_type == "values":
+            types_codes = []
+            for value in values:
+                if type(value) not in VALUE_TYPES:
+                    raise ValueError(f"The value {value!r} of the column {column} of {self.store_path} has the "
+                                     f"unsupported type {type(value).__name__}. Supported types are "
+                                     f"{', '.join(value_type.__name__ for value_type in VALUE_TYPES)}.")
+                types_codes.append(VALUE_TYPES[type(value)])
+            numbers = [float(self.get_string_id(value)) if isinstance(value, str) else float(value)
+                       for value in values]
+            return struct.pack(f"<I{number_values}B{number_values}d", number_values, *types_codes, *numbers)
+
+        return struct.pack(f"<I{number_values}I", number_values, *values)
+
+    def write_record(self, kind, payload):
+        """ Writes a record, preceded by a STRS record with the strings that were not stored yet (if any). """
+
+        if self.new_strings:
+            encoded_strings = [string.encode("utf-8") for string in self.new_strings]
+            strings_payload = struct.pack("<I", len(encoded_strings)) + \
+                b"".join(struct.pack("<I", len(encoded)) + encoded for encoded in encoded_strings)
+            self.file.write(RECORD_HEADER.pack(b"STRS", len(strings_payload)) + strings_payload)
+            self.new_strings = []
+
+        self.file.write(RECORD_HEADER.pack(kind, len(payload)) + payload)
+
+    def append_execution(self, percentage_number, execution_number, ontology_dictionary_list, classes_results_rows,
+                         times_row, statistics_row):
+        """ Appends the results of an execution, received in the structures used for writing the YAML and CSV files:
+            the list of single-key dictionaries of the classes' YAML file, the rows of the classes' results CSV file,
+            the row (dictionary) of the times CSV file and the row (list) of the statistics CSV file.
+        """
+
+        columns = {column: [] for column, _ in EXECUTION_COLUMNS}
+
+        for ontology_dictionary in ontology_dictionary_list:
+            for class_name, class_information in ontology_dictionary.items():
+                columns["classes"].append(self.get_string_id(class_name))
+                columns["input"].append(int(class_information["input"]))
+                columns["is_incomplete"].append(int(class_information["is_incomplete"]))
+                for list_name in CLASSES_LISTS:
+                    columns[list_name + "_counts"].append(len(class_information[list_name]))
+                    columns[list_name].extend(self.get_string_id(element) for element in class_information[list_name])
+
+        for class_name, class_stereotype, final_list in classes_results_rows:
+            columns["results_classes"].append(self.get_string_id(class_name))
+            columns["results_stereotypes"].append(self.get_string_id(class_stereotype))
+            columns["results_final_lists"].append(self.get_string_id(final_list))
+
+        columns["times_keys"] = [self.get_string_id(key) for key in times_row]
+        columns["times_values"] = list(times_row.values())
+        columns["statistics_values"] = list(statistics_row)
+
+        payload = EXECUTION_KEY.pack(percentage_number, execution_number) + \
+            b"".join(self.encode_column(column, column_type, columns[column])
+                     for column, column_type in EXECUTION_COLUMNS)
+
+        self.write_record(b"EXEC", payload)
+
+    def append_inconsistency(self, percentage_number, execution_number):
+        """ Appends an execution in which an inconsistency was found. """
+
+        self.write_record(b"INCO", EXECUTION_KEY.pack(percentage_number, execution_number))
+
+    def close(self):
+        self.file.close()
+
+
+class ResultsStoreReader(object):
+    """ Reads a results store file through a memory map. When created, the reader scans the records' headers, loading
+        the strings and the list of records, i.e., tuples (kind, percentage, execution, offset), in which offset is the
+        position of the record's payload. The executions' columns are only decoded when requested.
+    """
+
+    def __init__(self, store_path):
+
+        logger = initialize_logger()
+
+        self.store_path = store_path
+        self.strings = []
+        self.records = []
+
+        try:
+            with open(store_path, 'rb') as file:
+                self.memory_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as error:
+            logger.error(f"Could not read {store_path} file. Exiting program.\n"
+                         f"System error reported: {error}")
+            exit(1)
+
+        if self.memory_map[:len(RESULTS_STORE_MAGIC)] != RESULTS_STORE_MAGIC:
+            logger.error(f"The file {store_path} is not a results store. Exiting program.")
+            exit(1)
+
+        offset = len(RESULTS_STORE_MAGIC)
+        store_size = len(self.memory_map)
+
+        while offset < store_size:
+            # A store whose writing was interrupted may end with an incomplete record, which is ignored.
+            if offset + RECORD_HEADER.size > store_size:
+                logger.warning(f"The file {store_path} ends with an incomplete record header at offset {offset}. "
+                               f"Only its {len(self.records)} complete records are read.")
+                break
+
+            kind, payload_size = RECORD_HEADER.unpack_from(self.memory_map, offset)
+
+            if offset + RECORD_HEADER.size + payload_size > store_size:
+                logger.warning(f"The file {store_path} ends with an incomplete {kind!r} record at offset {offset}. "
+                               f"Only its {len(self.records)} complete records are read.")
+                break
+
+            offset += RECORD_HEADER.size
+
+            if kind == b"STRS":
+                self.load_strings(offset)
+            else:
+                percentage_number, execution_number = EXECUTION_KEY.unpack_from(self.memory_map, offset)
+                self.records.append((kind.decode("ascii"), percentage_number, execution_number, offset))
+
+            offset += payload_size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def load_strings(self, offset):
+        """ Loads the strings of the STRS record whose payload starts at the offset. """
+
+        number_strings, = struct.unpack_from("<I", self.memory_map, offset)
+        offset += 4
+
+        for _ in range(number_strings):
+            string_size, = struct.unpack_from("<I", self.memory_map, offset)
+            offset += 4
+            self.strings.append(self.memory_map[offset:offset + string_size].decode("utf-8"))
+            offset += string_size
+
+    def decode_column(self, column_type, offset):
+        """ Returns the tuple (values, next_offset) for the column that starts at the offset. """
+
+        number_values, = struct.unpack_from("<I", self.memory_map, offset)
+        offset += 4
+
+        if column_type == "flags":
+            return list(self.memory_map[offset:offset + number_values]), offset + number_values
+
+        if column_type == "values":
+            types_codes = struct.unpack_from(f"<{number_values}B", self.memory_map, offset)
+            offset += number_values
+            numbers = struct.unpack_from(f"<{number_values}d", self.memory_map, offset)
+            values = [self.decode_value(type_code, number) for type_code, number in zip(types_codes, numbers)]
+            return values, offset + 8 * number_values
+
+        return list(struct.unpack_from(f"<{number_values}I", self.memory_map, offset)), offset + 4 * number_values
+
+    def decode_value(self, type_code, number):
+        """ Returns the value of a "values" column from its type code and float64 number. """
+
+        if type_code == VALUE_TYPES[int]:
+            return int(number)
+        if type_code == VALUE_TYPES[str]:
+            return self.strings[int(number)]
+        if type_code == VALUE_TYPES[bool]:
+            return bool(number)
+        return number
+
+    def read_columns(self, record):
+        """ Returns the dictionary with the raw values of all columns of an EXEC record, indexed by column name. """
+
+        columns = {}
+        offset = record[3] + EXECUTION_KEY.size
+
+        for column, column_type in EXECUTION_COLUMNS:
+            columns[column], offset = self.decode_column(column_type, offset)
+
+        return columns
+
+    def read_execution(self, record):
+        """ Returns the results of an EXEC record in the structures received by ResultsStoreWriter.append_execution:
+            the tuple (ontology_dictionary_list, classes_results_rows, times_row, statistics_row).
+        """
+
+        columns = self.read_columns(record)
+        strings = self.strings
+
+        # Splits the concatenated ids of each list into the lists of each class.
+        classes_lists = {}
+        for list_name in CLASSES_LISTS:
+            elements = columns[list_name]
+            classes_lists[list_name] = []
+            position = 0
+            for count in columns[list_name + "_counts"]:
+                classes_lists[list_name].append([strings[element] for element in elements[position:position + count]])
+                position += count
+
+        ontology_dictionary_list = []
+        for position, class_id in enumerate(columns["classes"]):
+            ontology_dictionary_list.append({
+                strings[class_id]: {
+                    "input": bool(columns["input"][position]),
+                    "is_type": classes_lists["is_type"][position],
+                    "can_type": classes_lists["can_type"][position],
+                    "not_type": classes_lists["not_type"][position],
+                    "is_incomplete": bool(columns["is_incomplete"][position]),
+                    "detected_in": classes_lists["detected_in"][position]}
+            })
+
+        classes_results_rows = [[strings[class_id], strings[stereotype_id], strings[final_list_id]]
+                                for class_id, stereotype_id, final_list_id in
+                                zip(columns["results_classes"], columns["results_stereotypes"],
+                                    columns["results_final_lists"])]
+
+        times_row = {strings[key_id]: value for key_id, value in zip(columns["times_keys"], columns["times_values"])}
+
+        return ontology_dictionary_list, classes_results_rows, times_row, columns["statistics_values"]
+
+    def close(self):
+        self.memory_map.close()
@@ -0,0 +1,65 @@
+""" Writer of the csv files that receive one row per execution of a test (e.g., execution_times.csv). """
+import csv
+
+from modules.tester.logger_config import initialize_logger
+
+# Number of rows written in a file after which the file's buffer is flushed.
+CSV_FLUSH_INTERVAL = 100
+
+
+class CsvResultsWriter(object):
+    """ Keeps the csv files of a test open while their rows are written, instead of opening them for every row.
+
+        A file is created (or overwritten) when its first row is written, which is preceded by the file's header. Hence,
+        each header is written exactly once, independently of the execution whose row is received first. The rows are
+        buffered and the files are flushed every CSV_FLUSH_INTERVAL rows and when closed. Rows written in a file after
+        it was closed are appended to it. The writer is used as a context manager, so that all files are closed when the
+        writing ends, even if it is interrupted.
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.closed_files_paths = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_row(self, file_path, csv_header, csv_row):
+        """ Writes the csv_row in the file, creating it with the csv_header if it was not opened yet. """
+
+        if file_path not in self.files:
+
+            logger = initialize_logger()
+
+            is_file_created = file_path not in self.closed_files_paths
+
+            try:
+                output_file = open(file_path, 'w' if is_file_created else 'a', newline='', encoding='utf-8')
+            except OSError as error:
+                logger.error(f"Could not open {file_path} file. Exiting program.\n"
+                             f"System error reported: {error}")
+                exit(1)
+
+            self.files[file_path] = {"file": output_file, "writer": csv.writer(output_file), "pending_rows": 0}
+            if is_file_created:
+                self.files[file_path]["writer"].writerow(csv_header)
+
+        output = self.files[file_path]
+        output["writer"].writerow(csv_row)
+        output["pending_rows"] += 1
+
+        if output["pending_rows"] >= CSV_FLUSH_INTERVAL:
+            output["file"].flush()
+            output["pending_rows"] = 0
+
+    def close(self):
+        """ Closes all open files. """
+
+        for file_path, output in self.files.items():
+            output["file"].close()
+            self.closed_files_paths.add(file_path)
+
+        self.files = {}
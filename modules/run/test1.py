@@ -3,13 +3,21 @@ import csv
 import os
 import pathlib
 
-import yaml
+from rdflib import URIRef, RDF
 
+from modules.ontcatowl.modules.initialization_data_graph import initialize_nodes_lists
+from modules.ontcatowl.ontcatowl import run_ontcatowl
+from modules.run.classes_yaml import dump_classes_yaml
 from modules.tester.logger_config import initialize_logger
+from modules.tester.utils_rdf import load_graph_safely, OverlayGraph
 
 NAMESPACE_GUFO = "http://purl.org/nemo/gufo#"
 NAMESPACE_TAXONOMY = "http://taxonomy.model/"
 
+# Input classes, taxonomy graph and taxonomy nodes of the dataset last loaded by the current process, indexed by dataset
+# name. As the units are executed grouped by dataset, only one dataset is kept in memory (see load_test_dataset).
+LOADED_DATASETS = {}
+
 
 class input_class(object):
     def __init__(self, class_name, class_stereotype):
@@ -36,6 +44,48 @@ def load_baseline_dictionary(dataset):
     return list_input_classes
 
 
+def load_test_dataset(dataset, dataset_taxonomy):
+    """ Returns the tuple (input_classes_list, input_graph, taxonomy_nodes) of the dataset. The dataset is loaded,
+        parsed and indexed once and reused by its consecutive executions. When another dataset is requested, the
+        previous one is discarded.
+        The returned graph must not be modified (it is used as the base of OverlayGraphs).
+    """
+
+    if dataset not in LOADED_DATASETS:
+        LOADED_DATASETS.clear()
+        input_graph = load_graph_safely(dataset_taxonomy)
+        LOADED_DATASETS[dataset] = (load_baseline_dictionary(dataset), input_graph, initialize_nodes_lists(input_graph))
+
+    return LOADED_DATASETS[dataset]
+
+
+def execute_test1_unit(test_unit):
+    """ Executes OntCatOWL for one unit of Test 1, i.e., the execution for one input class of a dataset.
+
+        The test_unit is a tuple (global_configurations, dataset, dataset_taxonomy, input_class). Returns the tuple
+        returned by run_ontcatowl or None if an inconsistency was found.
+    """
+
+    global_configurations, dataset, dataset_taxonomy, input_class = test_unit
+
+    input_classes_list, input_graph, taxonomy_nodes = load_test_dataset(dataset, dataset_taxonomy)
+
+    working_graph = OverlayGraph(input_graph)
+    triple_subject = URIRef(NAMESPACE_TAXONOMY + input_class.class_name)
+    triple_predicate = RDF.type
+    class_gufo_type = remaps_to_gufo(input_class.class_name, input_class.class_stereotype)
+    triple_object = URIRef(class_gufo_type)
+    working_graph.add((triple_subject, triple_predicate, triple_object))
+    working_graph.bind("gufo", NAMESPACE_GUFO)
+
+    try:
+        results = run_ontcatowl(global_configurations, working_graph, taxonomy_nodes)
+    except:
+        results = None
+
+    return results
+
+
 def convert_ontology_dataclass_list_to_dictionary_list(input_class, ontology_dataclass_list):
     """ Receives an ontology_dataclass_list and returns a dictionary to be printed in yaml format. """
 
@@ -84,24 +134,25 @@ def create_classes_yaml_output(input_class, ontology_dataclass_list, test_result
     ontology_dictionary_list = convert_ontology_dataclass_list_to_dictionary_list(input_class, ontology_dataclass_list)
 
     with open(classes_output_complete_path, 'w', encoding='utf-8') as file:
-        yaml.dump_all(ontology_dictionary_list, file, sort_keys=True)
+        dump_classes_yaml(ontology_dictionary_list, file)
 
 
 def get_final_list(class_name_prefixed, class_gufo_stereotype, ontology_dataclass_list):
     final_list = "undeclared"
     logger = initialize_logger()
 
-    for dataclass in ontology_dataclass_list:
-        if dataclass.uri == class_name_prefixed:
-            if class_gufo_stereotype in dataclass.is_type:
-                final_list = "is"
-            elif class_gufo_stereotype in dataclass.can_type:
-                final_list = "can"
-            elif class_gufo_stereotype in dataclass.not_type:
-                final_list = "not"
-            else:
-                logger.error("Not found in any list.")
-                exit(1)
+    dataclass = ontology_dataclass_list.get_dataclass(class_name_prefixed)
+
+    if dataclass is not None:
+        if dataclass.in_is_list(class_gufo_stereotype):
+            final_list = "is"
+        elif dataclass.in_can_list(class_gufo_stereotype):
+            final_list = "can"
+        elif dataclass.in_not_list(class_gufo_stereotype):
+            final_list = "not"
+        else:
+            logger.error("Not found in any list.")
+            exit(1)
 
     return final_list
 
@@ -173,21 +224,13 @@ def remaps_to_gufo(class_name, gufo_lower_type, no_namespace=False):
     return valid_gufo_type
 
 
-def create_times_csv_output(time_register, test_results_folder, execution_number, execution_name):
+def create_times_csv_output(results_writer, time_register, test_results_folder, execution_number, execution_name):
     times_output_filename = f"execution_times.csv"
     times_output_complete_path = test_results_folder + "\\" + times_output_filename
 
     time_register["execution"] = execution_number
 
-    if execution_number == 1:
-        with open(times_output_complete_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=time_register.keys())
-            writer.writeheader()
-            writer.writerow(time_register)
-    else:
-        with open(times_output_complete_path, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=time_register.keys())
-            writer.writerow(time_register)
+    results_writer.write_row(times_output_complete_path, list(time_register.keys()), list(time_register.values()))
 
 
 def create_csv_header():
@@ -358,7 +401,7 @@ def calculate_incompleteness_values(ontology_dataclass_list):
     return number_incomplete_classes
 
 
-def create_statistics_csv_output(ontology_dataclass_list, consolidated_statistics, test_results_folder,
+def create_statistics_csv_output(results_writer, ontology_dataclass_list, consolidated_statistics, test_results_folder,
                                  execution_number):
     csv_header = create_csv_header()
     number_incomplete_classes = calculate_incompleteness_values(ontology_dataclass_list)
@@ -367,20 +410,12 @@ def create_statistics_csv_output(ontology_dataclass_list, consolidated_statistic
     statistics_output_filename = f"execution_statistics.csv"
     statistics = test_results_folder + "\\" + statistics_output_filename
 
-    if execution_number == 1:
-        with open(statistics, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(csv_header)
-            writer.writerow(csv_row)
-    else:
-        with open(statistics, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(csv_row)
+    results_writer.write_row(statistics, csv_header, csv_row)
 
 
-def create_summary_csv_output(test_results_folder, execution_number, input_class):
-    """ Creates and updates a CSV file with a list of all executions, the respective input classes
-    and their stereotypes. """
+def create_summary_csv_output(results_writer, test_results_folder, execution_number, input_class):
+    """ Writes, with the results_writer (a CsvResultsWriter), a row in the CSV file with a list of all executions, the
+    respective input classes and their stereotypes. """
 
     input_class_name = input_class.class_name
     input_class_stereotype = input_class.class_stereotype
@@ -391,19 +426,12 @@ def create_summary_csv_output(test_results_folder, execution_number, input_class
     statistics_output_filename = f"execution_summary.csv"
     statistics = test_results_folder + "\\" + statistics_output_filename
 
-    if execution_number == 1:
-        with open(statistics, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(csv_header)
-            writer.writerow(csv_row)
-    else:
-        with open(statistics, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(csv_row)
+    results_writer.write_row(statistics, csv_header, csv_row)
 
 
-def create_inconsistency_csv_output(test_results_folder, execution_number, input_class):
-    """ Creates and updates a CSV file with a list of all inconsistent classes and their stereotypes. """
+def create_inconsistency_csv_output(results_writer, test_results_folder, execution_number, input_class):
+    """ Writes, with the results_writer (a CsvResultsWriter), a row in the CSV file with a list of all inconsistent
+    classes and their stereotypes. """
     input_class_name = input_class.class_name
     input_class_stereotype = input_class.class_stereotype
 
@@ -413,12 +441,4 @@ def create_inconsistency_csv_output(test_results_folder, execution_number, input
     statistics_output_filename = f"inconsistencies_found.csv"
     statistics = test_results_folder + "\\" + statistics_output_filename
 
-    if execution_number == 1:
-        with open(statistics, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(csv_header)
-            writer.writerow(csv_row)
-    else:
-        with open(statistics, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(csv_row)
+    results_writer.write_row(statistics, csv_header, csv_row)
@@ -1,12 +1,18 @@
 """ Functions related to OntCatOWL Test 2 """
 import csv
 import os
+import random
 
-import yaml
+from rdflib import URIRef, RDF
 
-from modules.run.test1 import remaps_to_gufo, get_final_list, calculate_incompleteness_values
+from modules.ontcatowl.ontcatowl import run_ontcatowl
+from modules.run.classes_yaml import dump_classes_yaml
+from modules.run.results_store import ResultsStoreReader, RESULTS_STORE_FILENAME
+from modules.run.results_writer import CsvResultsWriter
+from modules.run.test1 import remaps_to_gufo, get_final_list, calculate_incompleteness_values, load_test_dataset
 from modules.tester.hash_functions import register_sha256_hash_information
 from modules.tester.logger_config import initialize_logger
+from modules.tester.utils_rdf import OverlayGraph
 
 NAMESPACE_TAXONOMY = "http://taxonomy.model/"
 
@@ -26,26 +32,60 @@ def create_percentage_results_folder(dataset_folder):
                      f"System error reported: {error}")
 
 
-def create_inconsistency_csv_output_t2(test_results_folder, percentage_number, execution_number, initial_percentage):
-    """ Creates and updates a CSV file with a list of percentages and executions that reported inconsistencies. """
+def get_sample_list_t2(input_classes_list, number_of_input_classes, dataset, percentage_number, execution_number):
+    """ Returns the random sample of input classes of an execution. The random generator is seeded with the
+        identification of the execution, so the sample does not depend on the order in which executions are performed.
+    """
+
+    execution_random = random.Random(f"{dataset}-{percentage_number}-{execution_number}")
+
+    return execution_random.sample(input_classes_list, number_of_input_classes)
+
+
+def execute_test2_unit(test_unit):
+    """ Executes OntCatOWL for one unit of Test 2, i.e., one execution of a percentage of a dataset.
+
+        The test_unit is a tuple (global_configurations, dataset, dataset_taxonomy, percentage_number, execution_number,
+        number_of_input_classes). Returns the tuple (sample_list, results), in which results is the tuple returned by
+        run_ontcatowl or None if an inconsistency was found.
+    """
+
+    global_configurations, dataset, dataset_taxonomy, percentage_number, execution_number, \
+        number_of_input_classes = test_unit
+
+    input_classes_list, input_graph, taxonomy_nodes = load_test_dataset(dataset, dataset_taxonomy)
+    sample_list = get_sample_list_t2(input_classes_list, number_of_input_classes, dataset, percentage_number,
+                                     execution_number)
+
+    working_graph = OverlayGraph(input_graph)
+    working_graph.bind("gufo", "http://purl.org/nemo/gufo#")
+
+    for input_class in sample_list:
+        triple_subject = URIRef(NAMESPACE_TAXONOMY + input_class.class_name)
+        triple_predicate = RDF.type
+        class_gufo_type = remaps_to_gufo(input_class.class_name, input_class.class_stereotype)
+        triple_object = URIRef(class_gufo_type)
+        working_graph.add((triple_subject, triple_predicate, triple_object))
+
+    try:
+        results = run_ontcatowl(global_configurations, working_graph, taxonomy_nodes)
+    except:
+        results = None
+
+    return sample_list, results
+
+
+def create_inconsistency_csv_output_t2(results_writer, test_results_folder, percentage_number, execution_number):
+    """ Writes, with the results_writer (a CsvResultsWriter), a row in the CSV file with a list of percentages and
+        executions that reported inconsistencies. """
 
     csv_header = ["percentage_test", "execution_number"]
     csv_row = [percentage_number, execution_number]
 
     inconsistencies_output_filename = f"inconsistencies_found.csv"
     inconsistencies = test_results_folder + "\\" + inconsistencies_output_filename
-    file_exists = os.path.exists(inconsistencies)
 
-    # If not file or first case (initial percentage and first execution), then create. Else, append.
-    if (not file_exists) or (percentage_number == initial_percentage and execution_number == 1):
-        with open(inconsistencies, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(csv_header)
-            writer.writerow(csv_row)
-    else:
-        with open(inconsistencies, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(csv_row)
+    results_writer.write_row(inconsistencies, csv_header, csv_row)
 
 
 def convert_ontology_dataclass_list_to_dictionary_list_t2(input_class_list, ontology_dataclass_list):
@@ -96,14 +136,23 @@ def create_classes_yaml_output_t2(input_class_list, ontology_dataclass_list, tes
             logger.error(f"Directory {yaml_folder} could not be created. Program aborted.\n"
                          f"System error reported: {error}")
 
-    classes_output_filename = f"classes_per_{percentage_number}_exec_{execution_number}.yaml"
-    classes_output_complete_path = yaml_folder + "\\" + classes_output_filename
-
     ontology_dictionary_list = convert_ontology_dataclass_list_to_dictionary_list_t2(input_class_list,
                                                                                      ontology_dataclass_list)
 
+    write_classes_yaml_file_t2(ontology_dictionary_list, test_results_folder, percentage_number, execution_number,
+                               dataset_taxonomy)
+
+
+def write_classes_yaml_file_t2(ontology_dictionary_list, test_results_folder, percentage_number, execution_number,
+                               dataset_taxonomy):
+    """ Saves the classes' information of an execution (see convert_ontology_dataclass_list_to_dictionary_list_t2) in
+        yaml format. The results folder must already exist. """
+
+    classes_output_filename = f"classes_per_{percentage_number}_exec_{execution_number}.yaml"
+    classes_output_complete_path = test_results_folder + "\\results\\" + classes_output_filename
+
     with open(classes_output_complete_path, 'w', encoding='utf-8') as file:
-        yaml.dump_all(ontology_dictionary_list, file, sort_keys=True)
+        dump_classes_yaml(ontology_dictionary_list, file)
 
     register_sha256_hash_information(classes_output_complete_path, dataset_taxonomy)
 
@@ -113,6 +162,16 @@ def create_classes_results_csv_output_t2(input_classes_list, ontology_dataclass_
     """ Create a csv file for each class, its original stereotype,
     and the list in which this stereotype is located after the execution of OntCatOWL. """
 
+    final_row_list = get_classes_results_rows_t2(input_classes_list, ontology_dataclass_list)
+
+    write_classes_results_csv_file_t2(final_row_list, test_results_folder, percentage_number, execution_number,
+                                      dataset_taxonomy)
+
+
+def get_classes_results_rows_t2(input_classes_list, ontology_dataclass_list):
+    """ Returns the rows of the classes' results csv file: for each class, its name, its original stereotype, and the
+    list in which this stereotype is located after the execution of OntCatOWL. """
+
     final_row_list = []
 
     for input_class in input_classes_list:
@@ -123,6 +182,13 @@ def create_classes_results_csv_output_t2(input_classes_list, ontology_dataclass_
         final_row = [input_class.class_name, input_class.class_stereotype, final_list]
         final_row_list.append(final_row)
 
+    return final_row_list
+
+
+def write_classes_results_csv_file_t2(final_row_list, test_results_folder, percentage_number, execution_number,
+                                      dataset_taxonomy):
+    """ Saves the classes' results rows of an execution (see get_classes_results_rows_t2) in a csv file. """
+
     csv_folder = test_results_folder + "\\results"
 
     classes_output_filename = f"results_per_{percentage_number}_exec_{execution_number}.csv"
@@ -139,31 +205,26 @@ def create_classes_results_csv_output_t2(input_classes_list, ontology_dataclass_
     register_sha256_hash_information(classes_output_complete_path, dataset_taxonomy)
 
 
-def create_times_csv_output_t2(time_register, test_results_folder, percentage_number, execution_number,
-                               initial_percentage):
-    times_output_filename = f"execution_times.csv"
-    times_output_complete_path = test_results_folder + "\\" + times_output_filename
+def get_times_row_t2(time_register, percentage_number, execution_number):
+    """ Returns the row of an execution in the times csv file, as a dictionary indexed by the csv columns. """
 
     time_register["percentage"] = percentage_number
     time_register["execution"] = execution_number
 
     items = list(time_register.items())
     items.insert(0, ("percentage", percentage_number))
-    time_register = dict(items)
 
+    return dict(items)
+
+
+def create_times_csv_output_t2(results_writer, time_register, test_results_folder, percentage_number,
+                               execution_number):
+    times_output_filename = f"execution_times.csv"
+    times_output_complete_path = test_results_folder + "\\" + times_output_filename
 
-    file_exists = os.path.exists(times_output_complete_path)
+    time_register = get_times_row_t2(time_register, percentage_number, execution_number)
 
-    # If not file or first case (initial percentage and first execution), then create. Else, append.
-    if (not file_exists) or (percentage_number == initial_percentage and execution_number == 1):
-        with open(times_output_complete_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=time_register.keys())
-            writer.writeheader()
-            writer.writerow(time_register)
-    else:
-        with open(times_output_complete_path, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=time_register.keys())
-            writer.writerow(time_register)
+    results_writer.write_row(times_output_complete_path, list(time_register.keys()), list(time_register.values()))
 
     return times_output_complete_path
 
@@ -329,27 +390,79 @@ def populate_csv_row_t2(consolidated_statistics, percentage_number, execution_nu
     return csv_row
 
 
-def create_statistics_csv_output_t2(ontology_dataclass_list, consolidated_statistics, test_results_folder,
-                                    percentage_number, execution_number, initial_percentage):
-    csv_header = create_csv_header_t2()
+def get_statistics_row_t2(ontology_dataclass_list, consolidated_statistics, percentage_number, execution_number):
+    """ Returns the row of an execution in the statistics csv file. """
+
     number_incomplete_classes = calculate_incompleteness_values(ontology_dataclass_list)
-    csv_row = populate_csv_row_t2(consolidated_statistics, percentage_number, execution_number,
-                                  number_incomplete_classes)
+
+    return populate_csv_row_t2(consolidated_statistics, percentage_number, execution_number, number_incomplete_classes)
+
+
+def create_statistics_csv_output_t2(results_writer, ontology_dataclass_list, consolidated_statistics,
+                                    test_results_folder, percentage_number, execution_number):
+    csv_header = create_csv_header_t2()
+    csv_row = get_statistics_row_t2(ontology_dataclass_list, consolidated_statistics, percentage_number,
+                                    execution_number)
 
     statistics_output_filename = f"execution_statistics.csv"
     statistics_complete_path = test_results_folder + "\\" + statistics_output_filename
 
-    file_exists = os.path.exists(statistics_complete_path)
-
-    # If not file or first case (initial percentage and first execution), then create. Else, append.
-    if (not file_exists) or (percentage_number == initial_percentage and execution_number == 1):
-        with open(statistics_complete_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(csv_header)
-            writer.writerow(csv_row)
-    else:
-        with open(statistics_complete_path, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(csv_row)
+    results_writer.write_row(statistics_complete_path, csv_header, csv_row)
 
     return statistics_complete_path
+
+
+def append_results_store_t2(results_store_writer, sample_list, input_classes_list, results, percentage_number,
+                            execution_number):
+    """ Appends the results of an execution to the results store (binary alternative to the creation of the execution's
+        yaml and csv files). """
+
+    ontology_dataclass_list, time_register, consolidated_statistics, _ = results
+
+    results_store_writer.append_execution(
+        percentage_number, execution_number,
+        convert_ontology_dataclass_list_to_dictionary_list_t2(sample_list, ontology_dataclass_list),
+        get_classes_results_rows_t2(input_classes_list, ontology_dataclass_list),
+        get_times_row_t2(time_register, percentage_number, execution_number),
+        get_statistics_row_t2(ontology_dataclass_list, consolidated_statistics, percentage_number, execution_number))
+
+
+def export_results_store_t2(test_results_folder, dataset_taxonomy):
+    """ Creates, from the results store of a dataset, the same yaml and csv files (and hash register entries) that are
+        created when the results are written directly in files.
+    """
+
+    logger = initialize_logger()
+
+    results_store_path = test_results_folder + "\\" + RESULTS_STORE_FILENAME
+    times_complete_path = test_results_folder + "\\" + "execution_times.csv"
+    statistics_complete_path = test_results_folder + "\\" + "execution_statistics.csv"
+    number_exported_executions = 0
+
+    create_percentage_results_folder(test_results_folder + "\\results")
+
+    with CsvResultsWriter() as results_writer, ResultsStoreReader(results_store_path) as results_store:
+        logger.info(f"Exporting {len(results_store.records)} executions from {results_store_path}.")
+
+        for record in results_store.records:
+            kind, percentage_number, execution_number, _ = record
+
+            if kind == "INCO":
+                create_inconsistency_csv_output_t2(results_writer, test_results_folder, percentage_number,
+                                                   execution_number)
+                continue
+
+            ontology_dictionary_list, final_row_list, times_row, statistics_row = results_store.read_execution(record)
+
+            write_classes_yaml_file_t2(ontology_dictionary_list, test_results_folder, percentage_number,
+                                       execution_number, dataset_taxonomy)
+            write_classes_results_csv_file_t2(final_row_list, test_results_folder, percentage_number,
+                                              execution_number, dataset_taxonomy)
+
+            results_writer.write_row(times_complete_path, list(times_row.keys()), list(times_row.values()))
+            results_writer.write_row(statistics_complete_path, create_csv_header_t2(), statistics_row)
+            number_exported_executions += 1
+
+    if number_exported_executions > 0:
+        register_sha256_hash_information(times_complete_path, dataset_taxonomy)
+        register_sha256_hash_information(statistics_complete_path, dataset_taxonomy)
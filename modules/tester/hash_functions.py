@@ -1,4 +1,5 @@
 """ Functions for registering hashes informations for all generated files. """
+import atexit
 import csv
 import hashlib
 import os
@@ -7,6 +8,14 @@ import pathlib
 from modules.tester.logger_config import initialize_logger
 
 HASH_FILE_LOCATION = "\\catalog\\hash_sha256_register.csv"
+HASH_REGISTER_BATCH_SIZE = 100
+
+# The hash register loaded by the current process (see load_hash_register).
+LOADED_HASH_REGISTER = {"file_path": None, "entries": None, "files_hashes": None, "pending_entries": []}
+
+# Hashes of the source files calculated by the current process, indexed by path. The values are tuples
+# (modification time, size, hash), so that the hash is calculated again if the file is modified.
+SOURCE_FILES_HASHES = {}
 
 
 def generate_sha256_hash(file_path):
@@ -48,63 +57,150 @@ def create_hash_sha256_register_file_csv():
         logger.debug(f"Hash file already exists in {hash_register_file_path}.")
 
 
-def verify_hash_register_exist(generated_file_path):
-    """ Checks if a generated file is already registered in the hash register and returns True or False.
+def generate_sha256_hash_cached(file_path):
+    """ Returns the sha256 hash of a file. The hash is calculated only once per process for each path, unless the
+    file's modification time or size changes. Used for source files, which are registered for many generated files.
+    """
+
+    file_stat = os.stat(file_path)
+    cached_hash = SOURCE_FILES_HASHES.get(file_path)
+
+    if cached_hash is None or cached_hash[0] != file_stat.st_mtime_ns or cached_hash[1] != file_stat.st_size:
+        cached_hash = (file_stat.st_mtime_ns, file_stat.st_size, generate_sha256_hash(file_path))
+        SOURCE_FILES_HASHES[file_path] = cached_hash
 
-    Hash file registers are structured in a csv with columns:
-    ["file_name", "file_hash", "source_file_name", "source_file_hash"]
-        - "file_path": path of the registered file
-        - "file_hash": sha256 hash of the registered file
-        - "file_path": path of the file from which the registered file was generated
-        - "source_file_hash": sha256 hash of the file from which the registered file was generated.
+    return cached_hash[2]
+
+
+def load_hash_register():
+    """ Returns the hash register of the current process, a dictionary with:
+        - file_path: path of the hash register file.
+        - entries: set of all registered entries, i.e., tuples (file_name, file_hash, source_file_name,
+            source_file_hash).
+        - files_hashes: set of the hashes of all registered files.
+        - pending_entries: list of entries not yet written in the hash register file (see flush_hash_register).
+
+    The hash register file is only read in the first call (or if the current working directory changes). In the first
+    call, flush_hash_register is also registered to be called at the program's exit, so that pending entries are not
+    lost if the program is aborted (e.g., with exit(1) or by an exception).
     """
 
+    logger = initialize_logger()
+
     hash_register_file_path = str(pathlib.Path().resolve()) + HASH_FILE_LOCATION
-    file_hash = generate_sha256_hash(generated_file_path)
 
-    with open(hash_register_file_path, encoding='utf-8') as csv_file:
-        csv_reader = csv.reader(csv_file, delimiter=',')
-        registered_hashes_list = []
-        for row in csv_reader:
-            registered_hashes = row[1]
-            registered_hashes_list.append(registered_hashes)
+    if LOADED_HASH_REGISTER["file_path"] != hash_register_file_path:
+        if LOADED_HASH_REGISTER["file_path"] is None:
+            atexit.register(flush_hash_register)
+        else:
+            flush_hash_register()
 
-    if file_hash in registered_hashes_list:
-        exists = True
-    else:
-        exists = False
+        if not os.path.exists(hash_register_file_path):
+            create_hash_sha256_register_file_csv()
+
+        with open(hash_register_file_path, encoding='utf-8') as csv_file:
+            csv_reader = csv.reader(csv_file, delimiter=',')
+            next(csv_reader, None)
+            register_entries = {tuple(row) for row in csv_reader}
+
+        LOADED_HASH_REGISTER["file_path"] = hash_register_file_path
+        LOADED_HASH_REGISTER["entries"] = register_entries
+        LOADED_HASH_REGISTER["files_hashes"] = {entry[1] for entry in register_entries}
+        LOADED_HASH_REGISTER["pending_entries"] = []
+
+        logger.debug(f"Hash register file {hash_register_file_path} loaded with {len(register_entries)} entries.")
+
+    return LOADED_HASH_REGISTER
+
+
+def verify_generated_files_up_to_date(generated_files_paths, source_file_path):
+    """ Returns True if all generated files exist and are registered in the hash register with their current hashes as
+    generated from the current version of the source file. Returns False otherwise, i.e., if the files must be
+    generated again. """
+
+    register_entries = load_hash_register()["entries"]
+    source_file_hash = generate_sha256_hash_cached(source_file_path)
+
+    for generated_file_path in generated_files_paths:
+        if not os.path.exists(generated_file_path):
+            return False
 
-    return exists
+        entry = (generated_file_path, generate_sha256_hash(generated_file_path), source_file_path, source_file_hash)
+        if entry not in register_entries:
+            return False
 
+    return True
 
-def write_sha256_hash_register(source_file_path, generated_file_path, hash_register_file_path):
-    """ Creates a new entry in the hash register file. """
+
+def add_hash_register_entry(entry):
+    """ Adds a new entry to the hash register. The entries are written in the hash register file in batches of
+    HASH_REGISTER_BATCH_SIZE entries and when flush_hash_register is called. """
+
+    hash_register = load_hash_register()
+
+    hash_register["entries"].add(entry)
+    hash_register["files_hashes"].add(entry[1])
+    hash_register["pending_entries"].append(entry)
+
+    if len(hash_register["pending_entries"]) >= HASH_REGISTER_BATCH_SIZE:
+        flush_hash_register()
+
+
+def flush_hash_register():
+    """ Writes all pending entries of the loaded hash register in its file. Called at the end of each run and at the
+    program's exit. """
 
     logger = initialize_logger()
 
-    generated_file_hash = generate_sha256_hash(generated_file_path)
-    source_file_hash = generate_sha256_hash(source_file_path)
-    entry = [generated_file_path, generated_file_hash, source_file_path, source_file_hash]
+    hash_register_file_path = LOADED_HASH_REGISTER["file_path"]
+    pending_entries = LOADED_HASH_REGISTER["pending_entries"]
+
+    if not pending_entries:
+        return
 
     try:
         with open(hash_register_file_path, 'a', encoding='utf-8', newline='') as f:
             writer = csv.writer(f)
-            writer.writerow(entry)
+            writer.writerows(pending_entries)
     except OSError as e:
         logger.error(
             f"Hash file could not be created in {hash_register_file_path}. Program aborted.\nSystem error reported: {e}")
         exit(1)
 
+    logger.debug(f"{len(pending_entries)} new hash entries successfully written in {hash_register_file_path}.")
+    LOADED_HASH_REGISTER["pending_entries"] = []
+
 
 def register_sha256_hash_information(generated_file_path, source_file_path):
     """ Register the hash of the generated file source for tracking purposes. """
 
     logger = initialize_logger()
 
-    hash_register_file_path = str(pathlib.Path().resolve()) + HASH_FILE_LOCATION
+    generated_file_hash = generate_sha256_hash(generated_file_path)
 
-    if verify_hash_register_exist(generated_file_path):
+    if generated_file_hash in load_hash_register()["files_hashes"]:
         logger.debug(f"File {source_file_path} already registered in hash register file.")
     else:
-        write_sha256_hash_register(source_file_path, generated_file_path, hash_register_file_path)
-        logger.debug(f"New hash entry successfully created in {hash_register_file_path}.")
+        add_hash_register_entry((generated_file_path, generated_file_hash, source_file_path,
+                                 generate_sha256_hash_cached(source_file_path)))
+        logger.debug(f"New hash entry successfully created for {generated_file_path}.")
+
+
+def register_sha256_hash_source_information(generated_file_path, source_file_path):
+    """ Register the hash of the generated file if it is not registered yet with the current hash of its source.
+
+    Used when the register is read for verifying if generated files are up to date (see
+    verify_generated_files_up_to_date). Differently from register_sha256_hash_information, a file whose content did not
+    change is registered again if its source changed.
+    """
+
+    logger = initialize_logger()
+
+    entry = (generated_file_path, generate_sha256_hash(generated_file_path), source_file_path,
+             generate_sha256_hash_cached(source_file_path))
+
+    if entry in load_hash_register()["entries"]:
+        logger.debug(f"File {generated_file_path} already registered in hash register file.")
+    else:
+        add_hash_register_entry(entry)
+        logger.debug(f"New hash entry successfully created for {generated_file_path}.")
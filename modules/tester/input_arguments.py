@@ -2,7 +2,7 @@
 
 import argparse
 
-from modules.tester.logger_config import initialize_logger
+from modules.tester.logger_config import initialize_logger, LOGGING_VERBOSITIES
 
 
 def treat_arguments(software_acronym, software_name, software_version, software_url):
@@ -30,6 +30,28 @@ def treat_arguments(software_acronym, software_name, software_version, software_
     arguments_parser.add_argument("-r", "--run", action='store_true',
                                   help="Execute the tester for the build datasets.")
 
+    arguments_parser.add_argument("-f", "--force", action='store_true',
+                                  help="Build all datasets, including the ones whose source files were not changed "
+                                       "since their last build.")
+
+    arguments_parser.add_argument("-w", "--workers", type=int, action="store", default=1,
+                                  help="Number of parallel processes used for building the datasets or for executing "
+                                       "the tests (default: 1).")
+
+    arguments_parser.add_argument("-s", "--store", action='store_true',
+                                  help="Write the results of each dataset in a single binary results store file, "
+                                       "instead of yaml and csv files.")
+
+    arguments_parser.add_argument("-e", "--export", action='store_true',
+                                  help="Create the yaml and csv results files from the datasets' results stores.")
+
+    arguments_parser.add_argument("-l", "--log-level", type=str, action="store", default="debug",
+                                  choices=list(LOGGING_VERBOSITIES.keys()),
+                                  help="Lowest level of the messages written in the log file (default: debug).")
+
+    arguments_parser.add_argument("-q", "--log-queue", action='store_true',
+                                  help="Write the log messages in a background thread.")
+
     # Automatic arguments
     arguments_parser.add_argument("-v", "--version", action="version", help="Prints the software version and exit.")
 
@@ -40,8 +62,18 @@ def treat_arguments(software_acronym, software_name, software_version, software_
     # Execute arguments parser
     arguments = arguments_parser.parse_args()
 
+    if arguments.workers < 1:
+        logger.error(f"The number of workers must be at least 1 (received {arguments.workers}). Program aborted.")
+        exit(1)
+
     global_configurations = {"build": arguments.build,
                              "run": arguments.run,
+                             "force": arguments.force,
+                             "workers": arguments.workers,
+                             "store": arguments.store,
+                             "export": arguments.export,
+                             "log_level": arguments.log_level,
+                             "log_queue": arguments.log_queue,
                              "catalog_path": arguments.catalog_path}
 
     logger.debug(f"Arguments Parsed. Obtained values are: {global_configurations}")
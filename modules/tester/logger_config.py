@@ -1,24 +1,46 @@
 """ Logging configurations. """
 
+import atexit
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 from modules.tester.utils_general import get_date_time
 
+LOGGER_NAME = "OntCatOWL Tester"
+
+# Levels of the handlers of the OntCatOWL Tester logger. The file level can be changed with set_logging_verbosity.
+LOGGING_LEVELS = {"console": logging.INFO, "file": logging.DEBUG}
+
+# Verbosities accepted by set_logging_verbosity and their levels for the log file.
+LOGGING_VERBOSITIES = {"debug": logging.DEBUG, "info": logging.INFO, "warning": logging.WARNING,
+                       "error": logging.ERROR}
+
+# State of the background log writer (see start_queue_logging).
+QUEUE_LOGGING = {"listener": None, "process_id": None}
+
+
+def update_logger_level(logger):
+    """ Sets the level of the logger to the lowest level of its handlers, so that messages that no handler would emit
+        are discarded by the logger's isEnabledFor check, before any record is created or message is formatted.
+    """
+
+    logger.setLevel(min(LOGGING_LEVELS.values()))
+
 
 def initialize_logger():
     """ Initialize OntCatOWL Tester Logger. """
 
     # Create a custom logger
-    new_logger = logging.getLogger("OntCatOWL Tester")
-    new_logger.setLevel(logging.DEBUG)
+    new_logger = logging.getLogger(LOGGER_NAME)
 
     # Creates a new logger only if OntCatOWLTester does not exist
-    if not logging.getLogger("OntCatOWL Tester").hasHandlers():
+    if not new_logger.hasHandlers():
 
         # Creating CONSOLE handler
         console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
+        console_handler.setLevel(LOGGING_LEVELS["console"])
 
         # If directory "/log" does not exist, create it
         log_dir = "logs/"
@@ -31,7 +53,7 @@ def initialize_logger():
 
         # Creating FILE handler
         file_handler = logging.FileHandler(f"{log_dir}{get_date_time()}.log")
-        file_handler.setLevel(logging.DEBUG)
+        file_handler.setLevel(LOGGING_LEVELS["file"])
 
         # Create formatters and add it to handlers
         console_format = logging.Formatter('%(levelname)s - %(message)s')
@@ -43,5 +65,77 @@ def initialize_logger():
         # Add handlers to the logger
         new_logger.addHandler(console_handler)
         new_logger.addHandler(file_handler)
+        update_logger_level(new_logger)
+
+    # A process forked while the background writer was running inherits the queue but not the writer's thread.
+    elif QUEUE_LOGGING["listener"] is not None and QUEUE_LOGGING["process_id"] != os.getpid():
+        restore_logger_handlers(new_logger)
 
     return new_logger
+
+
+def set_logging_verbosity(verbosity):
+    """ Sets the level of the log file for the whole run. The verbosity must be one of the keys of LOGGING_VERBOSITIES.
+        With a verbosity other than "debug", DEBUG messages are neither formatted nor written.
+    """
+
+    LOGGING_LEVELS["file"] = LOGGING_VERBOSITIES[verbosity]
+
+    logger = initialize_logger()
+    handlers = QUEUE_LOGGING["listener"].handlers if QUEUE_LOGGING["listener"] is not None else logger.handlers
+
+    for handler in handlers:
+        if isinstance(handler, logging.FileHandler):
+            handler.setLevel(LOGGING_LEVELS["file"])
+
+    update_logger_level(logger)
+
+
+def start_queue_logging():
+    """ Starts the background log writer: the handlers of the OntCatOWL Tester logger are moved to a thread that
+        receives the records through a queue, so that the logging calls do not wait for the console and file outputs.
+        The writer is stopped (and all pending records are written) by stop_queue_logging or at the program's exit.
+    """
+
+    logger = initialize_logger()
+
+    if QUEUE_LOGGING["listener"] is not None:
+        return
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *logger.handlers, respect_handler_level=True)
+
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+
+    QUEUE_LOGGING["listener"] = listener
+    QUEUE_LOGGING["process_id"] = os.getpid()
+    listener.start()
+    atexit.register(stop_queue_logging)
+
+
+def restore_logger_handlers(logger):
+    """ Replaces the queue handler of the logger by the handlers of the background log writer. """
+
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    for handler in QUEUE_LOGGING["listener"].handlers:
+        logger.addHandler(handler)
+
+    QUEUE_LOGGING["listener"] = None
+    QUEUE_LOGGING["process_id"] = None
+
+
+def stop_queue_logging():
+    """ Stops the background log writer (if started in this process) after all pending records are written, and
+        restores the handlers of the OntCatOWL Tester logger.
+    """
+
+    listener = QUEUE_LOGGING["listener"]
+
+    if listener is None or QUEUE_LOGGING["process_id"] != os.getpid():
+        return
+
+    listener.stop()
+    restore_logger_handlers(logging.getLogger(LOGGER_NAME))
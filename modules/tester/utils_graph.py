@@ -2,7 +2,7 @@
 from rdflib import RDFS, URIRef
 
 from modules.tester.logger_config import initialize_logger
-from modules.tester.utils_general import remove_duplicates, lists_subtraction
+from modules.tester.utils_general import lists_subtraction
 
 
 def get_superclasses(graph, all_classes, element):
@@ -76,37 +76,48 @@ def get_list_leaf_classes(graph, all_classes):
     return list_leaf_nodes
 
 
+def get_reachable_classes(graph, nodes_list, element, neighbours_functions):
+    """ Return list without repetitions of all nodes of the given graph that are reachable from the given element
+        navigating through the received neighbours_functions (get_superclasses and/or get_subclasses).
+
+        The graph is navigated with an explicit stack and a set of visited nodes, so nodes reachable through more than
+        one path are visited only once and cycles do not lead to infinite recursion.
+        The return list DOES NOT include the own element, unless it is in a cycle.
+    """
+
+    all_classes = set(nodes_list["all"])
+
+    reachable = []
+    visited = set()
+    nodes_to_visit = [element]
+
+    while nodes_to_visit:
+        node = nodes_to_visit.pop()
+        for neighbours_function in neighbours_functions:
+            for neighbour in neighbours_function(graph, all_classes, node):
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    reachable.append(neighbour)
+                    nodes_to_visit.append(neighbour)
+
+    return reachable
+
+
 def get_related_roots(graph, nodes_list, element):
     """ Return list of all roots of the given graph that are (in)directly related to the given element."""
 
-    related_roots = []
-    list_superclasses = get_superclasses(graph, nodes_list["all"], element)
-
-    for superclass in list_superclasses:
-        if superclass in nodes_list["roots"]:
-            related_roots.append(superclass)
-        else:
-            temp = get_related_roots(graph, nodes_list, superclass)
-            related_roots.extend(temp)
+    all_superclasses = get_all_superclasses(graph, nodes_list, element)
+    related_roots = [superclass for superclass in all_superclasses if superclass in nodes_list["roots"]]
 
-    related_roots = remove_duplicates(related_roots)
     return related_roots
 
 
 def get_related_leaves(graph, nodes_list, element):
     """ Return list of all leaves of the given graph that are (in)directly related to the given element."""
 
-    related_leaves = []
-    list_subclasses = get_subclasses(graph, nodes_list["all"], element)
+    all_subclasses = get_all_subclasses(graph, nodes_list, element)
+    related_leaves = [subclass for subclass in all_subclasses if subclass in nodes_list["leaves"]]
 
-    for subclass in list_subclasses:
-        if subclass in nodes_list["leaves"]:
-            related_leaves.append(subclass)
-        else:
-            temp = get_related_leaves(graph, nodes_list, subclass)
-            related_leaves.extend(temp)
-
-    related_leaves = remove_duplicates(related_leaves)
     return related_leaves
 
 
@@ -116,18 +127,9 @@ def get_all_superclasses(graph, nodes_list, element):
         Analogous to function get_all_subclasses.
     """
 
-    all_superclasses = []
-    list_superclasses = get_superclasses(graph, nodes_list["all"], element)
-
-    for superclass in list_superclasses:
-        all_superclasses.append(superclass)
-        if list_superclasses not in nodes_list["roots"]:
-            temp = get_all_superclasses(graph, nodes_list, superclass)
-            all_superclasses.extend(temp)
-
-    all_superclasses = remove_duplicates(all_superclasses)
+    all_superclasses = get_reachable_classes(graph, nodes_list, element, [get_superclasses])
 
-    return all_superclasses
+    return lists_subtraction(all_superclasses, [element])
 
 
 def get_all_subclasses(graph, nodes_list, element):
@@ -136,50 +138,21 @@ def get_all_subclasses(graph, nodes_list, element):
         Analogous to function get_all_superclasses.
     """
 
-    all_subclasses = []
-    list_subclasses = get_subclasses(graph, nodes_list["all"], element)
-
-    for subclass in list_subclasses:
-        all_subclasses.append(subclass)
-        if list_subclasses not in nodes_list["leaves"]:
-            temp = get_all_subclasses(graph, nodes_list, subclass)
-            all_subclasses.extend(temp)
-
-    all_subclasses = remove_duplicates(all_subclasses)
+    all_subclasses = get_reachable_classes(graph, nodes_list, element, [get_subclasses])
 
-    return all_subclasses
+    return lists_subtraction(all_subclasses, [element])
 
 
-def get_all_related_nodes_inc(graph, nodes_list, node, queue=None, visited=None, related=None):
-    """ Implements the BFS algorithm to return the list of all nodes of the given graph that are directly or indirectly
-    related to the given element. I.e., return all nodes that are reachable from the ontologies node (element).
+def get_all_related_nodes_inc(graph, nodes_list, node):
+    """ Return the list of all nodes of the given graph that are directly or indirectly related to the given element.
+    I.e., return all nodes that are reachable from the ontologies node (element).
 
-    The return list DOES INCLUDE the own element.
+    The return list DOES INCLUDE the own element (as its first element).
     """
 
-    if visited is None:
-        visited = []
-    if queue is None:
-        queue = []
-    if related is None:
-        related = []
-
-    visited.append(node)
-    queue.append(node)
-
-    while queue:
-        related.append(queue.pop(0))
-
-    neighbours_list = get_subclasses(graph, nodes_list["all"], node) + get_superclasses(graph, nodes_list["all"], node)
-
-    for neighbour in neighbours_list:
-        if neighbour not in visited:
-            result = get_all_related_nodes_inc(graph, nodes_list, neighbour, queue, visited, related)
-            for r in result:
-                if r not in related:
-                    related.append(r)
+    related = get_reachable_classes(graph, nodes_list, node, [get_subclasses, get_superclasses])
 
-    return related
+    return [node] + lists_subtraction(related, [node])
 
 
 def get_all_related_nodes(graph, nodes_list, node):
@@ -1,12 +1,54 @@
 """ Auxiliary functions for extending and complementing RDFLib's RDF treatment functions """
+import sys
 import time
 
 from owlrl import DeductiveClosure, RDFS_Semantics
 from rdflib import RDF, OWL, Graph
+from rdflib.paths import Path
 
 from modules.tester.logger_config import initialize_logger
 
 
+class OverlayGraph(Graph):
+    """ Copy-on-write view of a graph: a read-only base graph plus a small delta of added triples.
+
+    It is used instead of a deep copy of the base graph when only a few triples are added to it for each execution.
+    All reading functions (including SPARQL queries) consider the triples of both the base graph and the delta.
+    Added and removed triples only affect the delta, so the base graph is never modified.
+    """
+
+    def __init__(self, base_graph):
+        super().__init__()
+        self.base_graph = base_graph
+
+        for prefix, namespace in base_graph.namespaces():
+            self.bind(prefix, namespace)
+
+    def triples(self, triple):
+        """ Generator over the triples of the base graph and of the delta that match the given triple pattern. """
+
+        subj, pred, obj = triple
+
+        # Paths are evaluated by RDFLib through calls to this method with simple predicates.
+        if isinstance(pred, Path):
+            yield from super().triples(triple)
+            return
+
+        yield from self.base_graph.triples(triple)
+
+        for delta_triple in super().triples(triple):
+            if delta_triple not in self.base_graph:
+                yield delta_triple
+
+    def __len__(self):
+        """ Returns the number of triples in the base graph and in the delta. """
+
+        delta_size = sum(1 for delta_triple in super().triples((None, None, None))
+                         if delta_triple not in self.base_graph)
+
+        return len(self.base_graph) + delta_size
+
+
 def load_graph_safely(ontology_file):
     """ Safely load graph from file to working memory. """
 
@@ -78,38 +120,24 @@ def get_ontology_uri(ontology_graph):
 
 
 def get_list_of_all_classes(ontology_graph, exceptions_list=None):
-    """ Returns a list of all classes as URI strings without repetitions available in a Graph.
-    Classes that have namespaces included in the exception_list parameter are not included in the returned list. """
-
-    if exceptions_list == None:
-        exceptions_list = []
-
-    classes_list = []
-
-    for sub, pred, obj in ontology_graph:
-        if (sub, RDF.type, OWL.Class) in ontology_graph:
-            # Eliminating BNodes
-            if type(sub).__name__ != "BNode":
-                # N3 necessary for returning string and [1:-1] necessary for removing <>
-                classes_list.append(sub.n3()[1:-1])
-        if (obj, RDF.type, OWL.Class) in ontology_graph:
-            # Eliminating BNodes
-            if type(obj).__name__ != "BNode":
-                # N3 necessary for returning string and [1:-1] necessary for removing <>
-                classes_list.append(obj.n3()[1:-1])
-
-    # Removing repetitions
-    no_rep_classes_list = [*set(classes_list)]
-
-    # Removing classes that have namespace in the exceptions_list
-    classes_list = no_rep_classes_list.copy()
-    for class_uri in no_rep_classes_list:
-        for exception_item in exceptions_list:
-            if class_uri.startswith(exception_item):
-                classes_list.remove(class_uri)
-                break
-
-    return classes_list
+    """ Returns a sorted list of all classes (i.e., subjects of rdf:type owl:Class) as URI strings without repetitions
+    available in a Graph. Classes that have namespaces included in the exception_list parameter are not included in
+    the returned list. The URI strings are interned, as they are used as keys in all indexes of the classes. """
+
+    exceptions_prefixes = tuple(set(exceptions_list)) if exceptions_list else ()
+
+    classes_set = set()
+
+    for sub in ontology_graph.subjects(RDF.type, OWL.Class):
+        # Eliminating BNodes
+        if type(sub).__name__ != "BNode":
+            # N3 necessary for returning string and [1:-1] necessary for removing <>
+            class_uri = sub.n3()[1:-1]
+            # Removing classes that have namespace in the exceptions_list
+            if not class_uri.startswith(exceptions_prefixes):
+                classes_set.add(sys.intern(class_uri))
+
+    return sorted(classes_set)
 
 
 def perform_reasoning(ontology_graph):
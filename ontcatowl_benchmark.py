@@ -0,0 +1,36 @@
+""" Main module for the OntCatOWL Benchmark, which measures how OntCatOWL scales using synthetic taxonomies. """
+
+from modules.benchmark.benchmark_arguments import treat_benchmark_arguments
+from modules.benchmark.benchmark_ontcatowl import run_benchmark, save_benchmark_baseline, load_benchmark_baseline, \
+    print_benchmark_results
+from modules.benchmark.equivalence_checks import run_equivalence_checks
+from modules.tester.logger_config import initialize_logger
+
+SOFTWARE_ACRONYM = "OntCatOWL Benchmark"
+SOFTWARE_NAME = "Scaling Benchmark of the Identification of Ontological Categories for OWL Ontologies"
+SOFTWARE_VERSION = "0.22.11.25"
+SOFTWARE_URL = "https://github.com/unibz-core/OntCatOWL-Tester"
+
+if __name__ == '__main__':
+
+    logger = initialize_logger()
+
+    arguments = treat_benchmark_arguments(SOFTWARE_ACRONYM, SOFTWARE_NAME, SOFTWARE_VERSION, SOFTWARE_URL)
+
+    if arguments["check"] is not None:
+        if run_equivalence_checks(arguments["check"]) > 0:
+            logger.error("Equivalence checks failed. Program aborted.")
+            exit(1)
+        exit(0)
+
+    # The baseline is loaded before the executions, so that an invalid path is reported immediately.
+    baseline_results = None
+    if arguments["compare"] is not None:
+        baseline_results = load_benchmark_baseline(arguments["compare"])
+
+    benchmark_results = run_benchmark(arguments["families"], arguments["sizes"], arguments["measure_memory"])
+
+    print_benchmark_results(benchmark_results, baseline_results)
+
+    if arguments["output"] is not None:
+        save_benchmark_baseline(benchmark_results, arguments["output"])
@@ -1,28 +1,25 @@
 """ Main module for the OntoCatOWL-Catalog Tester. """
 import operator
+import os
 import pathlib
-import random
-from copy import deepcopy
 
-from rdflib import URIRef, RDF
-
-from modules.build.build_classes_stereotypes_information import collect_stereotypes_classes_information
+from modules.build.build_dataset import build_dataset, get_dataset_generated_files_paths
 from modules.build.build_directories_structure import get_list_unhidden_directories, \
-    create_test_directory_folders_structure, create_test_results_folder, create_internal_catalog_path
-from modules.build.build_information_classes import saves_dataset_csv_classes_data
-from modules.build.build_taxonomy_classes_information import collect_taxonomy_information
-from modules.build.build_taxonomy_files import create_taxonomy_ttl_file
-from modules.ontcatowl.ontcatowl import run_ontcatowl
-from modules.run.test1 import load_baseline_dictionary, remaps_to_gufo, create_classes_yaml_output, \
+    create_test_results_folder, create_internal_catalog_path
+from modules.run.parallel_execution import execute_test_units
+from modules.run.test1 import load_baseline_dictionary, create_classes_yaml_output, \
     create_classes_results_csv_output, create_times_csv_output, create_statistics_csv_output, create_summary_csv_output, \
-    create_inconsistency_csv_output
+    create_inconsistency_csv_output, execute_test1_unit
+from modules.run.results_store import ResultsStoreWriter, RESULTS_STORE_FILENAME
+from modules.run.results_writer import CsvResultsWriter
 from modules.run.test2 import create_inconsistency_csv_output_t2, \
     create_classes_yaml_output_t2, create_classes_results_csv_output_t2, create_times_csv_output_t2, \
-    create_statistics_csv_output_t2
-from modules.tester.hash_functions import create_hash_sha256_register_file_csv, register_sha256_hash_information
+    create_statistics_csv_output_t2, execute_test2_unit, append_results_store_t2, export_results_store_t2
+from modules.tester.hash_functions import create_hash_sha256_register_file_csv, register_sha256_hash_information, \
+    verify_generated_files_up_to_date, register_sha256_hash_source_information, flush_hash_register
 from modules.tester.input_arguments import treat_arguments
-from modules.tester.logger_config import initialize_logger
-from modules.tester.utils_rdf import load_graph_safely
+from modules.tester.logger_config import initialize_logger, set_logging_verbosity, start_queue_logging, \
+    stop_queue_logging
 
 SOFTWARE_ACRONYM = "OntCatOWL Tester"
 SOFTWARE_NAME = "Tester for the Identification of Ontological Categories for OWL Ontologies"
@@ -33,8 +30,15 @@ NAMESPACE_GUFO = "http://purl.org/nemo/gufo#"
 NAMESPACE_TAXONOMY = "http://taxonomy.model/"
 
 
-def build_ontcatowl_tester(catalog_path):
-    """ Build function for the OntoCatOWL-Catalog Tester. """
+def build_ontcatowl_tester(catalog_path, number_workers=1, force=False):
+    """ Build function for the OntoCatOWL-Catalog Tester.
+
+        The build is incremental: datasets whose source file (ontology.ttl) did not change since their files were
+        generated (according to the hash register) are skipped, unless force is True.
+
+        The builds of all datasets are independent and can be performed by number_workers parallel processes. The
+        hashes of the generated files are registered by this process only, in the order of the datasets.
+    """
 
     # DATA GENERATION FOR TESTS
 
@@ -47,34 +51,42 @@ def build_ontcatowl_tester(catalog_path):
     create_internal_catalog_path(internal_catalog_folder)
     create_hash_sha256_register_file_csv()
 
-    current = 1
-
-    for dataset in list_datasets:
-        logger.info(f"### Starting dataset {current}/{catalog_size}: {dataset} ###\n")
+    build_units = []
 
+    for current, dataset in enumerate(list_datasets, start=1):
         source_owl_file_path = catalog_path + "\\" + dataset + "\\" + "ontology.ttl"
-        dataset_folder_path = internal_catalog_folder + "\\" + dataset
+        generated_files_paths = get_dataset_generated_files_paths(internal_catalog_folder, dataset)
 
-        create_test_directory_folders_structure(dataset_folder_path, catalog_size, current)
+        if not force and verify_generated_files_up_to_date(generated_files_paths, source_owl_file_path):
+            logger.info(f"Dataset {current}/{catalog_size} skipped (source file unchanged): {dataset}")
+        else:
+            build_units.append((catalog_path, internal_catalog_folder, dataset, catalog_size, current))
 
-        # Building taxonomies files and collecting information from classes
-        create_taxonomy_ttl_file(source_owl_file_path, dataset_folder_path, catalog_size, current)
+    build_results = execute_test_units(build_dataset, build_units, number_workers, worker_initializer=None)
 
-        # Builds dataset_classes_information and collects attributes name, prefixed_name, and all taxonomic information
-        dataset_classes_information = collect_taxonomy_information(dataset, catalog_size, current)
+    list_rebuilt_datasets = []
 
-        # Collects stereotype_original and stereotype_gufo for dataset_classes_information
-        collect_stereotypes_classes_information(catalog_path, dataset_classes_information,
-                                                dataset, catalog_size, current)
+    for build_unit, generated_files_paths in zip(build_units, build_results):
+        catalog_path, internal_catalog_folder, dataset, catalog_size, current = build_unit
+        source_owl_file_path = catalog_path + "\\" + dataset + "\\" + "ontology.ttl"
 
-        saves_dataset_csv_classes_data(dataset_classes_information, dataset_folder_path, catalog_size, current,
-                                       source_owl_file_path)
+        for generated_file_path in generated_files_paths:
+            register_sha256_hash_source_information(generated_file_path, source_owl_file_path)
 
-        current += 1
+        list_rebuilt_datasets.append(dataset)
+        logger.info(f"### Dataset {current}/{catalog_size} built: {dataset} ###\n")
 
+    flush_hash_register()
+    logger.info(f"{len(list_rebuilt_datasets)} of {catalog_size} datasets rebuilt: {list_rebuilt_datasets}")
 
-def run_ontcatowl_test1(catalog_path):
-    """ Test 1 for OntCatOWL - described in: https://github.com/unibz-core/OntCatOWL-Dataset"""
+
+def run_ontcatowl_test1(catalog_path, number_workers=1):
+    """ Test 1 for OntCatOWL - described in: https://github.com/unibz-core/OntCatOWL-Dataset
+
+        The executions (units) for all input classes of all datasets are independent and can be performed by
+        number_workers parallel processes. Their results are written by this process only, in the order of a sequential
+        execution (i.e., ordered by dataset and execution_number).
+    """
     TEST_NUMBER = 1
 
     list_datasets = get_list_unhidden_directories(catalog_path)
@@ -85,12 +97,17 @@ def run_ontcatowl_test1(catalog_path):
     global_configurations = {"is_automatic": True,
                              "is_complete": True}
 
+    # Information about each tested dataset, indexed by dataset name, and list of units to be executed
+    datasets_information = {}
+    test_units = []
+    units_information = []
+
     # Creating list of dataset paths and taxonomies
     current_dataset_number = 1
     total_dataset_number = len(list_datasets)
     for dataset in list_datasets:
 
-        logger.info(f"Executing OntCatOWL for dataset {current_dataset_number}/{total_dataset_number}: {dataset}\n")
+        dataset_message = f"dataset {current_dataset_number}/{total_dataset_number}: {dataset}"
         current_dataset_number += 1
 
         tester_catalog_folder = str(pathlib.Path().resolve()) + r"\catalog"
@@ -100,7 +117,6 @@ def run_ontcatowl_test1(catalog_path):
         list_datasets_taxonomies.append(dataset_taxonomy)
 
         input_classes_list = load_baseline_dictionary(dataset)
-        input_graph = load_graph_safely(dataset_taxonomy)
 
         if global_configurations["is_automatic"]:
             l1 = "a"
@@ -115,6 +131,11 @@ def run_ontcatowl_test1(catalog_path):
         test_results_folder = dataset_folder + "\\" + test_name
         create_test_results_folder(test_results_folder)
 
+        datasets_information[dataset] = {"message": dataset_message,
+                                         "folder": dataset_folder,
+                                         "results_folder": test_results_folder,
+                                         "input_classes_list": input_classes_list}
+
         # Executions of the test
         execution_number = 1
         tests_total = len(input_classes_list)
@@ -132,43 +153,60 @@ def run_ontcatowl_test1(catalog_path):
                 execution_number += 1
                 continue
 
-            working_graph = deepcopy(input_graph)
-            triple_subject = URIRef(NAMESPACE_TAXONOMY + input_class.class_name)
-            triple_predicate = RDF.type
-            class_gufo_type = remaps_to_gufo(input_class.class_name, input_class.class_stereotype)
-            triple_object = URIRef(class_gufo_type)
-            working_graph.add((triple_subject, triple_predicate, triple_object))
-            working_graph.bind("gufo", "http://purl.org/nemo/gufo#")
+            test_units.append((global_configurations, dataset, dataset_taxonomy, input_class))
+            units_information.append((execution_number, tests_total, execution_name))
+
+            execution_number += 1
+
+    # Single writer: results are received and written in the order of the test units
+    last_dataset = None
+    units_results = execute_test_units(execute_test1_unit, test_units, number_workers)
+
+    with CsvResultsWriter() as results_writer:
+        for test_unit, unit_information, results in zip(test_units, units_information, units_results):
+            _, dataset, dataset_taxonomy, input_class = test_unit
+            execution_number, tests_total, execution_name = unit_information
+            dataset_information = datasets_information[dataset]
+            test_results_folder = dataset_information["results_folder"]
+
+            if dataset != last_dataset:
+                results_writer.close()
+                logger.info(f"Writing OntCatOWL results for {dataset_information['message']}\n")
+                last_dataset = dataset
 
             if execution_number == tests_total:
                 end = "\n"
             else:
                 end = ""
 
-            try:
-                ontology_dataclass_list, time_register, consolidated_statistics = run_ontcatowl(global_configurations,
-                                                                                                working_graph)
-            except:
+            if results is None:
                 logger.error(f"INCONSISTENCY found! Test {execution_number}/{tests_total} "
                              f"for input class {input_class.class_name} interrupted.{end}")
-                create_inconsistency_csv_output(test_results_folder, execution_number, input_class)
+                create_inconsistency_csv_output(results_writer, test_results_folder, execution_number, input_class)
             else:
+                ontology_dataclass_list, time_register, consolidated_statistics, _ = results
                 logger.info(f"Test {execution_number}/{tests_total} "
                             f"for input class {input_class.class_name} successfully executed.{end}")
                 # Creating resulting files
                 create_classes_yaml_output(input_class, ontology_dataclass_list, test_results_folder, execution_name)
-                create_classes_results_csv_output(input_classes_list, ontology_dataclass_list, dataset_folder,
-                                                  test_results_folder, execution_name)
-                create_times_csv_output(time_register, test_results_folder, execution_number, execution_name)
-                create_statistics_csv_output(ontology_dataclass_list, consolidated_statistics, test_results_folder,
-                                             execution_number)
-                create_summary_csv_output(test_results_folder, execution_number, input_class)
+                create_classes_results_csv_output(dataset_information["input_classes_list"], ontology_dataclass_list,
+                                                  dataset_information["folder"], test_results_folder, execution_name)
+                create_times_csv_output(results_writer, time_register, test_results_folder, execution_number,
+                                        execution_name)
+                create_statistics_csv_output(results_writer, ontology_dataclass_list, consolidated_statistics,
+                                             test_results_folder, execution_number)
+                create_summary_csv_output(results_writer, test_results_folder, execution_number, input_class)
 
-            execution_number += 1
 
+def run_ontcatowl_test2(catalog_path, number_workers=1, use_results_store=False):
+    """ Test 2 for OntCatOWL - described in: https://github.com/unibz-core/OntCatOWL-Dataset
+
+        The executions (units) of all datasets and percentages are independent and can be performed by number_workers
+        parallel processes. Their results are written by this process only, in the order of a sequential execution.
 
-def run_ontcatowl_test2(catalog_path):
-    """ Test 2 for OntCatOWL - described in: https://github.com/unibz-core/OntCatOWL-Dataset"""
+        If use_results_store is True, the results of each dataset are written in a single results store file (see
+        results_store.py) instead of the yaml and csv files, which can be created later by export_ontcatowl_test2.
+    """
     TEST_NUMBER = 2
 
     MINIMUM_ALLOWED_NUMBER_CLASSES = 20
@@ -190,6 +228,10 @@ def run_ontcatowl_test2(catalog_path):
     current_dataset_number = 1
     total_dataset_number = len(list_datasets)
 
+    # Information about each tested dataset, indexed by dataset name, and list of units to be executed
+    datasets_information = {}
+    test_units = []
+
     for dataset in list_datasets:
 
         tester_catalog_folder = str(pathlib.Path().resolve()) + r"\catalog"
@@ -198,7 +240,6 @@ def run_ontcatowl_test2(catalog_path):
         dataset_taxonomy = dataset_folder + "\\" + "taxonomy.ttl"
 
         input_classes_list = load_baseline_dictionary(dataset)
-        input_graph = load_graph_safely(dataset_taxonomy)
 
         if global_configurations["is_automatic"]:
             l1 = "a"
@@ -212,12 +253,12 @@ def run_ontcatowl_test2(catalog_path):
         # Executions of the test
         model_size = len(input_classes_list)
 
-        logger.info(f"Executing OntCatOWL for "
-                    f"dataset {current_dataset_number}/{total_dataset_number}: {dataset} with {model_size} classes\n")
+        dataset_message = f"dataset {current_dataset_number}/{total_dataset_number}: {dataset} with {model_size} classes"
         current_dataset_number += 1
 
         # Consider only datasets that have at least 20 classes. If less, skip.
         if model_size < MINIMUM_ALLOWED_NUMBER_CLASSES:
+            logger.info(f"Executing OntCatOWL for {dataset_message}\n")
             logger.warning(f"The dataset {dataset} has only {model_size} classes (less than 20) and was skipped.\n")
             continue
 
@@ -225,65 +266,131 @@ def run_ontcatowl_test2(catalog_path):
         test_results_folder = dataset_folder + "\\" + test_name
         create_test_results_folder(test_results_folder)
 
+        datasets_information[dataset] = {"message": dataset_message,
+                                         "taxonomy": dataset_taxonomy,
+                                         "results_folder": test_results_folder,
+                                         "input_classes_list": input_classes_list}
+
         current_percentage = PERCENTAGE_INITIAL
         while current_percentage <= PERCENTAGE_FINAL:
-
-            current_execution = 1
             number_of_input_classes = round(model_size * current_percentage / 100)
+            for current_execution in range(1, NUMBER_OF_EXECUTIONS_PER_DATASET_PER_PERCENTAGE + 1):
+                test_units.append((global_configurations, dataset, dataset_taxonomy, current_percentage,
+                                   current_execution, number_of_input_classes))
+            current_percentage += PERCENTAGE_RATE
 
-            while current_execution <= NUMBER_OF_EXECUTIONS_PER_DATASET_PER_PERCENTAGE:
+    # Single writer: results are received and written in the order of the test units
+    last_dataset = None
+    created_files = {}
+    results_store_writer = None
+    units_results = execute_test_units(execute_test2_unit, test_units, number_workers)
+
+    try:
+        with CsvResultsWriter() as results_writer:
+            for test_unit, (sample_list, results) in zip(test_units, units_results):
+                _, dataset, dataset_taxonomy, current_percentage, current_execution, number_of_input_classes = test_unit
+                dataset_information = datasets_information[dataset]
+                test_results_folder = dataset_information["results_folder"]
+
+                if dataset != last_dataset:
+                    if last_dataset is not None:
+                        results_writer.close()
+                        register_test2_dataset_hashes(created_files, datasets_information[last_dataset]["taxonomy"],
+                                                      results_store_writer)
+                    logger.info(f"Writing OntCatOWL results for {dataset_information['message']}\n")
+                    last_dataset = dataset
+                    created_files = {}
+                    if use_results_store:
+                        created_files["store"] = test_results_folder + "\\" + RESULTS_STORE_FILENAME
+                        results_store_writer = ResultsStoreWriter(created_files["store"])
 
                 if current_execution == NUMBER_OF_EXECUTIONS_PER_DATASET_PER_PERCENTAGE:
                     end = "\n"
                 else:
                     end = ""
 
-                sample_list = random.sample(input_classes_list, number_of_input_classes)
-
-                working_graph = deepcopy(input_graph)
-                working_graph.bind("gufo", "http://purl.org/nemo/gufo#")
-
-                for input_class in sample_list:
-                    triple_subject = URIRef(NAMESPACE_TAXONOMY + input_class.class_name)
-                    triple_predicate = RDF.type
-                    class_gufo_type = remaps_to_gufo(input_class.class_name, input_class.class_stereotype)
-                    triple_object = URIRef(class_gufo_type)
-                    working_graph.add((triple_subject, triple_predicate, triple_object))
-
-                try:
-                    ontology_dataclass_list, time_register, consolidated_statistics = run_ontcatowl(
-                        global_configurations,
-                        working_graph)
-                except:
+                if results is None:
                     logger.error(f"INCONSISTENCY found in: dataset {dataset} - "
                                  f"percentage {current_percentage} - excecution {current_execution}. "
                                  f"Current execution interrupted.{end}")
-                    create_inconsistency_csv_output_t2(test_results_folder, current_percentage, current_execution,
-                                                       PERCENTAGE_INITIAL)
+                    if use_results_store:
+                        results_store_writer.append_inconsistency(current_percentage, current_execution)
+                    else:
+                        create_inconsistency_csv_output_t2(results_writer, test_results_folder, current_percentage,
+                                                           current_execution)
+                elif use_results_store:
+                    logger.info(f"Test dataset {dataset} - percentage {current_percentage} - "
+                                f"excecution {current_execution} successfully executed "
+                                f"({number_of_input_classes} input classes).{end}")
+                    append_results_store_t2(results_store_writer, sample_list,
+                                            dataset_information["input_classes_list"], results, current_percentage,
+                                            current_execution)
                 else:
+                    ontology_dataclass_list, time_register, consolidated_statistics, _ = results
                     logger.info(f"Test dataset {dataset} - percentage {current_percentage} - "
                                 f"excecution {current_execution} successfully executed "
                                 f"({number_of_input_classes} input classes).{end}")
                     # Creating resulting files
                     create_classes_yaml_output_t2(sample_list, ontology_dataclass_list, test_results_folder,
                                                   current_percentage, current_execution, dataset_taxonomy)
-                    create_classes_results_csv_output_t2(input_classes_list, ontology_dataclass_list,
-                                                         test_results_folder, current_percentage, current_execution,
-                                                         dataset_taxonomy)
-                    times_file_name = create_times_csv_output_t2(time_register, test_results_folder, current_percentage,
-                                                                 current_execution, PERCENTAGE_INITIAL)
+                    create_classes_results_csv_output_t2(dataset_information["input_classes_list"],
+                                                         ontology_dataclass_list, test_results_folder,
+                                                         current_percentage, current_execution, dataset_taxonomy)
+                    created_files["times"] = create_times_csv_output_t2(results_writer, time_register,
+                                                                        test_results_folder, current_percentage,
+                                                                        current_execution)
 
-                    statistics_file_name = create_statistics_csv_output_t2(ontology_dataclass_list,
-                                                                           consolidated_statistics,
-                                                                           test_results_folder,
-                                                                           current_percentage, current_execution,
-                                                                           PERCENTAGE_INITIAL)
+                    created_files["statistics"] = create_statistics_csv_output_t2(results_writer,
+                                                                                  ontology_dataclass_list,
+                                                                                  consolidated_statistics,
+                                                                                  test_results_folder,
+                                                                                  current_percentage, current_execution)
+    finally:
+        # The results store of the current dataset is closed (flushing its buffered records) even if a unit fails.
+        if results_store_writer is not None:
+            results_store_writer.close()
 
-                current_execution += 1
+    if last_dataset is not None:
+        register_test2_dataset_hashes(created_files, datasets_information[last_dataset]["taxonomy"],
+                                      results_store_writer)
 
-            current_percentage += PERCENTAGE_RATE
-        register_sha256_hash_information(times_file_name, dataset_taxonomy)
-        register_sha256_hash_information(statistics_file_name, dataset_taxonomy)
+    flush_hash_register()
+
+
+def register_test2_dataset_hashes(created_files, dataset_taxonomy, results_store_writer=None):
+    """ Registers the hashes of the times, statistics and results store files of a dataset after all its executions are
+        written. The results_store_writer of the dataset (if any) is closed before its file's hash is calculated.
+    """
+
+    if results_store_writer is not None:
+        results_store_writer.close()
+
+    for file_type in ["times", "statistics", "store"]:
+        if file_type in created_files:
+            register_sha256_hash_information(created_files[file_type], dataset_taxonomy)
+
+
+def export_ontcatowl_test2(catalog_path):
+    """ Creates the yaml and csv files of Test 2 from the results stores written by run_ontcatowl_test2 (executed with
+        use_results_store=True) for the datasets of the catalog. Datasets without a results store are skipped.
+    """
+
+    list_datasets = get_list_unhidden_directories(catalog_path)
+    list_datasets.sort()
+
+    tester_catalog_folder = str(pathlib.Path().resolve()) + r"\catalog"
+
+    for dataset in list_datasets:
+        dataset_folder = tester_catalog_folder + "\\" + dataset
+        test_results_folder = dataset_folder + "\\" + "test_2_ac"
+
+        if not os.path.exists(test_results_folder + "\\" + RESULTS_STORE_FILENAME):
+            logger.info(f"Dataset {dataset} has no results store to be exported.")
+            continue
+
+        export_results_store_t2(test_results_folder, dataset_folder + "\\" + "taxonomy.ttl")
+
+    flush_hash_register()
 
 
 if __name__ == '__main__':
@@ -292,18 +399,27 @@ if __name__ == '__main__':
 
     arguments = treat_arguments(SOFTWARE_ACRONYM, SOFTWARE_NAME, SOFTWARE_VERSION, SOFTWARE_URL)
 
+    set_logging_verbosity(arguments["log_level"])
+    if arguments["log_queue"]:
+        start_queue_logging()
+
     # Execute in BUILD mode.
     if arguments["build"]:
-        build_ontcatowl_tester(arguments["catalog_path"])
+        build_ontcatowl_tester(arguments["catalog_path"], arguments["workers"], arguments["force"])
 
     # Execute in RUN mode.
     if arguments["run"]:
-        # run_ontcatowl_test1(arguments["catalog_path"])
-        run_ontcatowl_test2(arguments["catalog_path"])
+        # run_ontcatowl_test1(arguments["catalog_path"], arguments["workers"])
+        run_ontcatowl_test2(arguments["catalog_path"], arguments["workers"], arguments["store"])
+
+    # Execute in EXPORT mode.
+    if arguments["export"]:
+        export_ontcatowl_test2(arguments["catalog_path"])
+
+    stop_queue_logging()
 
 # TODO (@pedropaulofb): VERIFY
 # Are there any classes with more than one stereotype?
 # Try to clean garbage classes for creating better statistics
 # The following datasets don't have any taxonomy and were removed by hand:
 # - chartered-service, experiment2013, gailly2016value, pereira2020ontotrans, zhou2017hazard-ontology-robotic-strolling, zhou2017hazard-ontology-train-control
-# van-ee2021modular - RecursionError: maximum recursion depth exceeded while calling a Python object